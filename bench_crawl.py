@@ -0,0 +1,293 @@
+"""
+Crawl throughput benchmark against a local stand-in of the financials endpoint.
+
+    python bench_crawl.py --symbols 200 --concurrency 1 4 16
+    python bench_crawl.py --latency-ms 300 --error-rate 0.05 --forbidden-rate 0.1
+    python bench_crawl.py --output after.json --baseline before.json
+
+The stand-in serves perplexityEternalPrettyPrint.txt (relabelled per symbol)
+with the configured latency and error mix. For each concurrency level a
+fresh NSEFinancialScraper fetches every symbol through fetch_company_data
+and merges the results, then saves once, in a scratch directory. Results
+(symbols/sec, per-symbol latency percentiles, mean curl phase times, CPU,
+RSS, server status counts) are printed and written as JSON so runs can be compared.
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PAYLOAD = os.path.join(HERE, "perplexityEternalPrettyPrint.txt")
+SAMPLE_SYMBOL = "ETERNAL.NS"
+ENDPOINT = "/rest/finance/financials/"
+
+
+class StandInServer:
+    """
+    Local HTTP server mimicking the financials endpoint
+    """
+    def __init__(self, payload_file=SAMPLE_PAYLOAD, latency_ms=150.0, jitter_ms=50.0,
+                 error_rate=0.0, not_found_rate=0.0, forbidden_rate=0.0, seed=0):
+        with open(payload_file, encoding='utf-8') as f:
+            # Compact once; each response only swaps the symbol in
+            self.template = json.dumps(json.load(f), separators=(',', ':'))
+        self.latency = latency_ms / 1000.0
+        self.jitter = jitter_ms / 1000.0
+        self.error_rate = error_rate
+        self.not_found_rate = not_found_rate
+        self.forbidden_rate = forbidden_rate
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.statuses = {}
+        self.bytes_sent = 0
+        self.httpd = None
+
+    def _outcome(self):
+        with self.lock:
+            roll = self.random.random()
+            delay = max(0.0, self.random.gauss(self.latency, self.jitter))
+        if roll < self.error_rate:
+            return 500, delay
+        roll -= self.error_rate
+        if roll < self.not_found_rate:
+            return 404, delay
+        roll -= self.not_found_rate
+        if roll < self.forbidden_rate:
+            return 403, delay
+        return 200, delay
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                path = self.path.split('?', 1)[0]
+                if not path.startswith(ENDPOINT):
+                    status, delay, symbol = 404, 0.0, None
+                else:
+                    symbol = path[len(ENDPOINT):]
+                    status, delay = server._outcome()
+                time.sleep(delay)
+                body = server.template.replace(SAMPLE_SYMBOL, symbol).encode() if status == 200 else b'{}'
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+                with server.lock:
+                    server.statuses[status] = server.statuses.get(status, 0) + 1
+                    server.bytes_sent += len(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), self._handler())
+        self.httpd.daemon_threads = True
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def snapshot(self):
+        with self.lock:
+            return dict(self.statuses), self.bytes_sent
+
+    def stop(self):
+        if self.httpd is not None:
+            self.httpd.shutdown()
+            self.httpd.server_close()
+
+
+def _rss_mb():
+    """
+    Current and peak resident set size of this process in MB
+    """
+    current = peak = float('nan')
+    try:
+        with open('/proc/self/statm') as f:
+            current = int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 1e6
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        # ru_maxrss is KiB on Linux, bytes on macOS
+        scale = 1 if sys.platform == 'darwin' else 1024
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * scale / 1e6
+    return current, peak
+
+
+def run_level(base_url, symbols, concurrency, server):
+    """
+    Crawl `symbols` with `concurrency` workers in the current directory
+    """
+    from perplexity_scrapper_final import NSEFinancialScraper
+    from http_timing import PHASES
+
+    scraper = NSEFinancialScraper(universe='all', base_url=base_url)
+    merge_lock = threading.Lock()
+
+    def work(symbol):
+        start = time.perf_counter()
+        data = scraper.fetch_company_data(symbol)
+        elapsed = time.perf_counter() - start
+        if data is not None:
+            # The store is not thread-safe; fetches overlap, merges don't
+            with merge_lock:
+                scraper.update_master_data(data)
+        return elapsed, data is not None
+
+    statuses_before, bytes_before = server.snapshot()
+    cpu_before = os.times()
+    start = time.perf_counter()
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            results = list(pool.map(work, symbols))
+        crawl_seconds = time.perf_counter() - start
+        save_start = time.perf_counter()
+        scraper.save_master_data(export=True)
+        save_seconds = time.perf_counter() - save_start
+    cpu_after = os.times()
+    statuses_after, bytes_after = server.snapshot()
+
+    latencies = np.array([r[0] for r in results]) * 1000.0
+    succeeded = sum(1 for r in results if r[1])
+    cpu = (cpu_after.user - cpu_before.user) + (cpu_after.system - cpu_before.system)
+    rss, peak_rss = _rss_mb()
+    phases = scraper.timings.summary()
+    return {
+        'concurrency': concurrency,
+        'symbols': len(symbols),
+        'succeeded': succeeded,
+        'failed': len(symbols) - succeeded,
+        'crawl_seconds': round(crawl_seconds, 4),
+        'save_seconds': round(save_seconds, 4),
+        'symbols_per_sec': round(succeeded / crawl_seconds, 3) if crawl_seconds else None,
+        'latency_ms': {
+            'mean': round(float(latencies.mean()), 2),
+            'p50': round(float(np.percentile(latencies, 50)), 2),
+            'p95': round(float(np.percentile(latencies, 95)), 2),
+            'p99': round(float(np.percentile(latencies, 99)), 2),
+            'max': round(float(latencies.max()), 2),
+        },
+        'cpu_seconds': round(cpu, 3),
+        'cpu_percent': round(100.0 * cpu / (crawl_seconds + save_seconds), 1),
+        'rss_mb': round(rss, 1),
+        'peak_rss_mb': round(peak_rss, 1),
+        'phase_mean_ms': {phase: phases.loc['all', f'{phase}_mean_ms'].item()
+                          for phase in PHASES} if not phases.empty else {},
+        'server_statuses': {str(k): statuses_after.get(k, 0) - statuses_before.get(k, 0)
+                            for k in sorted(statuses_after)},
+        'server_bytes': bytes_after - bytes_before,
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=HERE,
+                              capture_output=True, text=True, timeout=5).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def compare(results, baseline_file):
+    with open(baseline_file, encoding='utf-8') as f:
+        baseline = {r['concurrency']: r for r in json.load(f)['results']}
+    print(f"\nAgainst {baseline_file}:")
+    for result in results:
+        old = baseline.get(result['concurrency'])
+        if not old or not old['symbols_per_sec'] or not result['symbols_per_sec']:
+            continue
+        speed = result['symbols_per_sec'] / old['symbols_per_sec'] - 1
+        p95 = result['latency_ms']['p95'] / old['latency_ms']['p95'] - 1
+        print(f"  concurrency {result['concurrency']:>3}: symbols/sec {speed:+.1%}, p95 latency {p95:+.1%}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark crawl throughput against a local stand-in')
+    parser.add_argument('--symbols', type=int, default=100, help='symbols per concurrency level')
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 4, 16])
+    parser.add_argument('--latency-ms', type=float, default=150.0)
+    parser.add_argument('--jitter-ms', type=float, default=50.0)
+    parser.add_argument('--error-rate', type=float, default=0.0, help='share of 500 responses')
+    parser.add_argument('--not-found-rate', type=float, default=0.0, help='share of 404 responses')
+    parser.add_argument('--forbidden-rate', type=float, default=0.0, help='share of 403 responses')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_crawl.json')
+    parser.add_argument('--baseline', help='earlier --output file to compare against')
+    parser.add_argument('--keep', action='store_true', help='keep the scratch directories')
+    args = parser.parse_args(argv)
+    if args.baseline and not os.path.exists(args.baseline):
+        parser.error(f"baseline {args.baseline} not found")
+
+    output = os.path.abspath(args.output)
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+    symbols = [f"BENCH{i:05d}.NS" for i in range(args.symbols)]
+    server = StandInServer(latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                           error_rate=args.error_rate, not_found_rate=args.not_found_rate,
+                           forbidden_rate=args.forbidden_rate, seed=args.seed)
+    base_url = server.start()
+    scratch = tempfile.mkdtemp(prefix='bench_crawl_')
+    cwd = os.getcwd()
+    print(f"Stand-in at {base_url}, scratch dir {scratch}")
+    print(f"{'conc':>5} {'sym/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'cpu %':>6} {'rss MB':>7} {'save s':>7} {'ok':>5}")
+
+    results = []
+    try:
+        for concurrency in args.concurrency:
+            workdir = os.path.join(scratch, f"c{concurrency}")
+            os.makedirs(workdir)
+            os.chdir(workdir)
+            try:
+                result = run_level(base_url, symbols, concurrency, server)
+            finally:
+                os.chdir(cwd)
+            results.append(result)
+            latency = result['latency_ms']
+            print(f"{concurrency:>5} {result['symbols_per_sec'] or 0:>8.2f} {latency['p50']:>8.1f} "
+                  f"{latency['p95']:>8.1f} {latency['p99']:>8.1f} {result['cpu_percent']:>6.1f} "
+                  f"{result['rss_mb']:>7.1f} {result['save_seconds']:>7.2f} {result['succeeded']:>5}")
+    finally:
+        server.stop()
+        if not args.keep:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    report = {
+        'benchmark': 'crawl',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {k: v for k, v in vars(args).items() if k not in ('output', 'baseline', 'keep')},
+        'results': results,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {output}")
+
+    if baseline:
+        compare(results, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
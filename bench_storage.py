@@ -0,0 +1,249 @@
+"""
+Micro-benchmarks for normalization, merging and persistence at scale.
+
+    python bench_storage.py                      # 100, 1000 and 5000 companies
+    python bench_storage.py --sizes 200 2000 --years 10 --quarters 8 --fields 60
+    python bench_storage.py --output after.json --baseline before.json
+
+Payloads are synthetic but shaped like perplexityEternalPrettyPrint.txt:
+same sections, statement types and fields, with values scattered around the
+sample's. For each size, in a scratch directory, the suite times
+  normalize   quarterly_frame + _process_company_data for every payload
+  merge       update_master_data for every company, as fetch_all_companies does
+  checkpoint  the save_master_data() calls fetch_all_companies makes every
+              `--checkpoint-every` companies
+  save        the final save_master_data(export=True)
+Per-company merge and checkpoint times for the first and last tenth of the
+run show whether cost grows with the size of the store.
+"""
+import argparse
+import contextlib
+import copy
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from bench_crawl import SAMPLE_PAYLOAD, git_commit
+
+# Descriptive fields rewritten for every synthetic record
+LABEL_FIELDS = {'date', 'symbol', 'reportedCurrency', 'cik', 'fillingDate', 'acceptedDate',
+                'calendarYear', 'period', 'link', 'finalLink'}
+
+
+class PayloadGenerator:
+    """
+    Synthetic financials payloads with the sample's structure.
+
+    `years` annual and `quarters` quarterly records per statement; `fields`
+    caps the numeric fields per statement (extra synthetic fields are added
+    when it exceeds the sample's). Every company gets its own seeded values.
+    """
+    def __init__(self, template_file=SAMPLE_PAYLOAD, years=4, quarters=4, fields=None, seed=0):
+        with open(template_file, encoding='utf-8') as f:
+            sample = json.load(f)
+        self.years = years
+        self.quarters = quarters
+        self.seed = seed
+        self.sections = {}
+        for section in ('annual', 'quarter'):
+            statements = []
+            for statement in sample.get(section) or []:
+                records = statement.get('data') or []
+                template = dict(records[0]) if records else None
+                if template is not None and fields is not None:
+                    numeric = [k for k in template if k not in LABEL_FIELDS]
+                    for extra in numeric[fields:]:
+                        del template[extra]
+                    for i in range(len(numeric), fields):
+                        template[f"extraMetric{i}"] = 10 ** 9
+                statements.append((statement.get('type', ''), template))
+            self.sections[section] = statements
+
+    def _dates(self, section):
+        if section == 'annual':
+            return [pd.Timestamp(2025 - i, 3, 31) for i in range(self.years)][::-1]
+        return list(pd.date_range(end='2025-06-30', periods=self.quarters, freq='QE'))
+
+    def payload(self, symbol, index=0):
+        rng = np.random.default_rng([self.seed, index])
+        payload = {}
+        for section, statements in self.sections.items():
+            dates = self._dates(section)
+            out = []
+            for statement_type, template in statements:
+                records = []
+                if template is not None:
+                    for date in dates:
+                        record = copy.copy(template)
+                        record['symbol'] = symbol
+                        record['date'] = date.strftime('%Y-%m-%d')
+                        if 'calendarYear' in record:
+                            record['calendarYear'] = str(date.year - 1 if date.month <= 3 else date.year)
+                        if 'period' in record:
+                            record['period'] = 'FY' if section == 'annual' else f"Q{(date.month - 4) % 12 // 3 + 1}"
+                        for key, value in record.items():
+                            if key in LABEL_FIELDS or isinstance(value, bool):
+                                continue
+                            if isinstance(value, int):
+                                record[key] = int(value * rng.lognormal(0.0, 0.5))
+                            elif isinstance(value, float):
+                                record[key] = float(value * rng.lognormal(0.0, 0.5))
+                        records.append(record)
+                out.append({'type': statement_type, 'data': records})
+            payload[section] = out
+        return payload
+
+
+def _timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def run_size(generator, size, checkpoint_every):
+    """
+    Normalize, merge and persist `size` companies in the current directory
+    """
+    from perplexity_scrapper_final import NSEFinancialScraper
+    from ttm import quarterly_frame
+
+    symbols = [f"SYN{i:05d}.NS" for i in range(size)]
+    payloads = [generator.payload(s, i) for i, s in enumerate(symbols)]
+    scraper = NSEFinancialScraper(universe='all')
+
+    normalize = 0.0
+    frames = []
+    for symbol, payload in zip(symbols, payloads):
+        start = time.perf_counter()
+        scraper.ttm.put(symbol, quarterly_frame(payload, symbol))
+        frames.append(scraper._process_company_data(payload, symbol))
+        normalize += time.perf_counter() - start
+    del payloads
+
+    merge_times = []
+    checkpoint_times = []
+    for i, frame in enumerate(frames, 1):
+        elapsed, _ = _timed(scraper.update_master_data, frame)
+        merge_times.append(elapsed)
+        if i % checkpoint_every == 0:
+            elapsed, _ = _timed(scraper.save_master_data)
+            checkpoint_times.append(elapsed)
+    rows = sum(len(f) for f in frames)
+    del frames
+
+    save, _ = _timed(scraper.save_master_data, True)
+
+    merge_times = np.array(merge_times) * 1000.0
+    tenth = max(1, len(merge_times) // 10)
+    checkpoint_times = np.array(checkpoint_times) * 1000.0
+    ctenth = max(1, len(checkpoint_times) // 10)
+    return {
+        'companies': size,
+        'rows': rows,
+        'columns': len(scraper.store.columns),
+        'normalize_seconds': round(normalize, 4),
+        'merge_seconds': round(float(merge_times.sum()) / 1000.0, 4),
+        'checkpoint_seconds': round(float(checkpoint_times.sum()) / 1000.0, 4),
+        'save_seconds': round(save, 4),
+        'normalize_ms_per_company': round(normalize * 1000.0 / size, 3),
+        'merge_ms_first_tenth': round(float(merge_times[:tenth].mean()), 3),
+        'merge_ms_last_tenth': round(float(merge_times[-tenth:].mean()), 3),
+        'checkpoint_ms_first_tenth': round(float(checkpoint_times[:ctenth].mean()), 3)
+        if len(checkpoint_times) else None,
+        'checkpoint_ms_last_tenth': round(float(checkpoint_times[-ctenth:].mean()), 3)
+        if len(checkpoint_times) else None,
+    }
+
+
+STAGES = ['normalize_seconds', 'merge_seconds', 'checkpoint_seconds', 'save_seconds']
+
+
+def compare(results, baseline_file):
+    with open(baseline_file, encoding='utf-8') as f:
+        baseline = {r['companies']: r for r in json.load(f)['results']}
+    print(f"\nAgainst {baseline_file}:")
+    for result in results:
+        old = baseline.get(result['companies'])
+        if not old:
+            continue
+        changes = [f"{stage.split('_')[0]} {result[stage] / old[stage] - 1:+.1%}"
+                   for stage in STAGES if old.get(stage)]
+        print(f"  {result['companies']:>6} companies: " + ", ".join(changes))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark normalization, merging and persistence')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000])
+    parser.add_argument('--years', type=int, default=4)
+    parser.add_argument('--quarters', type=int, default=4)
+    parser.add_argument('--fields', type=int, default=None,
+                        help='numeric fields per statement (default: as in the sample)')
+    parser.add_argument('--checkpoint-every', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='bench_storage.json')
+    parser.add_argument('--baseline', help='earlier --output file to compare against')
+    parser.add_argument('--keep', action='store_true', help='keep the scratch directories')
+    args = parser.parse_args(argv)
+    if args.baseline and not os.path.exists(args.baseline):
+        parser.error(f"baseline {args.baseline} not found")
+
+    output = os.path.abspath(args.output)
+    baseline = os.path.abspath(args.baseline) if args.baseline else None
+    generator = PayloadGenerator(years=args.years, quarters=args.quarters, fields=args.fields,
+                                 seed=args.seed)
+    scratch = tempfile.mkdtemp(prefix='bench_storage_')
+    cwd = os.getcwd()
+    print(f"Scratch dir {scratch}")
+    print(f"{'companies':>9} {'normalize s':>11} {'merge s':>8} {'ckpt s':>8} {'save s':>7} "
+          f"{'merge ms first/last 10%':>24} {'ckpt ms first/last 10%':>23}")
+
+    results = []
+    try:
+        for size in args.sizes:
+            workdir = os.path.join(scratch, f"n{size}")
+            os.makedirs(workdir)
+            os.chdir(workdir)
+            try:
+                with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                    result = run_size(generator, size, args.checkpoint_every)
+            finally:
+                os.chdir(cwd)
+            results.append(result)
+            ckpt = (f"{result['checkpoint_ms_first_tenth']:.1f} / {result['checkpoint_ms_last_tenth']:.1f}"
+                    if result['checkpoint_ms_first_tenth'] is not None else '-')
+            print(f"{size:>9} {result['normalize_seconds']:>11.2f} {result['merge_seconds']:>8.2f} "
+                  f"{result['checkpoint_seconds']:>8.2f} {result['save_seconds']:>7.2f} "
+                  f"{result['merge_ms_first_tenth']:>11.1f} / {result['merge_ms_last_tenth']:<10.1f} "
+                  f"{ckpt:>23}")
+    finally:
+        if not args.keep:
+            shutil.rmtree(scratch, ignore_errors=True)
+
+    report = {
+        'benchmark': 'storage',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'parameters': {k: v for k, v in vars(args).items() if k not in ('output', 'baseline', 'keep')},
+        'results': results,
+    }
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\n✓ Results written to {output}")
+
+    if baseline:
+        compare(results, baseline)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+import pandas as pd
+import numpy as np
+import os
+from datetime import datetime
+from financial_history import diff_mask
+
+KEY_COLUMNS = ['symbol', 'period', 'date']
+FEED_COLUMNS = KEY_COLUMNS + ['kind', 'metric', 'old', 'new', 'fetched_at']
+
+
+def _keyed(df):
+    df = df.copy()
+    if 'period' not in df.columns:
+        df['period'] = ''
+    df['period'] = df['period'].fillna('').astype(str)
+    df['date'] = pd.to_datetime(df['date']).dt.strftime('%Y-%m-%d')
+    df = df.set_index(KEY_COLUMNS)
+    return df[~df.index.duplicated(keep='last')]
+
+
+def compute_changes(old, new, fetched_at=None):
+    """
+    Field-level differences between a company's stored rows and a new fetch.
+
+    Rows present on only one side are reported once, as 'added' or
+    'removed' with metric '*'; rows on both sides produce one 'changed'
+    entry per differing cell. The comparison is one vectorized mask per
+    company.
+    """
+    if fetched_at is None:
+        fetched_at = datetime.now().isoformat(timespec='seconds')
+
+    new = _keyed(new)
+    old = _keyed(old) if old is not None and not old.empty else new.iloc[0:0]
+
+    parts = []
+    added = new.index.difference(old.index)
+    removed = old.index.difference(new.index)
+    for index, kind in ((added, 'added'), (removed, 'removed')):
+        if len(index):
+            rows = index.to_frame(index=False)
+            rows['kind'] = kind
+            rows['metric'] = '*'
+            parts.append(rows)
+
+    common = new.index.intersection(old.index)
+    if len(common):
+        columns = new.columns.union(old.columns, sort=False)
+        before = old.reindex(index=common, columns=columns)
+        after = new.reindex(index=common, columns=columns)
+        changed = diff_mask(before, after).to_numpy()
+        rows, cols = np.nonzero(changed)
+        if len(rows):
+            cells = common[rows].to_frame(index=False)
+            cells['kind'] = 'changed'
+            cells['metric'] = columns[cols]
+            cells['old'] = before.to_numpy()[rows, cols]
+            cells['new'] = after.to_numpy()[rows, cols]
+            parts.append(cells)
+
+    if not parts:
+        return pd.DataFrame(columns=FEED_COLUMNS)
+    changes = pd.concat(parts, ignore_index=True)
+    changes['fetched_at'] = fetched_at
+    return changes.reindex(columns=FEED_COLUMNS)
+
+
+class ChangeFeed:
+    """
+    Append-only CSV of field-level changes between crawls
+    """
+    def __init__(self, feed_file="NSE_FINANCIALS_CHANGES.csv"):
+        self.feed_file = feed_file
+
+    def append(self, changes):
+        if changes is None or changes.empty:
+            return 0
+        write_header = not os.path.exists(self.feed_file)
+        changes.to_csv(self.feed_file, mode='a', header=write_header, index=False)
+        return len(changes)
+
+    def read(self, since=None):
+        """
+        Changes recorded after `since` (all of them if None)
+        """
+        if not os.path.exists(self.feed_file):
+            return pd.DataFrame(columns=FEED_COLUMNS)
+        feed = pd.read_csv(self.feed_file, dtype={'old': str, 'new': str, 'period': str})
+        if since is not None:
+            feed = feed[pd.to_datetime(feed['fetched_at']) > pd.Timestamp(since)]
+        return feed
+
+    def changed_symbols(self, since=None):
+        return self.read(since)['symbol'].drop_duplicates().tolist()
@@ -0,0 +1,208 @@
+import signal
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+# Refresh-plan entries use overdue days as priority; on-demand work goes first
+ON_DEMAND_PRIORITY = 1e12
+NEVER_FETCHED_PRIORITY = 1e9
+
+
+class WorkQueue:
+    """
+    Persistent priority queue of symbols to fetch, stored in SQLite so that
+    other processes can add work and nothing is lost across restarts
+    """
+    def __init__(self, path="NSE_WORK_QUEUE.sqlite"):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None,
+                                    check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS jobs (
+                symbol TEXT PRIMARY KEY,
+                priority REAL NOT NULL,
+                source TEXT NOT NULL,
+                enqueued_at TEXT NOT NULL,
+                not_before REAL NOT NULL DEFAULT 0,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                running INTEGER NOT NULL DEFAULT 0
+            )""")
+        self.conn.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (running, priority DESC)")
+        self.lock = threading.Lock()
+
+    def push(self, symbol, priority=0.0, source='plan'):
+        """
+        Add a symbol, or raise the priority of one already queued
+        """
+        with self.lock:
+            self.conn.execute("""
+                INSERT INTO jobs (symbol, priority, source, enqueued_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(symbol) DO UPDATE SET
+                    priority = MAX(priority, excluded.priority),
+                    source = CASE WHEN excluded.priority > priority
+                                  THEN excluded.source ELSE source END
+                """, (symbol, priority, source, datetime.now().isoformat(timespec='seconds')))
+
+    def claim(self):
+        """
+        Mark the highest-priority ready job as running and return its symbol
+        """
+        with self.lock:
+            self.conn.execute("BEGIN IMMEDIATE")
+            try:
+                row = self.conn.execute("""
+                    SELECT symbol FROM jobs
+                    WHERE running = 0 AND not_before <= ?
+                    ORDER BY priority DESC, enqueued_at LIMIT 1
+                    """, (time.time(),)).fetchone()
+                if row:
+                    self.conn.execute("UPDATE jobs SET running = 1 WHERE symbol = ?", row)
+                self.conn.execute("COMMIT")
+            except Exception:
+                self.conn.execute("ROLLBACK")
+                raise
+        return row[0] if row else None
+
+    def done(self, symbol):
+        with self.lock:
+            self.conn.execute("DELETE FROM jobs WHERE symbol = ?", (symbol,))
+
+    def retry(self, symbol, delay, max_attempts=5):
+        """
+        Put a failed job back with a delay; drop it after max_attempts
+        """
+        with self.lock:
+            self.conn.execute("""
+                UPDATE jobs SET running = 0, attempts = attempts + 1, not_before = ?
+                WHERE symbol = ?""", (time.time() + delay, symbol))
+            self.conn.execute("DELETE FROM jobs WHERE symbol = ? AND attempts >= ?",
+                              (symbol, max_attempts))
+
+    def release(self, symbol):
+        """
+        Return a claimed job untouched (used on shutdown)
+        """
+        with self.lock:
+            self.conn.execute("UPDATE jobs SET running = 0 WHERE symbol = ?", (symbol,))
+
+    def recover(self):
+        """
+        Requeue jobs left running by a process that died
+        """
+        with self.lock:
+            return self.conn.execute("UPDATE jobs SET running = 0 WHERE running = 1").rowcount
+
+    def __len__(self):
+        return self.conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+
+class CrawlDaemon:
+    """
+    Runs NSEFinancialScraper continuously: enqueues the refresh plan at
+    intervals, takes work from the queue at the rate limiter's pace and
+    checkpoints the store incrementally. SIGTERM/SIGINT stop it after the
+    in-flight request finishes, then state is flushed.
+    """
+    def __init__(self, scraper, queue=None, plan_interval=6 * 3600, checkpoint_interval=300,
+                 idle_poll=30, retry_delay=900):
+        self.scraper = scraper
+        self.scraper.fetch_method = 'daemon'
+        self.queue = queue if queue is not None else WorkQueue()
+        self.plan_interval = plan_interval
+        self.checkpoint_interval = checkpoint_interval
+        self.idle_poll = idle_poll
+        self.retry_delay = retry_delay
+        self.stop_event = threading.Event()
+        self.next_plan = 0.0
+        self.last_checkpoint = time.monotonic()
+        self.fetched = 0
+        self.failed = 0
+
+    def stop(self, *_):
+        if not self.stop_event.is_set():
+            print("\nShutdown requested; finishing in-flight work...")
+        self.stop_event.set()
+
+    def _install_signal_handlers(self):
+        try:
+            signal.signal(signal.SIGTERM, self.stop)
+            signal.signal(signal.SIGINT, self.stop)
+        except ValueError:
+            # Not the main thread; the owner calls stop() instead
+            pass
+
+    def enqueue(self, symbols, priority=ON_DEMAND_PRIORITY, source='on-demand'):
+        for symbol in self.scraper.aliases.canonical(symbols):
+            self.queue.push(symbol, priority, source)
+
+    def enqueue_plan(self):
+        plan = self.scraper.plan_refresh()
+        plan = plan[~plan['symbol'].map(self.scraper.missing.is_missing)]
+        priorities = plan['overdue_days'].clip(upper=NEVER_FETCHED_PRIORITY)
+        for symbol, priority in zip(plan['symbol'], priorities):
+            self.queue.push(symbol, float(priority), 'plan')
+        print(f"[{datetime.now():%H:%M:%S}] Planned {len(plan)} companies, "
+              f"{len(self.queue)} queued")
+        self.next_plan = time.monotonic() + self.plan_interval
+
+    def checkpoint(self):
+        self.scraper.save_master_data()
+        self.last_checkpoint = time.monotonic()
+
+    def process(self, symbol):
+        # The symbol may have been renamed since it was queued
+        current = self.scraper.aliases.resolve(symbol)
+        print(f"[{datetime.now():%H:%M:%S}] Fetching {current}...", end=" ")
+        company_data = self.scraper.fetch_company_data(current)
+        self.scraper.planner.mark_checked(current)
+
+        if company_data is not None:
+            self.scraper.update_master_data(company_data)
+            self.queue.done(symbol)
+            self.fetched += 1
+            print(f"✓ ({len(company_data)} years)")
+        elif self.scraper.missing.is_missing(current):
+            self.queue.done(symbol)
+            print("✗ (not found)")
+        else:
+            self.queue.retry(symbol, self.retry_delay)
+            self.failed += 1
+            print("✗ (will retry)")
+
+    def run(self):
+        self._install_signal_handlers()
+        recovered = self.queue.recover()
+        if recovered:
+            print(f"Recovered {recovered} interrupted jobs")
+        self.scraper.load_existing_data()
+
+        try:
+            while not self.stop_event.is_set():
+                if time.monotonic() >= self.next_plan:
+                    self.enqueue_plan()
+
+                symbol = self.queue.claim()
+                self.scraper.metrics.queue_depth.set(len(self.queue), queue='daemon')
+                if symbol is None:
+                    self.stop_event.wait(self.idle_poll)
+                    continue
+
+                if not self.scraper.limiter.wait(self.stop_event):
+                    self.queue.release(symbol)
+                    break
+
+                self.process(symbol)
+
+                if time.monotonic() - self.last_checkpoint >= self.checkpoint_interval:
+                    self.checkpoint()
+        finally:
+            self.checkpoint()
+            self.queue.close()
+            print(f"Daemon stopped: {self.fetched} fetched, {self.failed} failed")
@@ -0,0 +1,128 @@
+import pandas as pd
+import numpy as np
+import os
+
+# FX tables are local CSV files with columns date,currency,rate, where rate
+# is the value of one unit of `currency` in BASE_CURRENCY on that date, e.g.
+#   2025-03-31,USD,85.47
+# Several files can be combined; later rows win for the same (currency, date).
+BASE_CURRENCY = 'INR'
+
+UNITS = {
+    'units': 1.0,
+    'thousands': 1e3,
+    'lakhs': 1e5,
+    'millions': 1e6,
+    'crores': 1e7,
+    'billions': 1e9,
+}
+
+# Columns that are not amounts of money
+NON_MONETARY_COLUMNS = {'symbol', 'date', 'reportedCurrency', 'cik', 'fillingDate', 'acceptedDate',
+                        'calendarYear', 'period', 'weightedAverageShsOut', 'weightedAverageShsOutDil'}
+
+# Amounts per share: converted between currencies but never unit-scaled
+PER_SHARE_COLUMNS = {'eps', 'epsdiluted'}
+
+
+def monetary_columns(df):
+    """
+    Numeric columns holding amounts of money
+    """
+    return [c for c in df.columns
+            if c not in NON_MONETARY_COLUMNS and c not in PER_SHARE_COLUMNS
+            and not c.lower().endswith('ratio') and pd.api.types.is_numeric_dtype(df[c])]
+
+
+class CurrencyNormalizer:
+    """
+    Converts whole metric columns to one currency and unit at once.
+
+    A factor is looked up per distinct (currency, date) pair of the frame,
+    using the latest rate on or before the date, and cached, so repeated
+    conversions of the same data are a dictionary read plus one broadcast
+    multiply per column block. A currency with no rates at all raises
+    ValueError rather than turning its amounts into NaN.
+    """
+    def __init__(self, rate_files=("fx_rates.csv",), target='INR', unit='units'):
+        if unit not in UNITS:
+            raise ValueError(f"Unknown unit '{unit}' (choose from {', '.join(UNITS)})")
+        self.target = target.upper()
+        self.unit = unit
+        self.rate_files = [rate_files] if isinstance(rate_files, str) else list(rate_files)
+        self.rates = {}
+        self.cache = {}
+        self.load(self.rate_files)
+
+    def load(self, rate_files):
+        frames = [pd.read_csv(path, parse_dates=['date']) for path in rate_files if os.path.exists(path)]
+        if not frames:
+            return
+        table = pd.concat(frames, ignore_index=True)
+        table['currency'] = table['currency'].str.upper()
+        table = table.drop_duplicates(['currency', 'date'], keep='last').sort_values(['currency', 'date'])
+        for currency, rows in table.groupby('currency', sort=False):
+            self.rates[currency] = (rows['date'].to_numpy(dtype='datetime64[ns]'),
+                                    rows['rate'].to_numpy(dtype=np.float64))
+        self.cache = {}
+
+    def _rates(self, currency, dates):
+        """
+        Value of one unit of `currency` in BASE_CURRENCY on each date
+        """
+        if currency == BASE_CURRENCY:
+            return np.ones(len(dates))
+        if currency not in self.rates:
+            raise ValueError(f"No FX rates for {currency} in {', '.join(self.rate_files)}")
+        known_dates, known_rates = self.rates[currency]
+        position = np.searchsorted(known_dates, dates, side='right') - 1
+        rates = known_rates[np.maximum(position, 0)]
+        return np.where(position >= 0, rates, np.nan)
+
+    def factors(self, currencies, dates):
+        """
+        Multiplier from each row's currency to the target currency
+        """
+        dates = pd.to_datetime(pd.Series(dates)).to_numpy(dtype='datetime64[ns]')
+        currencies = pd.Series(currencies).fillna(BASE_CURRENCY).astype(str).str.upper().to_numpy()
+        keys = pd.MultiIndex.from_arrays([currencies, dates])
+        codes, pairs = pd.factorize(keys)
+
+        missing = [pair for pair in pairs if pair not in self.cache]
+        if missing:
+            needed = pd.MultiIndex.from_tuples(missing)
+            wanted = needed.get_level_values(0).to_numpy()
+            when = needed.get_level_values(1).to_numpy(dtype='datetime64[ns]')
+            target = self._rates(self.target, when)
+            for currency in np.unique(wanted):
+                rows = np.flatnonzero(wanted == currency)
+                values = self._rates(currency, when[rows]) / target[rows]
+                for pair, value in zip(needed[rows], values):
+                    self.cache[pair] = value
+
+        per_pair = np.array([self.cache[pair] for pair in pairs], dtype=np.float64)
+        return per_pair[codes]
+
+    def normalize(self, df, columns=None):
+        """
+        Copy of df with monetary columns in the target currency and unit
+        """
+        if df.empty:
+            return df.copy()
+        columns = monetary_columns(df) if columns is None else list(columns)
+        currencies = df['reportedCurrency'] if 'reportedCurrency' in df.columns \
+            else pd.Series(BASE_CURRENCY, index=df.index)
+        factor = self.factors(currencies.to_numpy(), df['date'].to_numpy())
+
+        per_share = [c for c in df.columns if c in PER_SHARE_COLUMNS]
+        scale = np.ones(len(columns) + len(per_share))
+        scale[:len(columns)] = 1.0 / UNITS[self.unit]
+        block = df[columns + per_share].to_numpy(dtype=np.float64) * factor[:, None] * scale
+        converted = pd.DataFrame(block, index=df.index, columns=columns + per_share)
+
+        out = pd.concat([df.drop(columns=columns + per_share), converted], axis=1)[list(df.columns)]
+        if 'reportedCurrency' in out.columns:
+            out['reportedCurrency'] = self.target
+        if self.unit != 'units':
+            out['unit'] = self.unit
+        return out
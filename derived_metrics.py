@@ -0,0 +1,302 @@
+import pandas as pd
+import numpy as np
+import os
+
+from external_merge import concat_runs, split_by_symbol
+
+# Formula library. Each entry names an output column and how to compute it:
+#   ratio      numerator / denominator (each a list of fields; '-field' subtracts)
+#   ratio_avg  numerator / average of the denominator this year and last year
+#   growth     year-over-year change of `input` over `periods` years
+#   cagr       compound annual growth of `input` over `periods` years
+# Rows are annual and sorted by (symbol, date), so "last year" is the
+# previous row of the same symbol.
+FORMULAS = [
+    {'name': 'revenueGrowth', 'kind': 'growth', 'input': 'revenue', 'periods': 1},
+    {'name': 'netIncomeGrowth', 'kind': 'growth', 'input': 'netIncome', 'periods': 1},
+    {'name': 'epsGrowth', 'kind': 'growth', 'input': 'eps', 'periods': 1},
+    {'name': 'ebitdaGrowth', 'kind': 'growth', 'input': 'ebitda', 'periods': 1},
+    {'name': 'revenueCAGR3Y', 'kind': 'cagr', 'input': 'revenue', 'periods': 3},
+    {'name': 'netIncomeCAGR3Y', 'kind': 'cagr', 'input': 'netIncome', 'periods': 3},
+    {'name': 'grossMargin', 'kind': 'ratio', 'numerator': ['grossProfit'], 'denominator': ['revenue']},
+    {'name': 'ebitdaMargin', 'kind': 'ratio', 'numerator': ['ebitda'], 'denominator': ['revenue']},
+    {'name': 'operatingMargin', 'kind': 'ratio', 'numerator': ['operatingIncome'], 'denominator': ['revenue']},
+    {'name': 'netMargin', 'kind': 'ratio', 'numerator': ['netIncome'], 'denominator': ['revenue']},
+    {'name': 'freeCashFlowMargin', 'kind': 'ratio', 'numerator': ['freeCashFlow'], 'denominator': ['revenue']},
+    {'name': 'roe', 'kind': 'ratio_avg', 'numerator': ['netIncome'], 'denominator': ['totalStockholdersEquity']},
+    {'name': 'roa', 'kind': 'ratio_avg', 'numerator': ['netIncome'], 'denominator': ['totalAssets']},
+    {'name': 'roce', 'kind': 'ratio', 'numerator': ['operatingIncome'],
+     'denominator': ['totalAssets', '-totalCurrentLiabilities']},
+    {'name': 'assetTurnover', 'kind': 'ratio_avg', 'numerator': ['revenue'], 'denominator': ['totalAssets']},
+    {'name': 'debtToEquity', 'kind': 'ratio', 'numerator': ['totalDebt'], 'denominator': ['totalStockholdersEquity']},
+    {'name': 'netDebtToEbitda', 'kind': 'ratio', 'numerator': ['netDebt'], 'denominator': ['ebitda']},
+    {'name': 'currentRatio', 'kind': 'ratio', 'numerator': ['totalCurrentAssets'],
+     'denominator': ['totalCurrentLiabilities']},
+    {'name': 'interestCoverage', 'kind': 'ratio', 'numerator': ['operatingIncome'], 'denominator': ['interestExpense']},
+]
+
+
+def formula_inputs(formula):
+    """
+    Raw fields a formula reads
+    """
+    if 'input' in formula:
+        return [formula['input']]
+    return [f.lstrip('-') for f in formula['numerator'] + formula['denominator']]
+
+
+def _terms(values, fields):
+    """
+    Signed sum of columns; NaN if any term is missing
+    """
+    total = None
+    for field in fields:
+        sign = -1.0 if field.startswith('-') else 1.0
+        column = values[field.lstrip('-')] * sign
+        total = column if total is None else total + column
+    return total
+
+
+def _safe_divide(numerator, denominator):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        result = numerator / denominator
+    return result.where(denominator != 0)
+
+
+def compute_derived(df, formulas=FORMULAS):
+    """
+    Evaluate every formula for all companies at once.
+
+    df must be sorted by (symbol, date) with one row per fiscal year, as the
+    master store produces it. Lagged values come from one grouped shift per
+    lag, not from a loop over companies.
+    """
+    needed = sorted({f for formula in formulas for f in formula_inputs(formula)})
+    values = df.reindex(columns=needed).apply(pd.to_numeric, errors='coerce')
+
+    # Lag n of every input column within each symbol, computed once per n
+    groups = values.groupby(df['symbol'].to_numpy(), sort=False)
+    lags = {}
+
+    def lagged(n):
+        if n not in lags:
+            lags[n] = groups.shift(n)
+        return lags[n]
+
+    out = {}
+    for formula in formulas:
+        kind = formula['kind']
+        if kind == 'ratio':
+            result = _safe_divide(_terms(values, formula['numerator']),
+                                  _terms(values, formula['denominator']))
+        elif kind == 'ratio_avg':
+            current = _terms(values, formula['denominator'])
+            previous = _terms(lagged(1), formula['denominator'])
+            result = _safe_divide(_terms(values, formula['numerator']), (current + previous) / 2)
+        elif kind == 'growth':
+            current = values[formula['input']]
+            previous = lagged(formula.get('periods', 1))[formula['input']]
+            # Divide by |previous| so growth from a loss to a smaller loss is positive
+            result = _safe_divide(current - previous, previous.abs())
+        elif kind == 'cagr':
+            n = formula['periods']
+            current = values[formula['input']]
+            previous = lagged(n)[formula['input']]
+            valid = (current > 0) & (previous > 0)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                result = (current / previous) ** (1.0 / n) - 1
+            result = result.where(valid)
+        else:
+            raise ValueError(f"Unknown formula kind '{kind}' for {formula['name']}")
+        out[formula['name']] = result.to_numpy(dtype=np.float64)
+
+    derived = pd.DataFrame(out, index=df.index)
+    derived.insert(0, 'date', df['date'].to_numpy())
+    derived.insert(0, 'symbol', df['symbol'].to_numpy())
+    return derived
+
+
+def write_derived(df, path="NSE_ALL_COMPANIES_DERIVED.csv", formulas=FORMULAS):
+    """
+    Compute the formula library and save it next to the raw master file
+    """
+    derived = compute_derived(df, formulas)
+    derived.to_csv(path, index=False, date_format='%Y-%m-%d')
+    return derived
+
+
+def with_derived(frame, derived):
+    """
+    Raw rows with derived metrics joined on (symbol, date)
+    """
+    derived = derived.copy()
+    derived['date'] = pd.to_datetime(derived['date'])
+    frame = frame.copy()
+    frame['date'] = pd.to_datetime(frame['date'])
+    extra = [c for c in derived.columns if c not in frame.columns]
+    return frame.merge(derived[['symbol', 'date'] + extra], on=['symbol', 'date'], how='left')
+
+
+class DerivedMetricCache:
+    """
+    Derived metrics cached per symbol, recomputed only where inputs changed.
+
+    Each formula depends on the raw fields it reads. A change-feed entry for
+    a field marks just the formulas using it as stale for that symbol; an
+    added or removed row marks all of them. refresh() then recomputes the
+    stale (symbol, metric) pairs in vectorized batches.
+
+    With in_memory=False (out-of-core mode) results are kept as one CSV per
+    symbol next to the cache file, written after every batch and read back
+    when needed; save() streams them into the combined file.
+    """
+    def __init__(self, cache_file="NSE_ALL_COMPANIES_DERIVED.csv", formulas=FORMULAS, in_memory=True):
+        self.cache_file = cache_file
+        self.partition_dir = os.path.splitext(cache_file)[0]
+        self.in_memory = in_memory
+        self.formulas = formulas
+        self.names = [f['name'] for f in formulas]
+        self.dependents = {}
+        for formula in formulas:
+            for field in formula_inputs(formula):
+                self.dependents.setdefault(field, set()).add(formula['name'])
+        # Every symbol in memory mode; only unwritten ones out of core
+        self.partitions = {}
+        self.symbols = set()
+        self.removed = set()
+        self.stale = {}
+
+    def _path(self, symbol):
+        return os.path.join(self.partition_dir, f"{symbol}.csv")
+
+    def _get(self, symbol):
+        if symbol in self.partitions:
+            return self.partitions[symbol]
+        if symbol in self.symbols:
+            return pd.read_csv(self._path(symbol), parse_dates=['date'])
+        return None
+
+    def load(self, symbols=()):
+        """
+        Load cached results; symbols without them are marked fully stale
+        """
+        self.partitions = {}
+        self.symbols = set()
+        self.removed = set()
+        columns = ['symbol', 'date'] + self.names
+        if not self.in_memory and os.path.isdir(self.partition_dir):
+            self.symbols = {n[:-len('.csv')] for n in os.listdir(self.partition_dir) if n.endswith('.csv')}
+        elif not self.in_memory and os.path.exists(self.cache_file):
+            # Split the combined cache into partitions without reading it whole
+            os.makedirs(self.partition_dir, exist_ok=True)
+            chunks = pd.read_csv(self.cache_file, parse_dates=['date'], chunksize=50000)
+            for symbol, rows in split_by_symbol(chunks):
+                rows = rows.reindex(columns=columns)
+                if symbol in self.symbols:
+                    rows = pd.concat([self._get(symbol), rows], ignore_index=True)
+                rows.to_csv(self._path(symbol), index=False, date_format='%Y-%m-%d')
+                self.symbols.add(symbol)
+        elif os.path.exists(self.cache_file):
+            cached = pd.read_csv(self.cache_file, parse_dates=['date'])
+            cached = cached.reindex(columns=columns)
+            for symbol, rows in cached.groupby('symbol', sort=False):
+                self.partitions[symbol] = rows.reset_index(drop=True)
+            self.symbols = set(self.partitions)
+        for symbol in symbols:
+            if symbol not in self.symbols:
+                self.stale[symbol] = set(self.names)
+
+    def invalidate(self, symbol, changes=None):
+        """
+        Mark the formulas affected by a company's change-feed entries as stale
+        """
+        if changes is None or symbol not in self.symbols:
+            affected = set(self.names)
+        elif (changes['kind'] != 'changed').any():
+            affected = set(self.names)
+        else:
+            affected = set()
+            for field in changes['metric'].unique():
+                affected |= self.dependents.get(field, set())
+        if affected:
+            self.stale.setdefault(symbol, set()).update(affected)
+
+    def drop(self, symbol):
+        if symbol in self.symbols and not self.in_memory:
+            self.removed.add(symbol)
+        self.partitions.pop(symbol, None)
+        self.symbols.discard(symbol)
+        self.stale.pop(symbol, None)
+
+    def refresh(self, store, batch_size=1000):
+        """
+        Recompute stale metrics from the store's partitions, `batch_size`
+        companies at a time so an out-of-core store is never read in whole;
+        returns the number of symbols recomputed
+        """
+        for symbol in [s for s in self.stale if s not in store]:
+            self.drop(symbol)
+        stale = sorted(self.stale)
+        for i in range(0, len(stale), batch_size):
+            self._refresh_batch(store, stale[i:i + batch_size])
+            if not self.in_memory:
+                self._write_partitions()
+        self.stale = {}
+        return len(stale)
+
+    def _refresh_batch(self, store, symbols):
+        everything = set(self.names)
+        full = {}
+        partial = {}
+        for symbol in symbols:
+            metrics = self.stale[symbol]
+            rows = store.get(symbol)
+            cached = self._get(symbol)
+            # Column updates are only safe while the company's rows are unchanged
+            if metrics >= everything or cached is None or len(cached) != len(rows):
+                full[symbol] = rows
+            else:
+                self.partitions[symbol] = cached
+                partial[symbol] = rows
+
+        if full:
+            fresh = compute_derived(pd.concat(full.values(), ignore_index=True), self.formulas)
+            fresh['date'] = pd.to_datetime(fresh['date'])
+            for symbol, result in fresh.groupby('symbol', sort=False):
+                self.partitions[symbol] = result.reset_index(drop=True)
+                self.symbols.add(symbol)
+
+        if partial:
+            metrics = set().union(*(self.stale[s] for s in partial))
+            formulas = [f for f in self.formulas if f['name'] in metrics]
+            fresh = compute_derived(pd.concat(partial.values(), ignore_index=True), formulas)
+            for symbol, result in fresh.groupby('symbol', sort=False):
+                columns = sorted(self.stale[symbol])
+                self.partitions[symbol][columns] = result[columns].to_numpy()
+
+    def _write_partitions(self):
+        os.makedirs(self.partition_dir, exist_ok=True)
+        for symbol, rows in self.partitions.items():
+            rows.to_csv(self._path(symbol), index=False, date_format='%Y-%m-%d')
+        self.partitions = {}
+        for symbol in self.removed:
+            if os.path.exists(self._path(symbol)):
+                os.remove(self._path(symbol))
+        self.removed = set()
+
+    def frame(self, symbols=None):
+        symbols = sorted(self.symbols) if symbols is None else symbols
+        parts = [self._get(s) for s in symbols if s in self.symbols]
+        if not parts:
+            return pd.DataFrame(columns=['symbol', 'date'] + self.names)
+        return pd.concat(parts, ignore_index=True)
+
+    def save(self):
+        if self.in_memory:
+            self.frame().to_csv(self.cache_file, index=False, date_format='%Y-%m-%d')
+            return
+        self._write_partitions()
+        if self.symbols:
+            concat_runs([self._path(s) for s in sorted(self.symbols)], self.cache_file)
+        else:
+            self.frame().to_csv(self.cache_file, index=False)
@@ -0,0 +1,115 @@
+import csv
+import heapq
+import os
+import tempfile
+
+import pandas as pd
+
+
+def _read_header(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return next(csv.reader(f), [])
+
+
+def _union_header(paths):
+    header = []
+    seen = set()
+    for path in paths:
+        for column in _read_header(path):
+            if column not in seen:
+                seen.add(column)
+                header.append(column)
+    return header
+
+
+def _rows(path, key):
+    """
+    Stream (sort key, row) pairs from one sorted CSV run
+    """
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            yield tuple(row.get(k, '') for k in key), row
+
+
+def _merge_pass(paths, out_path, header, key):
+    streams = [_rows(path, key) for path in paths]
+    with open(out_path, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.DictWriter(out, fieldnames=header, restval='', lineterminator='\n')
+        writer.writeheader()
+        for _, row in heapq.merge(*streams, key=lambda item: item[0]):
+            writer.writerow(row)
+
+
+def merge_sorted_runs(paths, out_path, key=('symbol', 'date'), fan_in=64):
+    """
+    K-way merge of CSV runs that are each sorted by `key` into one sorted CSV.
+
+    Only one row per open run is held in memory. When there are more runs
+    than `fan_in`, they are merged in groups into temporary runs first, so
+    the number of open files stays bounded as well.
+    """
+    paths = list(paths)
+    header = _union_header(paths)
+    temp_dir = None
+    temporary = []
+
+    try:
+        while len(paths) > fan_in:
+            if temp_dir is None:
+                temp_dir = tempfile.mkdtemp(prefix='merge_', dir=os.path.dirname(out_path) or '.')
+            merged = []
+            for i in range(0, len(paths), fan_in):
+                run = os.path.join(temp_dir, f"run_{len(temporary)}.csv")
+                _merge_pass(paths[i:i + fan_in], run, header, key)
+                temporary.append(run)
+                merged.append(run)
+            paths = merged
+
+        _merge_pass(paths, out_path, header, key)
+    finally:
+        for run in temporary:
+            if os.path.exists(run):
+                os.remove(run)
+        if temp_dir is not None:
+            os.rmdir(temp_dir)
+
+    return header
+
+
+def concat_runs(paths, out_path, header=None):
+    """
+    Append CSV files (e.g. one per symbol, in symbol order) into one CSV
+    under the union of their headers, streaming one row at a time
+    """
+    paths = list(paths)
+    header = header or _union_header(paths)
+    with open(out_path, 'w', newline='', encoding='utf-8') as out:
+        writer = csv.DictWriter(out, fieldnames=header, restval='', lineterminator='\n')
+        writer.writeheader()
+        for path in paths:
+            with open(path, newline='', encoding='utf-8') as f:
+                writer.writerows(csv.DictReader(f))
+    return header
+
+
+def split_by_symbol(chunks, column='symbol'):
+    """
+    Regroup chunks of a table sorted by `column` into one frame per value.
+
+    Only the last value of a chunk can continue into the next one, so at
+    most one chunk plus one group is held in memory.
+    """
+    carry = None
+    for chunk in chunks:
+        if carry is not None:
+            chunk = pd.concat([carry, chunk], ignore_index=True)
+        if chunk.empty:
+            continue
+        last = chunk[column].iloc[-1]
+        done = chunk[chunk[column] != last]
+        carry = chunk[chunk[column] == last]
+        for value, rows in done.groupby(column, sort=False, observed=True):
+            yield value, rows.reset_index(drop=True)
+    if carry is not None and not carry.empty:
+        yield carry[column].iloc[0], carry.reset_index(drop=True)
+
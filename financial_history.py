@@ -0,0 +1,152 @@
+import pandas as pd
+import numpy as np
+import os
+from datetime import datetime
+
+# A row version is identified by these columns; everything else is a field
+KEY_COLUMNS = ['symbol', 'period', 'date']
+DELTA_COLUMNS = KEY_COLUMNS + ['field', 'value', 'fetched_at']
+
+
+def diff_mask(old, new):
+    """
+    Return a boolean frame marking cells that differ between two aligned frames.
+    Numbers are compared numerically and everything else as text, so values
+    read back from CSV compare equal to the ones that came from the API.
+    """
+    # One flat numpy pass instead of per-column pandas conversions
+    old_values = old.to_numpy(dtype=object)
+    new_values = new.to_numpy(dtype=object)
+    old_null = pd.isna(old_values)
+    new_null = pd.isna(new_values)
+
+    def numeric(values):
+        flat = pd.to_numeric(pd.Series(values.ravel()), errors='coerce')
+        return flat.to_numpy(dtype=np.float64, na_value=np.nan).reshape(values.shape)
+
+    old_num = numeric(old_values)
+    new_num = numeric(new_values)
+    both_num = ~np.isnan(old_num) & ~np.isnan(new_num)
+
+    # pandas' CSV parser can be one ulp off the shortest repr written out
+    num_diff = both_num & ~np.isclose(old_num, new_num, rtol=1e-12, atol=0.0)
+    text = ~old_null & ~new_null & ~both_num
+    text_diff = text & (old_values.astype(str) != new_values.astype(str))
+
+    mask = (old_null != new_null) | num_diff | text_diff
+    return pd.DataFrame(mask, index=new.index, columns=new.columns)
+
+
+class FinancialHistory:
+    def __init__(self, history_file="NSE_FINANCIALS_HISTORY.csv"):
+        self.history_file = history_file
+
+    def _key_frame(self, df):
+        """
+        Index a wide company frame by (symbol, period, date)
+        """
+        df = df.copy()
+        if 'period' not in df.columns:
+            df['period'] = ''
+        df['period'] = df['period'].fillna('').astype(str)
+        df['date'] = df['date'].astype(str)
+        return df.set_index(KEY_COLUMNS)
+
+    def load_deltas(self):
+        """
+        Load the delta log, or an empty one if nothing was recorded yet
+        """
+        if os.path.exists(self.history_file):
+            return pd.read_csv(self.history_file, dtype=str, keep_default_na=False,
+                               na_values=[''])
+        return pd.DataFrame(columns=DELTA_COLUMNS)
+
+    def record(self, new_data, fetched_at=None, previous=None):
+        """
+        Append the cells of new_data that differ from `previous`, the
+        symbol's currently stored rows (None or empty when it has none).
+        Only changed values are written, so unchanged refreshes cost nothing,
+        and the cost depends on this company alone, never on the log's size.
+        """
+        if new_data is None or new_data.empty:
+            return 0
+
+        if fetched_at is None:
+            fetched_at = datetime.now().isoformat(timespec='seconds')
+
+        new = self._key_frame(new_data)
+        new = new[~new.index.duplicated(keep='last')]
+
+        latest = self._key_frame(previous) if previous is not None and not previous.empty else None
+
+        if latest is None:
+            old = pd.DataFrame(index=new.index, columns=new.columns, dtype=object)
+        else:
+            columns = new.columns.union(latest.columns, sort=False)
+            old = latest.reindex(index=new.index, columns=columns)
+            new = new.reindex(columns=columns)
+
+        changed = diff_mask(old, new)
+        if not changed.values.any():
+            return 0
+
+        # One delta row per changed cell; a NaN value means the field was cleared
+        rows, cols = np.nonzero(changed.values)
+        deltas = new.index[rows].to_frame(index=False)
+        deltas['field'] = new.columns[cols]
+        deltas['value'] = new.values[rows, cols]
+        deltas['fetched_at'] = fetched_at
+
+        write_header = not os.path.exists(self.history_file)
+        deltas.to_csv(self.history_file, mode='a', header=write_header, index=False)
+        return len(deltas)
+
+    def as_of(self, when=None, columns=None):
+        """
+        Reconstruct the wide dataset as it was known at time `when`
+        (None means the latest version of every row). Fields that were
+        never set have no deltas, so pass the stored column set as
+        `columns` to get them back as empty columns.
+        """
+        leading = ['date', 'symbol', 'period']
+        empty = pd.DataFrame(columns=leading + [c for c in columns or [] if c not in leading])
+        deltas = self.load_deltas()
+        if deltas.empty:
+            return empty
+
+        if when is not None:
+            stamps = pd.to_datetime(deltas['fetched_at'])
+            deltas = deltas[stamps <= pd.Timestamp(when)]
+            if deltas.empty:
+                return empty
+
+        # The log is append-only, so the last delta per cell is the one in force
+        deltas = deltas.drop_duplicates(KEY_COLUMNS + ['field'], keep='last')
+        wide = deltas.pivot(index=KEY_COLUMNS, columns='field', values='value')
+        wide = wide.dropna(how='all')
+        wide.columns.name = None
+
+        converted = {}
+        for column in wide.columns:
+            numeric = pd.to_numeric(wide[column], errors='coerce')
+            if numeric.notna().sum() == wide[column].notna().sum():
+                converted[column] = numeric
+            else:
+                converted[column] = wide[column]
+
+        wide = pd.DataFrame(converted, index=wide.index).reset_index()
+        wide['period'] = wide['period'].fillna('')
+        if columns is not None:
+            # Stored order first, then fields the store no longer has
+            known = set(columns)
+            wide = wide.reindex(columns=list(columns) + [c for c in wide.columns if c not in known])
+        wide = wide[leading + [c for c in wide.columns if c not in leading]]
+        return wide.sort_values(['symbol', 'date'], ignore_index=True)
+
+    def versions(self, symbol):
+        """
+        List the fetch timestamps at which a symbol's data changed
+        """
+        deltas = self.load_deltas()
+        stamps = deltas.loc[deltas['symbol'] == symbol, 'fetched_at']
+        return stamps.drop_duplicates().tolist()
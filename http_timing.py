@@ -0,0 +1,116 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+try:
+    from curl_cffi import CurlInfo
+except ImportError:  # very old curl_cffi
+    CurlInfo = None
+
+# curl's timers all count from the start of the transfer
+_CURL_TIMERS = {
+    'namelookup': 'NAMELOOKUP_TIME',
+    'connect': 'CONNECT_TIME',
+    'appconnect': 'APPCONNECT_TIME',
+    'starttransfer': 'STARTTRANSFER_TIME',
+    'total': 'TOTAL_TIME',
+}
+
+# Infos to ask the session for; whatever this curl_cffi build doesn't know is left out
+TIMING_INFOS = {name: getattr(CurlInfo, attr) for name, attr in _CURL_TIMERS.items()
+                if CurlInfo is not None and hasattr(CurlInfo, attr)}
+
+PHASES = ['dns', 'connect', 'tls', 'ttfb', 'total']
+
+
+def request_timings(response):
+    """
+    Phase times in seconds and body size of one response:
+      dns      name lookup
+      connect  TCP connect after the lookup
+      tls      TLS handshake after the connect (0 for plain HTTP)
+      ttfb     start of the request to the first response byte
+      total    whole transfer
+    Phases curl did not report are NaN; total falls back to response.elapsed.
+    """
+    infos = getattr(response, 'infos', None) or {}
+    raw = {}
+    for name, info in TIMING_INFOS.items():
+        try:
+            raw[name] = float(infos[info])
+        except (KeyError, TypeError, ValueError):
+            raw[name] = np.nan
+
+    total = raw.get('total', np.nan)
+    if not total > 0:
+        elapsed = getattr(response, 'elapsed', None)
+        total = elapsed.total_seconds() if elapsed is not None else np.nan
+
+    lookup = raw.get('namelookup', np.nan)
+    connected = raw.get('connect', np.nan)
+    handshake = raw.get('appconnect', np.nan)
+    timings = {
+        'dns': lookup,
+        'connect': connected - lookup,
+        # appconnect stays 0 when there was no TLS
+        'tls': max(handshake - connected, 0.0) if handshake == handshake else np.nan,
+        'ttfb': raw.get('starttransfer', np.nan),
+        'total': total,
+    }
+    try:
+        timings['bytes'] = len(response.content)
+    except (AttributeError, TypeError):
+        timings['bytes'] = 0
+    return timings
+
+
+class TimingSummary:
+    """
+    Per-request phase timings of one run, summarised per impersonation profile
+    """
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.rows = []
+
+    def __len__(self):
+        return len(self.rows)
+
+    def record(self, profile, status, timings):
+        with self.lock:
+            self.rows.append({'profile': profile, 'status': status, **timings})
+
+    def frame(self):
+        with self.lock:
+            rows = list(self.rows)
+        return pd.DataFrame(rows, columns=['profile', 'status'] + PHASES + ['bytes'])
+
+    def summary(self):
+        """
+        Request count, bytes and mean/p50/p95 milliseconds of each phase,
+        per profile and for the whole run ('all')
+        """
+        df = self.frame()
+        if df.empty:
+            return pd.DataFrame()
+        df = pd.concat([df, df.assign(profile='all')], ignore_index=True)
+        df[PHASES] = df[PHASES] * 1000.0
+        grouped = df.groupby('profile', sort=True)
+        out = pd.DataFrame({'requests': grouped.size(), 'bytes': grouped['bytes'].sum()})
+        for phase in PHASES:
+            column = grouped[phase]
+            out[f"{phase}_mean_ms"] = column.mean()
+            out[f"{phase}_p50_ms"] = column.quantile(0.5)
+            out[f"{phase}_p95_ms"] = column.quantile(0.95)
+        return out.round(2)
+
+    def report(self):
+        summary = self.summary()
+        if summary.empty:
+            return summary
+        print("\nRequest timings (mean / p95 ms):")
+        print(f"  {'profile':<12} {'n':>5} " + " ".join(f"{p:>15}" for p in PHASES))
+        for profile, row in summary.iterrows():
+            cells = " ".join(f"{row[f'{p}_mean_ms']:>7.1f} / {row[f'{p}_p95_ms']:<5.0f}" for p in PHASES)
+            print(f"  {profile:<12} {int(row['requests']):>5} {cells}")
+        return summary
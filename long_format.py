@@ -0,0 +1,291 @@
+import pandas as pd
+import numpy as np
+import os
+
+from external_merge import split_by_symbol
+
+KEY_COLUMNS = ['symbol', 'date', 'period']
+LONG_COLUMNS = KEY_COLUMNS + ['statement', 'metric_id', 'value']
+
+
+def parquet_available():
+    try:
+        import pyarrow  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class MetricCatalog:
+    """
+    Integer codes for metric names, with the statement each metric came from
+    """
+    def __init__(self, catalog_file=None):
+        self.catalog_file = catalog_file
+        self.names = []
+        self.statements = []
+        self.ids = {}
+        if catalog_file and os.path.exists(catalog_file):
+            df = pd.read_csv(catalog_file, keep_default_na=False)
+            for name, statement in zip(df['metric'], df['statement']):
+                self.code(name, statement)
+
+    def code(self, name, statement=''):
+        metric_id = self.ids.get(name)
+        if metric_id is None:
+            metric_id = len(self.names)
+            self.ids[name] = metric_id
+            self.names.append(name)
+            self.statements.append(statement)
+        elif statement and not self.statements[metric_id]:
+            self.statements[metric_id] = statement
+        return metric_id
+
+    def codes(self, names):
+        """
+        Codes for the given names; unknown names are skipped
+        """
+        return np.array([self.ids[n] for n in names if n in self.ids], dtype=np.int32)
+
+    def observe_payload(self, statements):
+        """
+        Learn metric -> statement from a payload's 'annual'/'quarter' section
+        """
+        for statement in statements or []:
+            if isinstance(statement, dict) and statement.get('data'):
+                statement_type = statement.get('type', '')
+                for key in statement['data'][0]:
+                    if key not in ('date', 'symbol'):
+                        self.code(key, statement_type)
+
+    def save(self):
+        if self.catalog_file:
+            pd.DataFrame({
+                'metric_id': np.arange(len(self.names)),
+                'metric': self.names,
+                'statement': self.statements,
+            }).to_csv(self.catalog_file, index=False)
+
+
+def to_long(wide, catalog):
+    """
+    Melt a wide company frame into (symbol, date, period, statement, metric_id, value).
+    Numeric metrics become rows; text fields (currency, filing dates, links)
+    are returned separately as a narrow per-row meta frame.
+    """
+    wide = wide.copy()
+    if 'period' not in wide.columns:
+        wide['period'] = ''
+    wide['date'] = pd.to_datetime(wide['date'])
+
+    fields = [c for c in wide.columns if c not in KEY_COLUMNS]
+    numeric = [c for c in fields
+               if pd.api.types.is_numeric_dtype(wide[c]) and not pd.api.types.is_bool_dtype(wide[c])]
+    text = [c for c in fields if c not in numeric and wide[c].notna().any()]
+
+    values = wide[numeric].to_numpy(dtype=np.float64)
+    rows, cols = np.nonzero(~np.isnan(values))
+
+    metric_ids = np.array([catalog.code(c) for c in numeric], dtype=np.int32)
+    statements = np.array(catalog.statements, dtype=object)
+
+    long = pd.DataFrame({
+        'symbol': wide['symbol'].to_numpy()[rows],
+        'date': wide['date'].to_numpy()[rows],
+        'period': wide['period'].to_numpy()[rows],
+        'statement': statements[metric_ids[cols]] if len(cols) else np.array([], dtype=object),
+        'metric_id': metric_ids[cols],
+        'value': values[rows, cols],
+    })
+    for column in ('symbol', 'period', 'statement'):
+        long[column] = long[column].astype('category')
+
+    meta = wide[KEY_COLUMNS + text]
+    return long, meta
+
+
+def pivot_wide(long, catalog, symbols=None, metrics=None, meta=None):
+    """
+    Rebuild the wide layout for the selected symbols and metrics
+    """
+    mask = np.ones(len(long), dtype=bool)
+    if symbols is not None:
+        mask &= long['symbol'].isin(list(symbols)).to_numpy()
+    if metrics is not None:
+        mask &= np.isin(long['metric_id'].to_numpy(), catalog.codes(metrics))
+    selected = long.loc[mask, KEY_COLUMNS + ['metric_id', 'value']]
+    selected = selected.astype({'symbol': str, 'period': str})
+
+    wide = selected.set_index(KEY_COLUMNS + ['metric_id'])['value'].unstack('metric_id')
+    wide.columns = [catalog.names[i] for i in wide.columns]
+    wide = wide.reset_index()
+
+    if meta is not None and not meta.empty:
+        meta = meta.copy()
+        meta['symbol'] = meta['symbol'].astype(str)
+        meta['period'] = meta['period'].astype(str)
+        wide = wide.merge(meta, on=KEY_COLUMNS, how='left')
+
+    return wide.sort_values(['symbol', 'date'], ignore_index=True)
+
+
+class LongFormatStore:
+    """
+    Tidy copy of the master dataset with integer-coded metrics.
+
+    Each symbol's long and meta rows are kept separately, so put() costs
+    the same for the first company as for the thousandth; the combined
+    tables are concatenated once, when save() or pivot() needs them, and
+    cached until the next put().
+
+    With in_memory=False (out-of-core mode) each symbol's rows are saved as
+    their own values/ and meta/ part files instead of the two combined
+    tables, dropped from memory once written and read back by pivot().
+    """
+    def __init__(self, directory="NSE_ALL_COMPANIES_LONG", in_memory=True):
+        self.directory = directory
+        self.in_memory = in_memory
+        self.catalog = MetricCatalog(os.path.join(directory, 'metrics.csv'))
+        self.suffix = '.parquet' if parquet_available() else '.csv.gz'
+        # Every symbol in memory mode; only unsaved ones out of core
+        self.parts = {}
+        self.symbols = set()
+        self.unsaved = set()
+        self.changed = False
+        self._long = None
+        self._meta = None
+
+    def _path(self, name):
+        return os.path.join(self.directory, name + self.suffix)
+
+    def _part_path(self, kind, symbol):
+        return os.path.join(self.directory, kind, symbol + self.suffix)
+
+    def _write(self, df, path):
+        if self.suffix == '.parquet':
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+
+    def _read(self, path, kind):
+        if self.suffix == '.parquet':
+            df = pd.read_parquet(path)
+        elif kind == 'values':
+            df = pd.read_csv(path, parse_dates=['date'], dtype={'metric_id': np.int32})
+        else:
+            df = pd.read_csv(path, parse_dates=['date'])
+        df['symbol'] = df['symbol'].astype(str)
+        return df
+
+    def _read_chunks(self, path, kind, chunksize=200000):
+        if self.suffix == '.parquet':
+            import pyarrow.parquet as pq
+            for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+                df = batch.to_pandas()
+                df['symbol'] = df['symbol'].astype(str)
+                yield df
+        else:
+            dtype = {'metric_id': np.int32} if kind == 'values' else None
+            yield from pd.read_csv(path, parse_dates=['date'], dtype=dtype, chunksize=chunksize)
+
+    def _get(self, symbol):
+        if symbol in self.parts:
+            return self.parts[symbol]
+        parts = []
+        for kind, columns in (('values', LONG_COLUMNS), ('meta', KEY_COLUMNS)):
+            path = self._part_path(kind, symbol)
+            parts.append(self._read(path, kind) if os.path.exists(path) else pd.DataFrame(columns=columns))
+        return tuple(parts)
+
+    def put(self, wide):
+        """
+        Replace the rows of every symbol present in a wide frame
+        """
+        if wide is None or wide.empty:
+            return
+        for symbol, rows in wide.groupby('symbol', sort=False):
+            self.parts[symbol] = to_long(rows, self.catalog)
+            self.symbols.add(symbol)
+            self.unsaved.add(symbol)
+        self.changed = True
+        self._long = self._meta = None
+
+    @staticmethod
+    def _combine(parts):
+        if not parts:
+            return pd.DataFrame(columns=LONG_COLUMNS), pd.DataFrame(columns=KEY_COLUMNS)
+        long = pd.concat([p[0] for p in parts], ignore_index=True)
+        for column in ('symbol', 'period', 'statement'):
+            long[column] = long[column].astype('category')
+        return long, pd.concat([p[1] for p in parts], ignore_index=True)
+
+    @property
+    def long(self):
+        if self._long is None:
+            self._long, self._meta = self._combine([self._get(s) for s in sorted(self.symbols)])
+        return self._long
+
+    @property
+    def meta(self):
+        if self._meta is None:
+            self._long, self._meta = self._combine([self._get(s) for s in sorted(self.symbols)])
+        return self._meta
+
+    def pivot(self, symbols=None, metrics=None, include_meta=True):
+        if self.in_memory or symbols is None:
+            return pivot_wide(self.long, self.catalog, symbols, metrics,
+                              self.meta if include_meta else None)
+        # Out of core, read only the requested symbols' parts
+        long, meta = self._combine([self._get(s) for s in sorted(set(symbols) & self.symbols)])
+        return pivot_wide(long, self.catalog, None, metrics, meta if include_meta else None)
+
+    def save(self):
+        if not self.changed:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        self.catalog.save()
+        if self.in_memory:
+            self._write(self.long, self._path('values'))
+            self._write(self.meta, self._path('meta'))
+        else:
+            os.makedirs(os.path.join(self.directory, 'values'), exist_ok=True)
+            os.makedirs(os.path.join(self.directory, 'meta'), exist_ok=True)
+            for symbol in self.unsaved:
+                long, meta = self.parts.pop(symbol)
+                self._write(long, self._part_path('values', symbol))
+                self._write(meta, self._part_path('meta', symbol))
+        self.unsaved = set()
+        self.changed = False
+
+    def load(self):
+        self.parts = {}
+        self.symbols = set()
+        self.unsaved = set()
+        self.changed = False
+        self._long = self._meta = None
+        values_dir = os.path.join(self.directory, 'values')
+        if not self.in_memory and os.path.isdir(values_dir):
+            for kind in ('values', 'meta'):
+                kind_dir = os.path.join(self.directory, kind)
+                if os.path.isdir(kind_dir):
+                    self.symbols.update(n[:-len(self.suffix)] for n in os.listdir(kind_dir)
+                                        if n.endswith(self.suffix))
+            return
+        if not os.path.exists(self._path('values')):
+            return
+        if not self.in_memory:
+            # Split the combined tables into part files, a chunk at a time
+            for kind in ('values', 'meta'):
+                os.makedirs(os.path.join(self.directory, kind), exist_ok=True)
+                for symbol, rows in split_by_symbol(self._read_chunks(self._path(kind), kind)):
+                    self._write(rows, self._part_path(kind, symbol))
+                    self.symbols.add(symbol)
+            return
+        long = self._read(self._path('values'), 'values')
+        meta = self._read(self._path('meta'), 'meta')
+        long_by_symbol = dict(tuple(long.groupby('symbol', sort=False)))
+        meta_by_symbol = dict(tuple(meta.groupby('symbol', sort=False)))
+        self.parts = {symbol: (long_by_symbol.get(symbol, long.iloc[:0]).reset_index(drop=True),
+                               meta_by_symbol.get(symbol, meta.iloc[:0]).reset_index(drop=True))
+                      for symbol in set(long_by_symbol) | set(meta_by_symbol)}
+        self.symbols = set(self.parts)
@@ -0,0 +1,198 @@
+import pandas as pd
+import os
+import bisect
+from external_merge import merge_sorted_runs
+
+
+class SortedMasterStore:
+    """
+    Master dataset kept as one date-sorted partition per symbol.
+
+    Symbols are held in sorted order, so the combined frame is already sorted
+    by (symbol, date) and never needs a global sort. Checkpoints only rewrite
+    the partitions that changed since the previous checkpoint.
+
+    With in_memory=False (out-of-core mode) each partition is written to disk
+    as soon as it arrives and only symbol names and row counts stay in
+    memory; the combined file is produced by a k-way merge of the runs.
+    """
+    def __init__(self, partition_dir="NSE_ALL_COMPANIES_FINANCIALS", in_memory=True):
+        self.partition_dir = partition_dir
+        self.in_memory = in_memory
+        self.symbols = []
+        self.partitions = {}
+        self.row_counts = {}
+        self.columns = []
+        self.dirty = set()
+        self.removed = set()
+        self._frame = None
+
+    def __len__(self):
+        return sum(self.row_counts.values())
+
+    def __contains__(self, symbol):
+        return symbol in self.row_counts
+
+    def _partition_path(self, symbol):
+        return os.path.join(self.partition_dir, f"{symbol}.csv")
+
+    def _sorted_run(self, df):
+        """
+        Turn one company's rows into a date-sorted run with datetime64 dates
+        """
+        df = df.copy()
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'])
+            df = df.sort_values('date', kind='stable', ignore_index=True)
+        return df
+
+    def _add_columns(self, df):
+        known = set(self.columns)
+        self.columns.extend(c for c in df.columns if c not in known)
+
+    def put(self, df, mark_dirty=True):
+        """
+        Insert or replace the rows of every symbol present in df
+        """
+        if df is None or df.empty:
+            return
+
+        for symbol, rows in df.groupby('symbol', sort=False):
+            if symbol not in self.row_counts:
+                bisect.insort(self.symbols, symbol)
+            run = self._sorted_run(rows)
+            self.row_counts[symbol] = len(run)
+            self.removed.discard(symbol)
+
+            if self.in_memory:
+                self.partitions[symbol] = run
+                if mark_dirty:
+                    self.dirty.add(symbol)
+            elif mark_dirty:
+                self._write_partition(symbol, run)
+
+        self._add_columns(df)
+        self._frame = None
+
+    def remove(self, symbol):
+        if symbol in self.row_counts:
+            del self.row_counts[symbol]
+            self.partitions.pop(symbol, None)
+            self.symbols.pop(bisect.bisect_left(self.symbols, symbol))
+            self.dirty.discard(symbol)
+            self.removed.add(symbol)
+            self._frame = None
+
+    def clear(self):
+        for symbol in list(self.symbols):
+            self.remove(symbol)
+
+    def frame(self):
+        """
+        Combined frame in (symbol, date) order, cached until the next change
+        """
+        if self._frame is None:
+            if self.symbols:
+                self._frame = pd.concat(
+                    [self.get(s) for s in self.symbols],
+                    ignore_index=True
+                ).reindex(columns=self.columns)
+            else:
+                self._frame = pd.DataFrame()
+        return self._frame
+
+    def get(self, symbol):
+        """
+        One symbol's rows, read from disk in out-of-core mode
+        """
+        if symbol in self.partitions:
+            return self.partitions[symbol]
+        if symbol in self.row_counts:
+            return pd.read_csv(self._partition_path(symbol), parse_dates=['date'])
+        return None
+
+    def latest_dates(self):
+        """
+        One row per symbol with its most recent date and period
+        """
+        rows = []
+        for symbol in self.symbols:
+            if symbol in self.partitions:
+                run = self.partitions[symbol]
+            else:
+                run = pd.read_csv(self._partition_path(symbol), parse_dates=['date'],
+                                  usecols=lambda c: c in ('date', 'period'))
+            last = run.iloc[-1]
+            rows.append((symbol, last['date'], last.get('period', '')))
+        return pd.DataFrame(rows, columns=['symbol', 'date', 'period'])
+
+    def _write_partition(self, symbol, run):
+        os.makedirs(self.partition_dir, exist_ok=True)
+        run.to_csv(self._partition_path(symbol), index=False, date_format='%Y-%m-%d')
+
+    def load(self, master_file=None):
+        """
+        Load partitions from disk; fall back to splitting a single master CSV
+        """
+        self.clear()
+        self.removed.clear()
+
+        if os.path.isdir(self.partition_dir):
+            for name in sorted(os.listdir(self.partition_dir)):
+                if not name.endswith('.csv'):
+                    continue
+                path = os.path.join(self.partition_dir, name)
+                if self.in_memory:
+                    self.put(pd.read_csv(path, parse_dates=['date']), mark_dirty=False)
+                else:
+                    # Only the header and a row count; the rows stay on disk
+                    symbol = name[:-len('.csv')]
+                    bisect.insort(self.symbols, symbol)
+                    with open(path, encoding='utf-8') as f:
+                        self._add_columns(pd.read_csv(f, nrows=0))
+                        f.seek(0)
+                        self.row_counts[symbol] = sum(1 for _ in f) - 1
+        elif master_file and os.path.exists(master_file):
+            # First run after the switch: every partition still has to be written.
+            # The master CSV is sorted by symbol, so only the last symbol of a
+            # chunk can continue into the next one.
+            carry = None
+            for chunk in pd.read_csv(master_file, chunksize=50000):
+                if carry is not None:
+                    chunk = pd.concat([carry, chunk], ignore_index=True)
+                last = chunk['symbol'].iloc[-1]
+                carry = chunk[chunk['symbol'] == last]
+                self.put(chunk[chunk['symbol'] != last])
+            if carry is not None:
+                self.put(carry)
+
+        return self.symbols
+
+    def checkpoint(self):
+        """
+        Write only the partitions touched since the last checkpoint
+        """
+        if not self.dirty and not self.removed:
+            return 0
+
+        for symbol in self.dirty:
+            self._write_partition(symbol, self.partitions[symbol])
+        for symbol in self.removed:
+            path = self._partition_path(symbol)
+            if os.path.exists(path):
+                os.remove(path)
+
+        written = len(self.dirty)
+        self.dirty.clear()
+        self.removed.clear()
+        return written
+
+    def export(self, path):
+        """
+        Write the combined dataset as a single CSV sorted by (symbol, date)
+        """
+        if self.in_memory:
+            self.frame().to_csv(path, index=False, date_format='%Y-%m-%d')
+        else:
+            self.checkpoint()
+            merge_sorted_runs([self._partition_path(s) for s in self.symbols], path)
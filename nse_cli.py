@@ -0,0 +1,641 @@
+"""
+Command-line entry point for the NSE financials pipeline.
+
+    python nse_cli.py crawl --universe nifty50 --limit 10
+    python nse_cli.py rebuild --sink parquet
+    python nse_cli.py crawl --limit 50 --profile
+    python nse_cli.py export --sink sqlite --sink arrow
+    python nse_cli.py derive
+    python nse_cli.py ttm --latest
+    python nse_cli.py validate
+    python nse_cli.py rank ETERNAL.NS --metric netMargin roe
+    python nse_cli.py query ETERNAL.NS --fields revenue netIncome --unit crores
+    python nse_cli.py screen "revenueGrowth > 0.2" "netMargin > 0.1" --by revenue --top 20
+    python nse_cli.py daemon --universe nifty50
+    python nse_cli.py enqueue RELIANCE TCS
+    python nse_cli.py ledger --slowest 20 --flakiest 20
+    python nse_cli.py stats
+    python nse_cli.py check-startup
+
+Only the standard library is imported at module level. pandas, curl_cffi
+and pyarrow are imported inside the subcommands that need them, so --help,
+stats and universe queries start instantly.
+"""
+import argparse
+import os
+import sys
+
+# Same file names NSEFinancialScraper uses
+MASTER_FILE = "NSE_ALL_COMPANIES_FINANCIALS.csv"
+PARTITION_DIR = "NSE_ALL_COMPANIES_FINANCIALS"
+HISTORY_FILE = "NSE_FINANCIALS_HISTORY.csv"
+QUEUE_FILE = "NSE_WORK_QUEUE.sqlite"
+DERIVED_FILE = "NSE_ALL_COMPANIES_DERIVED.csv"
+QUARTER_FILE = "NSE_ALL_COMPANIES_QUARTERLY.csv"
+TTM_FILE = "NSE_ALL_COMPANIES_TTM.csv"
+FLAG_FILE = "NSE_DATA_QUALITY_FLAGS.csv"
+RANK_FILE = "NSE_PERCENTILES.npz"
+LEDGER_DIR = "NSE_RUN_LEDGER"
+PROFILE_DIR = "NSE_PROFILE"
+PROFILER_CHOICES = ['auto', 'cprofile', 'pyinstrument']
+FX_FILE = "fx_rates.csv"
+UNIT_CHOICES = ['units', 'thousands', 'lakhs', 'millions', 'crores', 'billions']
+
+SINK_CHOICES = ['csv', 'parquet', 'sqlite', 'arrow']
+
+# Modules that must not be imported just to parse arguments
+HEAVY_MODULES = ['pandas', 'numpy', 'curl_cffi', 'cloudscraper', 'pyarrow']
+STARTUP_BUDGET_SECONDS = 0.5
+
+
+def _serve_metrics(scraper, args):
+    if args.metrics_port is not None:
+        port = scraper.metrics.registry.serve(args.metrics_port)
+        print(f"Metrics at http://127.0.0.1:{port}/metrics")
+
+
+def _profiler(args):
+    """
+    StageProfiler when --profile was given, else None
+    """
+    if args.profile is None:
+        return None
+    from profiling import StageProfiler
+    return StageProfiler(args.profile, engine=args.profiler, memory=not args.no_tracemalloc)
+
+
+def _universe_ready(name):
+    """
+    Load the universe up front so a missing list fails with the download
+    hint instead of a traceback mid-run
+    """
+    from universe import load_universe
+    try:
+        load_universe(name)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"✗ {e}")
+        return False
+    return True
+
+
+def cmd_crawl(args):
+    if not _universe_ready(args.universe):
+        return 1
+    from perplexity_scrapper_final import NSEFinancialScraper
+
+    profiler = _profiler(args)
+    scraper = NSEFinancialScraper(long_format=args.long_format, sinks=args.sink,
+                                  out_of_core=args.out_of_core, universe=args.universe,
+                                  profiler=profiler)
+    _serve_metrics(scraper, args)
+    try:
+        scraper.fetch_all_companies(limit=args.limit, skip_existing=not args.refetch,
+                                    refresh=args.refresh)
+    finally:
+        if profiler is not None:
+            profiler.report()
+    return 0
+
+
+def cmd_daemon(args):
+    if not _universe_ready(args.universe):
+        return 1
+    from perplexity_scrapper_final import NSEFinancialScraper
+    from crawl_daemon import CrawlDaemon, WorkQueue
+
+    scraper = NSEFinancialScraper(universe=args.universe, out_of_core=args.out_of_core)
+    _serve_metrics(scraper, args)
+    daemon = CrawlDaemon(scraper, WorkQueue(args.queue_file),
+                         plan_interval=args.plan_interval * 3600)
+    daemon.run()
+    return 0
+
+
+def _canonical(symbols):
+    """
+    Symbols given on the command line, qualified with the exchange suffix
+    and resolved to their current names (zomato -> ETERNAL.NS)
+    """
+    from symbol_cache import AliasResolver
+    return AliasResolver().canonical(symbols)
+
+
+def cmd_enqueue(args):
+    # Only the queue is touched, so this is cheap to call from cron or scripts
+    from crawl_daemon import WorkQueue, ON_DEMAND_PRIORITY
+
+    symbols = _canonical(args.symbols)
+    queue = WorkQueue(args.queue_file)
+    for symbol in symbols:
+        queue.push(symbol, ON_DEMAND_PRIORITY, 'on-demand')
+    print(f"Queued {len(symbols)} symbols ({len(queue)} in queue)")
+    queue.close()
+    return 0
+
+
+def _load_store(args):
+    from master_store import SortedMasterStore
+
+    store = SortedMasterStore(args.partition_dir)
+    store.load(args.master_file)
+    return store
+
+
+def _stored_columns(args):
+    """
+    Column set of the combined master file, so as_of() keeps fields that
+    were never set; None before the first export
+    """
+    import pandas as pd
+
+    if not os.path.exists(args.master_file):
+        return None
+    return pd.read_csv(args.master_file, nrows=0).columns.tolist()
+
+
+def _write_sinks(df, sinks, base):
+    from sinks import MultiSinkWriter, make_sink
+
+    writer = MultiSinkWriter([make_sink(s, base) for s in sinks])
+    failed = 0
+    for result in writer.write(df):
+        if result.error:
+            failed += 1
+            print(f"✗ {result.name}: {result.error}")
+        else:
+            print(f"✓ {result.name}: {result.path} "
+                  f"({result.bytes / 1e6:.1f} MB in {result.seconds:.2f}s)")
+    return 1 if failed else 0
+
+
+def _normalize(df, args):
+    """
+    Convert amounts to --currency/--unit when either was given; None when
+    a currency involved has no FX rates
+    """
+    if not (args.currency or args.unit):
+        return df
+    from currency import CurrencyNormalizer
+
+    try:
+        normalizer = CurrencyNormalizer(args.fx_file or [FX_FILE], target=args.currency or 'INR',
+                                        unit=args.unit or 'units')
+        return normalizer.normalize(df)
+    except ValueError as e:
+        print(f"✗ {e}")
+        return None
+
+
+def cmd_rebuild(args):
+    """
+    Rebuild the combined master file from partitions, or from history --as-of
+    """
+    # Imported before any stage starts, so the stages time work rather than imports
+    from financial_history import FinancialHistory
+    from master_store import SortedMasterStore
+    from profiling import NULL_PROFILER
+
+    profiler = _profiler(args) or NULL_PROFILER
+    if args.as_of:
+        with profiler.stage('decode'):
+            history = FinancialHistory(args.history_file)
+        with profiler.stage('merge'):
+            df = history.as_of(args.as_of, columns=_stored_columns(args))
+        base = os.path.splitext(args.master_file)[0] + f"_AS_OF_{args.as_of[:10]}"
+    else:
+        with profiler.stage('decode'):
+            store = SortedMasterStore(args.partition_dir)
+            store.load(args.master_file)
+        with profiler.stage('merge'):
+            df = store.frame()
+        base = os.path.splitext(args.master_file)[0]
+
+    if df.empty:
+        print("Nothing to rebuild")
+        return 1
+    print(f"Rebuilding {len(df)} rows for {df['symbol'].nunique()} companies")
+    with profiler.stage('save'):
+        status = _write_sinks(df, args.sink or ['csv'], base)
+    profiler.report()
+    return status
+
+
+def cmd_export(args):
+    df = _load_store(args).frame()
+    if df.empty:
+        print("Nothing to export")
+        return 1
+    df = _normalize(df, args)
+    if df is None:
+        return 1
+    base = args.output or os.path.splitext(args.master_file)[0]
+    return _write_sinks(df, args.sink or ['parquet'], base)
+
+
+def cmd_derive(args):
+    import time
+    from derived_metrics import write_derived
+
+    df = _load_store(args).frame()
+    if df.empty:
+        print("Nothing to derive from")
+        return 1
+    start = time.perf_counter()
+    derived = write_derived(df, args.output)
+    print(f"✓ {len(derived.columns) - 2} metrics for {df['symbol'].nunique()} companies "
+          f"in {time.perf_counter() - start:.2f}s -> {args.output}")
+    return 0
+
+
+def cmd_ttm(args):
+    """
+    Recompute trailing-twelve-month rollups from the stored quarterly statements
+    """
+    import time
+    from ttm import TTMRollup
+
+    rollup = TTMRollup(args.quarter_file, args.ttm_file)
+    rollup.load()
+    if not len(rollup):
+        print(f"No quarterly statements in {args.quarter_file}")
+        return 1
+    start = time.perf_counter()
+    count = rollup.rebuild()
+    rollup.export()
+    print(f"✓ TTM rollups for {count} companies in {time.perf_counter() - start:.2f}s "
+          f"-> {args.ttm_file}")
+    if args.latest:
+        latest = rollup.frame(latest_only=True)
+        fields = [c for c in ['symbol', 'date', 'revenue', 'netIncome', 'ebitda',
+                              'freeCashFlow', 'totalAssets'] if c in latest.columns]
+        print(latest[fields].to_string(index=False))
+    return 0
+
+
+def cmd_validate(args):
+    """
+    Run the data-quality rules over every stored company
+    """
+    import time
+    from validation import QualityFlags
+
+    store = _load_store(args)
+    if not store.symbols:
+        print("Nothing to validate")
+        return 1
+    df = store.frame()
+    quality = QualityFlags(args.output)
+    start = time.perf_counter()
+    found = quality.record(df)
+    elapsed = time.perf_counter() - start
+    quality.export()
+    print(f"✓ Validated {len(df)} rows for {len(store.symbols)} companies in {elapsed:.2f}s: "
+          f"{len(found)} flags -> {args.output}")
+    if len(found):
+        print(quality.summary().to_string())
+    return 0
+
+
+def cmd_rank(args):
+    """
+    Look up a company's percentiles; --rebuild re-ranks the whole store first
+    """
+    from ranks import RankEngine
+
+    engine = RankEngine(args.rank_file)
+    if args.rebuild or not engine.load():
+        import pandas as pd
+        from derived_metrics import with_derived
+
+        store = _load_store(args)
+        if not store.symbols:
+            print("Nothing to rank")
+            return 1
+        df = store.frame()
+        if os.path.exists(args.derived_file):
+            df = with_derived(df, pd.read_csv(args.derived_file))
+        engine.build(df)
+        engine.save()
+        print(f"✓ Ranked {len(engine)} companies on {len(engine.metrics)} metrics -> {args.rank_file}")
+
+    symbol = _canonical([args.symbol])[0]
+    if symbol not in engine.symbol_pos:
+        print(f"No data for {symbol}")
+        return 1
+    for metric in args.metric:
+        pct = engine.percentile(symbol, metric, args.year)
+        when = args.year or 'latest'
+        print(f"{symbol} {metric} ({when}): " + ("n/a" if pct != pct else f"{pct:.1f}th percentile"))
+    return 0
+
+
+def cmd_query(args):
+    symbol = _canonical([args.symbol])[0]
+    if args.as_of:
+        from financial_history import FinancialHistory
+        df = FinancialHistory(args.history_file).as_of(args.as_of, columns=_stored_columns(args))
+        df = df[df['symbol'] == symbol]
+    else:
+        import pandas as pd
+        path = os.path.join(args.partition_dir, f"{symbol}.csv")
+        if not os.path.exists(path):
+            print(f"No data for {symbol}")
+            return 1
+        df = pd.read_csv(path, parse_dates=['date'])
+
+    if df is None or df.empty:
+        print(f"No data for {symbol}")
+        return 1
+
+    df = _normalize(df, args)
+    if df is None:
+        return 1
+    fields = ['symbol', 'date'] + [f for f in (args.fields or []) if f in df.columns]
+    if not args.fields:
+        fields = list(df.columns)
+    if args.csv:
+        df[fields].to_csv(sys.stdout, index=False)
+    else:
+        print(df[fields].to_string(index=False))
+    return 0
+
+
+def cmd_screen(args):
+    import time
+    import pandas as pd
+    from screener import Screener, parse_condition
+
+    try:
+        conditions = [parse_condition(c) for c in args.conditions]
+    except ValueError as e:
+        print(e)
+        return 2
+    # Indexes are built per call, so loading and building count towards the time
+    start = time.perf_counter()
+    store = _load_store(args)
+    if not store.symbols:
+        print("Nothing to screen")
+        return 1
+    derived = pd.read_csv(args.derived_file) if os.path.exists(args.derived_file) else None
+    screener = Screener.from_store(store, derived, fiscal_years=args.year is not None)
+    built = time.perf_counter()
+    try:
+        result = screener.screen(conditions, fields=args.fields, top=args.top, by=args.by,
+                                 ascending=args.ascending, year=args.year)
+    except KeyError as e:
+        print(e.args[0])
+        return 1
+    finished = time.perf_counter()
+    if args.csv:
+        result.to_csv(sys.stdout, index=False)
+    else:
+        print(result.to_string(index=False))
+        print(f"{len(result)} of {len(store.symbols)} companies in {(finished - start) * 1000:.1f} ms "
+              f"(load and index {(built - start) * 1000:.1f} ms, screen {(finished - built) * 1000:.1f} ms)")
+        years = sorted(screener.latest.rows['fiscalYear'].unique())
+        if args.year is None and len(years) > 1:
+            print(f"⚠ Latest periods span fiscal years {years[0]}-{years[-1]}; "
+                  f"pass --year for a common period")
+    return 0
+
+
+def cmd_ledger(args):
+    """
+    Slowest and flakiest symbols from the fetch attempt ledger
+    """
+    import pandas as pd
+    from run_ledger import RunLedger
+
+    ledger = RunLedger(args.ledger_dir)
+    df = ledger.read(args.run)
+    if df.empty:
+        print(f"No attempts recorded in {args.ledger_dir}/")
+        return 1
+    if args.symbol:
+        rows = df[df['symbol'] == _canonical([args.symbol])[0]].sort_values('started')
+        print(rows.drop(columns='symbol').to_string(index=False))
+        return 0
+    runs = df['run_id'].nunique()
+    print(f"{len(df)} attempts for {df['symbol'].nunique()} symbols over {runs} run(s)")
+    print(df['outcome'].value_counts().to_string())
+    with pd.option_context('display.width', 200):
+        if args.slowest:
+            print(f"\nSlowest {args.slowest} (median latency):")
+            print(ledger.slowest(args.slowest, df=df).to_string())
+        if args.flakiest:
+            flaky = ledger.flakiest(args.flakiest, min_attempts=args.min_attempts, df=df)
+            print(f"\nFlakiest {args.flakiest} (failure rate, then retries per attempt):")
+            print(flaky.to_string() if not flaky.empty else "  none")
+    return 0
+
+
+def cmd_stats(args):
+    """
+    Dataset and universe summary without loading any frames
+    """
+    from universe import UniverseRegistry
+
+    if os.path.isdir(args.partition_dir):
+        files = [f for f in os.listdir(args.partition_dir) if f.endswith('.csv')]
+        rows = 0
+        for name in files:
+            with open(os.path.join(args.partition_dir, name), encoding='utf-8') as f:
+                rows += sum(1 for _ in f) - 1
+        print(f"Companies: {len(files)}")
+        print(f"Rows: {rows}")
+    else:
+        print(f"No partitions in {args.partition_dir}/")
+
+    for path in (args.master_file, args.history_file):
+        if os.path.exists(path):
+            print(f"{path}: {os.path.getsize(path) / 1e6:.1f} MB")
+
+    registry = UniverseRegistry()
+    for name in registry.names():
+        try:
+            size = len(registry.load(name))
+        except FileNotFoundError:
+            continue
+        version = registry.version(name)
+        print(f"Universe {name}: {size} symbols" + (f" (version {version})" if version else ""))
+    return 0
+
+
+def probe_startup(runs=5):
+    """
+    Best wall time of `--help` in a fresh interpreter over `runs` runs, and
+    the heavy modules it imported
+    """
+    import subprocess
+    import time
+
+    probe = (
+        "import sys, runpy; sys.argv = [%r, '--help']\n"
+        "try:\n"
+        "    runpy.run_path(%r, run_name='__main__')\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(','.join(m for m in %r if m in sys.modules), file=sys.stderr)\n"
+    ) % (__file__, __file__, HEAVY_MODULES)
+
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    lines = result.stderr.strip().splitlines()
+    heavy = [m for m in lines[-1].split(',') if m] if lines else []
+    return best, heavy
+
+
+def cmd_check_startup(args):
+    """
+    Fail if `--help` takes longer than the budget or imports heavy modules
+    """
+    best, heavy = probe_startup(args.runs)
+    print(f"Startup: {best * 1000:.0f} ms (budget {args.budget * 1000:.0f} ms)")
+
+    ok = True
+    if heavy:
+        print(f"✗ Heavy modules imported at startup: {','.join(heavy)}")
+        ok = False
+    if best > args.budget:
+        print("✗ Startup exceeds budget")
+        ok = False
+    if ok:
+        print("✓ Startup within budget")
+    return 0 if ok else 1
+
+
+def _add_profile_arguments(p):
+    p.add_argument('--profile', nargs='?', const=PROFILE_DIR, metavar='DIR',
+                   help=f'profile each stage and write reports to DIR (default {PROFILE_DIR})')
+    p.add_argument('--profiler', choices=PROFILER_CHOICES, default='auto',
+                   help='auto uses pyinstrument when installed, else cProfile')
+    p.add_argument('--no-tracemalloc', action='store_true',
+                   help='skip per-stage memory tracking while profiling')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='nse_cli.py',
+                                     description='NSE financial data aggregator')
+    parser.add_argument('--master-file', default=MASTER_FILE)
+    parser.add_argument('--partition-dir', default=PARTITION_DIR)
+    parser.add_argument('--history-file', default=HISTORY_FILE)
+    parser.add_argument('--fx-file', action='append',
+                        help=f'FX table (date,currency,rate in INR); default {FX_FILE}')
+    sub = parser.add_subparsers(dest='command', required=True)
+
+    p = sub.add_parser('crawl', help='fetch financials from Perplexity')
+    p.add_argument('--universe', default='all',
+                   help="nifty50, all or bse (default: all); nifty500 and equity_list "
+                        "need the NSE list downloaded into universes/")
+    p.add_argument('--limit', type=int, default=None)
+    p.add_argument('--refetch', action='store_true', help='also fetch companies already stored')
+    p.add_argument('--refresh', action='store_true',
+                   help='only fetch companies whose next annual filing is due')
+    p.add_argument('--long-format', action='store_true')
+    p.add_argument('--out-of-core', action='store_true')
+    p.add_argument('--sink', action='append', choices=SINK_CHOICES)
+    p.add_argument('--metrics-port', type=int, help='also serve Prometheus metrics on this port')
+    _add_profile_arguments(p)
+    p.set_defaults(func=cmd_crawl)
+
+    p = sub.add_parser('daemon', help='crawl continuously from the work queue')
+    p.add_argument('--universe', default='all', help='as for crawl')
+    p.add_argument('--out-of-core', action='store_true')
+    p.add_argument('--queue-file', default=QUEUE_FILE)
+    p.add_argument('--plan-interval', type=float, default=6, help='hours between refresh plans')
+    p.add_argument('--metrics-port', type=int, help='also serve Prometheus metrics on this port')
+    p.set_defaults(func=cmd_daemon)
+
+    p = sub.add_parser('enqueue', help='ask a running daemon to fetch symbols next')
+    p.add_argument('symbols', nargs='+')
+    p.add_argument('--queue-file', default=QUEUE_FILE)
+    p.set_defaults(func=cmd_enqueue)
+
+    p = sub.add_parser('rebuild', help='rebuild the combined master file')
+    p.add_argument('--as-of', help='rebuild from history as known at this date/time')
+    p.add_argument('--sink', action='append', choices=SINK_CHOICES)
+    _add_profile_arguments(p)
+    p.set_defaults(func=cmd_rebuild)
+
+    p = sub.add_parser('export', help='export the master dataset to other formats')
+    p.add_argument('--sink', action='append', choices=SINK_CHOICES)
+    p.add_argument('--output', help='output path without extension')
+    p.add_argument('--currency', help='convert amounts to this currency (needs an FX table)')
+    p.add_argument('--unit', choices=UNIT_CHOICES)
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser('derive', help='compute ratios and growth metrics for all companies')
+    p.add_argument('--output', default=DERIVED_FILE)
+    p.set_defaults(func=cmd_derive)
+
+    p = sub.add_parser('ttm', help='recompute trailing-twelve-month rollups from quarterly data')
+    p.add_argument('--quarter-file', default=QUARTER_FILE)
+    p.add_argument('--ttm-file', default=TTM_FILE)
+    p.add_argument('--latest', action='store_true', help="print each company's latest TTM")
+    p.set_defaults(func=cmd_ttm)
+
+    p = sub.add_parser('validate', help='run data-quality checks over the stored data')
+    p.add_argument('--output', default=FLAG_FILE)
+    p.set_defaults(func=cmd_validate)
+
+    p = sub.add_parser('rank', help="a company's percentile against the universe")
+    p.add_argument('symbol')
+    p.add_argument('--metric', nargs='+', required=True)
+    p.add_argument('--year', type=int, help='fiscal year (default: latest with a value)')
+    p.add_argument('--rebuild', action='store_true')
+    p.add_argument('--rank-file', default=RANK_FILE)
+    p.add_argument('--derived-file', default=DERIVED_FILE)
+    p.set_defaults(func=cmd_rank)
+
+    p = sub.add_parser('query', help="show one company's rows")
+    p.add_argument('symbol')
+    p.add_argument('--fields', nargs='+')
+    p.add_argument('--as-of')
+    p.add_argument('--csv', action='store_true')
+    p.add_argument('--currency', help='convert amounts to this currency (needs an FX table)')
+    p.add_argument('--unit', choices=UNIT_CHOICES)
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser('screen', help='filter companies on their latest metrics')
+    p.add_argument('conditions', nargs='*', help="e.g. 'netMargin > 0.1'")
+    p.add_argument('--fields', nargs='+')
+    p.add_argument('--by', help='order results by this metric (descending)')
+    p.add_argument('--ascending', action='store_true')
+    p.add_argument('--top', type=int)
+    p.add_argument('--year', type=int, help='screen this fiscal year instead of the latest')
+    p.add_argument('--derived-file', default=DERIVED_FILE)
+    p.add_argument('--csv', action='store_true')
+    p.set_defaults(func=cmd_screen)
+
+    p = sub.add_parser('ledger', help='slowest and flakiest symbols from past fetch attempts')
+    p.add_argument('symbol', nargs='?', help='show every attempt for one symbol')
+    p.add_argument('--run', help='only this run id')
+    p.add_argument('--slowest', type=int, default=20)
+    p.add_argument('--flakiest', type=int, default=20)
+    p.add_argument('--min-attempts', type=int, default=1)
+    p.add_argument('--ledger-dir', default=LEDGER_DIR)
+    p.set_defaults(func=cmd_ledger)
+
+    p = sub.add_parser('stats', help='summarize the dataset and universes')
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser('check-startup', help='check CLI import time against a budget')
+    p.add_argument('--budget', type=float, default=STARTUP_BUDGET_SECONDS)
+    p.add_argument('--runs', type=int, default=3)
+    p.set_defaults(func=cmd_check_startup)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
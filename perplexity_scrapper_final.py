@@ -1,1070 +1,123 @@
 import pandas as pd
 import json
 import time
-import random
 from curl_cffi import requests
 import os
 from datetime import datetime
+from financial_history import FinancialHistory
+from master_store import SortedMasterStore
+from long_format import LongFormatStore
+from sinks import MultiSinkWriter, CsvSink, make_sink, read_csv_chunks
+from universe import load_universe
+from symbol_cache import NegativeCache, AliasResolver
+from refresh_planner import RefreshPlanner
+from rate_limiter import RateLimiter
+from change_feed import ChangeFeed, compute_changes
+from derived_metrics import DerivedMetricCache, with_derived
+from ranks import RankEngine
+from ttm import TTMRollup, quarterly_frame
+from validation import QualityFlags
+from metrics import CrawlMetrics
+from http_timing import TIMING_INFOS, TimingSummary, request_timings
+from run_ledger import RunLedger
+from profiling import NULL_PROFILER
 
 class NSEFinancialScraper:
-    def __init__(self):
+    def __init__(self, long_format=False, sinks=None, out_of_core=False, universe='all',
+                 missing_ttl_days=30, base_url="https://www.perplexity.ai", profiler=None):
         self.session = requests.Session()
-        self.master_df = None
+        # profiling.StageProfiler marking fetch/decode/normalize/merge/save; a no-op by default
+        self.profiler = profiler if profiler is not None else NULL_PROFILER
+        # Overridable so benchmarks can point the crawler at a local stand-in
+        self.base_url = base_url.rstrip('/')
+        # Counters and histograms in Prometheus text format, rewritten at each save
+        self.metrics = CrawlMetrics()
+        self.metrics_file = "NSE_CRAWL_METRICS.prom"
+        # Per-request curl phase timings of the current run, summarised per profile
+        self.timings = TimingSummary()
+        self.timings_file = "NSE_REQUEST_TIMINGS.csv"
+        # One row per fetch attempt, flushed to part files at every checkpoint;
+        # fetch_method labels how the attempts were scheduled (crawl, refresh, daemon)
+        self.ledger = RunLedger("NSE_RUN_LEDGER")
+        self.fetch_method = 'single'
+        self.universe = universe
+        # Symbols that 404'd are skipped until their entry expires
+        self.missing = NegativeCache("NSE_MISSING_SYMBOLS.json", ttl_days=missing_ttl_days)
+        # Renamed tickers (ZOMATO -> ETERNAL) are fetched and stored under the current symbol
+        self.aliases = AliasResolver(redirect_file="NSE_SYMBOL_REDIRECTS.json")
+        # Fiscal-calendar staleness planner used by fetch_all_companies(refresh=True)
+        self.planner = RefreshPlanner("NSE_REFRESH_STATE.json")
+        # 2-4 seconds between requests, shared by one-shot runs and the daemon
+        self.limiter = RateLimiter(2, 4)
         self.master_file = "NSE_ALL_COMPANIES_FINANCIALS.csv"
+        self.derived_file = "NSE_ALL_COMPANIES_DERIVED.csv"
+        # Sorted per-symbol partitions; checkpoints rewrite only what changed.
+        # Out-of-core mode streams each company to disk and never holds the full frame;
+        # the derived, TTM, quality and long-format stores below follow the same mode.
+        self.out_of_core = out_of_core
+        self.store = SortedMasterStore("NSE_ALL_COMPANIES_FINANCIALS", in_memory=not out_of_core)
+        # Every distinct version of a row is kept as a delta, so restatements survive refreshes
+        self.history = FinancialHistory("NSE_FINANCIALS_HISTORY.csv")
+        # Field-level changes between crawls, for downstream incremental jobs
+        self.changes = ChangeFeed("NSE_FINANCIALS_CHANGES.csv")
+        self.last_changes = None
+        # Derived ratios cached per symbol, recomputed only when their inputs change
+        self.derived = DerivedMetricCache(self.derived_file, in_memory=not out_of_core)
+        # Quarterly statements and their trailing-twelve-month rollup
+        self.ttm = TTMRollup("NSE_ALL_COMPANIES_QUARTERLY.csv", "NSE_ALL_COMPANIES_TTM.csv",
+                             in_memory=not out_of_core)
+        # Rule-based checks on stored numbers, run in batches at each checkpoint
+        self.quality = QualityFlags("NSE_DATA_QUALITY_FLAGS.csv", in_memory=not out_of_core)
+        self.unvalidated = set()
+        # Percentile of every company per metric and fiscal year
+        self.ranks = RankEngine("NSE_PERCENTILES.npz")
+        self.unranked = set()
+        # Optional tidy copy (symbol, date, period, statement, metric_id, value)
+        self.long_store = (LongFormatStore("NSE_ALL_COMPANIES_LONG", in_memory=not out_of_core)
+                           if long_format else None)
+        # Export targets written concurrently from one batch, e.g. sinks=['parquet', 'sqlite']
+        base = os.path.splitext(self.master_file)[0]
+        extra = [make_sink(s, base) if isinstance(s, str) else s for s in (sinks or [])]
+        self.writer = MultiSinkWriter([CsvSink(self.master_file)] +
+                                      [s for s in extra if s.name != 'csv'])
         
-    def get_nse_symbols(self):
+    def get_nse_symbols(self, universe=None):
         """
-        Get list of all NSE symbols (excluding SME)
+        Get list of NSE symbols (excluding SME) for a named universe.
+        Lists live in universes/ and are cached between runs; see universe.py.
         """
-        # This is a subset - you can expand this list or fetch from NSE website
-        nse_symbols = [
-            "RELIANCE.NS", "HDFCBANK.NS", "BHARTIARTL.NS", "TCS.NS", "ICICIBANK.NS",
-            "SBIN.NS", "INFY.NS", "HINDUNILVR.NS", "LICI.NS", "BAJFINANCE.NS",
-            "ITC.NS", "LT.NS", "MARUTI.NS", "M&M.NS", "HCLTECH.NS",
-            "SUNPHARMA.NS", "KOTAKBANK.NS", "ULTRACEMCO.NS", "AXISBANK.NS", "NTPC.NS",
-            "TITAN.NS", "BAJAJFINSV.NS", "ETERNAL.NS", "DMART.NS", "HAL.NS",
-            "ONGC.NS", "ADANIPORTS.NS", "BEL.NS", "WIPRO.NS", "ADANIENT.NS",
-            "POWERGRID.NS", "JSWSTEEL.NS", "TATAMOTORS.NS", "BAJAJ-AUTO.NS", "ASIANPAINT.NS",
-            "INDIGO.NS", "COALINDIA.NS", "ADANIPOWER.NS", "NESTLEIND.NS", "JIOFIN.NS",
-            "HYUNDAI.NS", "TATASTEEL.NS", "IOC.NS", "TRENT.NS", "GRASIM.NS",
-            "DLF.NS", "SBILIFE.NS", "HINDZINC.NS", "VEDL.NS", "VBL.NS",
-            "HDFCLIFE.NS", "DIVISLAB.NS", "EICHERMOT.NS", "IRFC.NS", "HINDALCO.NS",
-            "PIDILITIND.NS", "LTIM.NS", "ADANIGREEN.NS", "TVSMOTOR.NS", "TECHM.NS",
-            "BAJAJHLDNG.NS", "AMBUJACEM.NS", "BPCL.NS", "BRITANNIA.NS", "SOLARINDS.NS",
-            "PFC.NS", "CIPLA.NS", "GODREJCP.NS", "CHOLAFIN.NS", "LODHA.NS",
-            "HDFCAMC.NS", "BANKBARODA.NS", "TORNTPHARM.NS", "TATAPOWER.NS", "PNB.NS",
-            "ENRIN.NS", "MAXHEALTH.NS", "SHRIRAMFIN.NS", "GAIL.NS", "BOSCHLTD.NS",
-            "APOLLOHOSP.NS", "SIEMENS.NS", "INDHOTEL.NS", "MAZDOCK.NS", "SHREECEM.NS",
-            "MUTHOOTFIN.NS", "ABB.NS", "CUMMINSIND.NS", "DRREDDY.NS", "TATACONSUM.NS",
-            "CGPOWER.NS", "POLYCAB.NS", "SWIGGY.NS", "MANKIND.NS", "DIXON.NS",
-            "ZYDUSLIFE.NS", "JINDALSTEL.NS", "IDBI.NS", "UNIONBANK.NS", "HEROMOTOCO.NS",
-            "MOTHERSON.NS", "RECLTD.NS", "CANBK.NS", "HAVELLS.NS", "ADANIENSOL.NS",
-            "INDUSTOWER.NS", "UNITDSPR.NS", "ICICIGI.NS", "BAJAJHFL.NS", "GMRAIRPORT.NS",
-            "MARICO.NS", "BSE.NS", "BHARTIHEXA.NS", "DABUR.NS", "JSWENERGY.NS",
-            "NAUKRI.NS", "ICICIPRULI.NS", "WAAREEENER.NS", "INDIANB.NS", "LUPIN.NS",
-            "POLICYBZR.NS", "POWERINDIA.NS", "SRF.NS", "NTPCGREEN.NS", "PERSISTENT.NS",
-            "HINDPETRO.NS", "PAYTM.NS", "IDEA.NS", "NHPC.NS", "SBICARD.NS",
-            "SUZLON.NS", "ASHOKLEY.NS", "OFSS.NS", "BHEL.NS", "ABCAPITAL.NS",
-            "UNOMINDA.NS", "IOB.NS", "PRESTIGE.NS", "GVT&D.NS", "COROMANDEL.NS",
-            "LLOYDSME.NS", "ATGL.NS", "VMM.NS", "FORTIS.NS", "RVNL.NS",
-            "ABBOTINDIA.NS", "OIL.NS", "GICRE.NS", "HDBFS.NS", "FACT.NS",
-            "NYKAA.NS", "JSL.NS", "PATANJALI.NS", "ALKEM.NS", "TORNTPOWER.NS",
-            "JSWINFRA.NS", "AUROPHARMA.NS", "BERGEPAINT.NS", "GODREJPROP.NS", "MRF.NS",
-            "NMDC.NS", "COLPAL.NS", "SCHAEFFLER.NS", "YESBANK.NS", "539533.NS",
-            "OBEROIRLTY.NS", "INDUSINDBK.NS", "TIINDIA.NS", "PIIND.NS", "COFORGE.NS",
-            "SUPREMEIND.NS", "IRCTC.NS", "MFSL.NS", "PHOENIXLTD.NS", "GODFRYPHLP.NS",
-            "AUBANK.NS", "BDL.NS", "MPHASIS.NS", "MOTILALOFS.NS", "SUNDARMFIN.NS",
-            "GLENMARK.NS", "BHARATFORG.NS", "LTF.NS", "UPL.NS", "JKCEMENT.NS",
-            "NAM-INDIA.NS", "LINDEINDIA.NS", "KALYANKJIL.NS", "BANKINDIA.NS", "PAGEIND.NS",
-            "AIIL.NS", "IDFCFIRSTB.NS", "ITCHOTELS.NS", "SAIL.NS", "HEXT.NS",
-            "UBL.NS", "BIOCON.NS", "FEDERALBNK.NS", "KRT.NS", "GLAXO.NS",
-            "ANTHEM.NS", "LAURUSLABS.NS", "LTTS.NS", "BALKRISIND.NS", "APLAPOLLO.NS",
-            "543225.NS", "TATACOMM.NS", "PREMIERENE.NS", "VOLTAS.NS", "COCHINSHIP.NS",
-            "360ONE.NS", "DALBHARAT.NS", "GODREJIND.NS", "PGHH.NS", "JUBLFOOD.NS",
-            "HUDCO.NS", "MAHABANK.NS", "KAYNES.NS", "IREDA.NS", "CONCOR.NS",
-            "PETRONET.NS", "MCX.NS", "ESCORTS.NS", "ENDURANCE.NS", "BLUESTARCO.NS",
-            "SJVN.NS", "RADICO.NS", "THERMAX.NS", "CRISIL.NS", "ASTRAL.NS",
-            "FLUOROCHEM.NS", "NH.NS", "KEI.NS", "MEDANTA.NS", "M&MFIN.NS",
-            "EMBASSY.NS", "POONAWALLA.NS", "UCOBANK.NS", "DELHIVERY.NS", "IPCALAB.NS",
-            "TATAINVEST.NS", "NATIONALUM.NS", "KPRMILL.NS", "CHOLAHLDNG.NS", "TATAELXSI.NS",
-            "COHANCE.NS", "3MINDIA.NS", "GODIGIT.NS", "EXIDEIND.NS", "ACC.NS",
-            "GILLETTE.NS", "AWL.NS", "HONAUT.NS", "KPITTECH.NS", "AJANTPHARM.NS",
-            "APARINDS.NS", "NLCINDIA.NS", "CENTRALBK.NS", "CDSL.NS", "GLAND.NS",
-            "NIACL.NS", "METROBRAND.NS", "ASTERDM.NS", "LICHSGFIN.NS", "KIMS.NS",
-            "GUJGASLTD.NS", "APOLLOTYRE.NS", "IGL.NS", "SUMICHEM.NS", "AIAENG.NS",
-            "GRSE.NS", "AEGISVOPAK.NS", "EMCURE.NS", "ITI.NS", "LALPATHLAB.NS",
-            "NBCC.NS", "SONACOMS.NS", "ZFCVINDIA.NS", "MSUMI.NS", "TATATECH.NS",
-            "BANDHANBNK.NS", "IKS.NS", "JBCHEPHARM.NS", "AFFLE.NS", "IRB.NS",
-            "PEL.NS", "SYNGENE.NS", "FORCEMOT.NS", "SHYAMMETL.NS", "FSL.NS",
-            "NHIT.NS", "STARHEALTH.NS", "EIHOTEL.NS", "KIOCL.NS", "PPLPHARMA.NS",
-            "MINDSPACE.NS", "NAVINFLUOR.NS", "EMAMILTD.NS", "544467.NS", "AEGISLOG.NS",
-            "ABSLAMC.NS", "RAMCOCEM.NS", "PFIZER.NS", "DEEPAKNTR.NS", "AMBER.NS",
-            "NUVAMA.NS", "BAYERCROP.NS", "INOXWIND.NS", "ERIS.NS", "TVSHLTD.NS",
-            "TATACHEM.NS", "BRIGADE.NS", "WOCKPHARMA.NS", "WELCORP.NS", "ANANDRATHI.NS",
-            "HSCL.NS", "HINDCOPPER.NS", "MANAPPURAM.NS", "NXST.NS", "TIMKEN.NS",
-            "CHALET.NS", "SUNTV.NS", "SKFINDIA.NS", "AADHARHFC.NS", "CHAMBLFERT.NS",
-            "ANGELONE.NS", "CREDITACC.NS", "KPIL.NS", "KEC.NS", "CESC.NS",
-            "MRPL.NS", "HBLENGINE.NS", "JYOTICNC.NS", "ONESOURCE.NS", "POLYMED.NS",
-            "ASAHIINDIA.NS", "OLAELEC.NS", "SAGILITY.NS", "PTCIL.NS", "KARURVYSYA.NS",
-            "JSWCEMENT.NS", "EIDPARRY.NS", "SARDAEN.NS", "DEVYANI.NS", "PNBHOUSING.NS",
-            "ECLERX.NS", "CROMPTON.NS", "ASTRAZEN.NS", "SUNDRMFAST.NS", "ABREL.NS",
-            "CASTROLIND.NS", "PSB.NS", "SCHNEIDER.NS", "KAJARIACER.NS", "JSWHL.NS",
-            "BIKAJI.NS", "HATSUN.NS", "BASF.NS", "FIRSTCRY.NS", "NAVA.NS",
-            "IIFL.NS", "DCMSHRIRAM.NS", "APLLTD.NS", "RPOWER.NS", "BIRET.NS",
-            "ATUL.NS", "KFINTECH.NS", "REDINGTON.NS", "CAMS.NS", "KANSAINER.NS",
-            "DEEPAKFERT.NS", "MANYAVAR.NS", "SAILIFE.NS", "ANANTRAJ.NS", "JMFINANCIL.NS",
-            "ZENSARTECH.NS", "ACMESOLAR.NS", "PARADEEP.NS", "CGCL.NS", "TECHNOE.NS",
-            "ARE&M.NS", "CONCORDBIO.NS", "MAHSCOOTER.NS", "CARBORUNIV.NS", "VINATIORGA.NS",
-            "CUBEINVIT.NS", "ABLBL.NS", "NEULANDLAB.NS", "GRINDWELL.NS", "UTIAMC.NS",
-            "VENTIVE.NS", "JUBLPHARMA.NS", "RATNAMANI.NS", "GSPL.NS", "FIVESTAR.NS",
-            "TRITURBINE.NS", "APTUS.NS", "BEML.NS", "WHIRLPOOL.NS", "PGEL.NS",
-            "CHOICEIN.NS", "CAPLIPOINT.NS", "CENTURYPLY.NS", "CRAFTSMAN.NS", "GABRIEL.NS",
-            "GPIL.NS", "TRAVELFOOD.NS", "NUVOCO.NS", "LMW.NS", "KIRLOSBROS.NS",
-            "SOBHA.NS", "VGUARD.NS", "IRCON.NS", "AFCONS.NS", "INDIAMART.NS",
-            "SIGNATURE.NS", "ELGIEQUIP.NS", "RBLBANK.NS", "NATCOPHARM.NS", "AKZOINDIA.NS",
-            "ATHERENERG.NS", "RAINBOW.NS", "NIVABUPA.NS", "CPPLUS.NS", "TBOTEK.NS",
-            "IGIL.NS", "TARIL.NS", "BLS.NS", "CUB.NS", "CIEINDIA.NS",
-            "DOMS.NS", "SWANENERGY.NS", "JBMA.NS", "GALLANTT.NS", "LTFOODS.NS",
-            "FINEORG.NS", "SPLPETRO.NS", "AGARWALEYE.NS", "SYRMA.NS", "GODREJAGRO.NS",
-            "IFCI.NS", "PCBL.NS", "TRIDENT.NS", "ABDL.NS", "DATAPATTNS.NS",
-            "JWL.NS", "KIRLOSENG.NS", "KSB.NS", "BATAINDIA.NS", "AARTIIND.NS",
-            "BLUEDART.NS", "THELEELA.NS", "ZENTEC.NS", "CYIENT.NS", "RRKABEL.NS",
-            "INTELLECT.NS", "HOMEFIRST.NS", "NCC.NS", "INDGN.NS", "GESHIP.NS",
-            "EMBDL.NS", "NETWEB.NS", "GMDCLTD.NS", "INDIGRID.NS", "LEMONTREE.NS",
-            "FINPIPE.NS", "ITDCEM.NS", "OLECTRA.NS", "JINDALSAW.NS", "MGL.NS",
-            "NEWGEN.NS", "CEATLTD.NS", "AAVAS.NS", "ELECON.NS", "ACE.NS",
-            "GRAVITA.NS", "IEX.NS", "FINCABLES.NS", "JPPOWER.NS", "BLUEJET.NS",
-            "JYOTHYLAB.NS", "ZYDUSWELL.NS", "BELRISE.NS", "TEGA.NS", "BBTC.NS",
-            "CLEAN.NS", "ANURAS.NS", "GRINFRA.NS", "MINDACORP.NS", "SBFC.NS",
-            "RITES.NS", "INGERRAND.NS", "SANOFI.NS", "id.NS", "PRUDENT.NS",
-            "VTL.NS", "SANOFICONR.NS", "BALRAMCHIN.NS", "ALIVUS.NS", "INDIACEM.NS",
-            "USHAMART.NS", "CELLO.NS", "CCL.NS", "ACUTAAS.NS", "BLACKBUCK.NS",
-            "TITAGARH.NS", "RELAXO.NS", "ZEEL.NS", "JUBLINGREA.NS", "SHRIPISTON.NS",
-            "NSLNISP.NS", "TTML.NS", "STARCEMENT.NS", "SUDARSCHEM.NS", "METROPOLIS.NS",
-            "CARTRADE.NS", "J&KBANK.NS", "RAILTEL.NS", "WELSPUNLIV.NS", "RELINFRA.NS",
-            "LLOYDSENT.NS", "IXIGO.NS", "GRANULES.NS", "WESTLIFE.NS", "GENUSPOWER.NS",
-            "JKLAKSHMI.NS", "TIMETECHNO.NS", "WAAREERTL.NS", "PVRINOX.NS", "EUREKAFORB.NS",
-            "ENGINERSIN.NS", "ALKYLAMINE.NS", "SUNDARMHLD.NS", "TEJASNET.NS", "HFCL.NS",
-            "SONATSOFTW.NS", "VESUVIUS.NS", "PGHL.NS", "SAFARI.NS", "BSOFT.NS",
-            "VIJAYA.NS", "SAPPHIRE.NS", "INOXINDIA.NS", "NAZARA.NS", "KRBL.NS",
-            "GRAPHITE.NS", "SHAKTIPUMP.NS", "RKFORGE.NS", "CANFINHOME.NS", "POWERMECH.NS",
-            "TRANSRAILL.NS", "NESCO.NS", "AZAD.NS", "KPIGREEN.NS", "MEDPLUS.NS",
-            "INDIASHLTR.NS", "AETHER.NS", "IIFLCAPS.NS", "SAMMAANCAP.NS", "RHIM.NS",
-            "ABFRL.NS", "SCI.NS", "BIRLACORPN.NS", "ASTRAMICRO.NS", "ASKAUTOLTD.NS",
-            "CHENNPETRO.NS", "SHAILY.NS", "WABAG.NS", "HONASA.NS", "OSWALPUMPS.NS",
-            "MMTC.NS", "EDELWEISS.NS", "HCG.NS", "HEG.NS", "DBREALTY.NS",
-            "LLOYDSENGG.NS", "SAREGAMA.NS", "532468.NS", "PRIVISCL.NS", "TI.NS",
-            "JAIBALAJI.NS", "MAPMYINDIA.NS", "JLHL.NS", "533095.NS", "LOTUSDEV.NS",
-            "TTKPRESTIG.NS", "KIRLFER.NS", "HAPPSTMNDS.NS", "PCJEWELLER.NS", "TCI.NS",
-            "ALOKINDS.NS", "JKTYRE.NS", "MAHSEAMLES.NS", "JSLL.NS", "HAPPYFORGE.NS",
-            "SHARDACROP.NS", "500123.NS", "LATENTVIEW.NS", "AVANTIFEED.NS", "RCF.NS",
-            "NETWORK18.NS", "TANLA.NS", "UJJIVANSFB.NS", "ACI.NS", "CERA.NS",
-            "BANCOINDIA.NS", "GMRP&UI.NS", "BECTORFOOD.NS", "VARROC.NS", "APOLLO.NS",
-            "STAR.NS", "BLUESTONE.NS", "MANORAMA.NS", "SHILPAMED.NS", "ESABINDIA.NS",
-            "THOMASCOOK.NS", "GSFC.NS", "PGINVIT.NS", "RUSTOMJEE.NS", "CAMPUS.NS",
-            "VOLTAMP.NS", "RELIGARE.NS", "KIRLPNU.NS", "TDPOWERSYS.NS", "BBOX.NS",
-            "DODLA.NS", "KALPATARU.NS", "MARKSANS.NS", "MASTEK.NS", "GALAXYSURF.NS",
-            "SANSERA.NS", "GARFIBRES.NS", "AJAXENGG.NS", "EPIGRAL.NS", "PNGJL.NS",
-            "PNCINFRA.NS", "GNFC.NS", "SOUTHBANK.NS", "LUMAXTECH.NS", "SFL.NS",
-            "DIACABS.NS", "DBL.NS", "ARVIND.NS", "FDC.NS", "EPL.NS",
-            "GPPL.NS", "TRIVENI.NS", "MAXESTATES.NS", "ISGEC.NS", "AKUMS.NS",
-            "PRAJIND.NS", "AARTIPHARM.NS", "TIPSMUSIC.NS", "BORORENEW.NS", "PRSMJOHNSN.NS",
-            "GANESHHOUC.NS", "ELLEN.NS", "RALLIS.NS", "MAHLIFE.NS", "AURIONPRO.NS",
-            "CMSINFO.NS", "MIDHANI.NS", "RTNINDIA.NS", "DHANUKA.NS", "MHRIL.NS",
-            "SANDUMA.NS", "RAYMONDLSL.NS", "BALUFORGE.NS", "ARVINDFASN.NS", "JUSTDIAL.NS",
-            "KOVAI.NS", "JKPAPER.NS", "REDTAPE.NS", "FISCHER.NS", "PURVA.NS",
-            "CHEMPLASTS.NS", "YATHARTH.NS", "SMLISUZU.NS", "BAJAJELEC.NS", "THANGAMAYL.NS",
-            "THYROCARE.NS", "TMB.NS", "MOIL.NS", "CSBBANK.NS", "514440.NS",
-            "ETHOSLTD.NS", "WELENT.NS", "GRWRHITECH.NS", "IONEXCHANG.NS", "SYMPHONY.NS",
-            "RTNPOWER.NS", "KTKBANK.NS", "SHREMINVIT.NS", "HGINFRA.NS", "JUNIPER.NS",
-            "AVL.NS", "AHLUCONT.NS", "QPOWER.NS", "HNDFDS.NS", "SURYAROSNI.NS",
-            "SWSOLAR.NS", "ELECTCAST.NS", "MANINFRA.NS", "STLTECH.NS", "SUPRAJIT.NS",
-            "RENUKA.NS", "PGIL.NS", "RATEGAIN.NS", "CRIZAC.NS", "SKIPPER.NS",
-            "GULFOILLUB.NS", "EMUDHRA.NS", "SENCO.NS", "EQUITASBNK.NS", "AGI.NS",
-            "ICRA.NS", "SHARDAMOTR.NS", "TIIL.NS", "IFBIND.NS", "V2RETAIL.NS",
-            "SHOPERSTOP.NS", "VIPIND.NS", "LXCHEM.NS", "504346.NS", "KSCL.NS",
-            "DATAMATICS.NS", "VMART.NS", "GREENLAM.NS", "KRN.NS", "JAYNECOIND.NS",
-            "542543.NS", "SUNTECK.NS", "AVALON.NS", "BANSALWIRE.NS", "PICCADIL.NS",
-            "MASFIN.NS", "SUBROS.NS", "TEXRAIL.NS", "TVSSCS.NS", "KNRCON.NS",
-            "WEBELSOLAR.NS", "SMARTWORKS.NS", "RSYSTEMS.NS", "PTC.NS", "ZAGGLE.NS",
-            "PILANIINVS.NS", "ROUTE.NS", "531201.NS", "GHCL.NS", "GMMPFAUDLR.NS",
-            "PRICOLLTD.NS", "NACLIND.NS", "UNIMECH.NS", "AXISCADES.NS", "PARAS.NS",
-            "RAJESHEXPO.NS", "INOXGREEN.NS", "INDIGOPNTS.NS", "RESPONIND.NS", "INNOVACAP.NS",
-            "SUPRIYA.NS", "ENTERO.NS", "SIS.NS", "FEDFINA.NS", "KINGFA.NS",
-            "FIEMIND.NS", "GOKEX.NS", "543620.NS", "INFIBEAM.NS", "SUNFLAG.NS",
-            "500307.NS", "ASHOKA.NS", "JSFB.NS", "INDIAGLYCO.NS", "SPICEJET.NS",
-            "BALAMINES.NS", "EMIL.NS", "509732.NS", "SUVEN.NS", "OPTIEMUS.NS",
-            "INDUSINVIT.NS", "SWARAJENG.NS", "TARC.NS", "HUBTOWN.NS", "ICIL.NS",
-            "RAIN.NS", "JKIL.NS", "REFEX.NS", "VRLLOG.NS", "MCLOUD.NS",
-            "506854.NS", "HCC.NS", "GOKULAGRO.NS", "ORIENTCEM.NS", "CARERATING.NS",
-            "GREAVESCOT.NS", "HEIDELBERG.NS", "GAEL.NS", "NFL.NS", "JCHAC.NS",
-            "ORIANA.NS", "STYRENIX.NS", "DBCORP.NS", "E2E.NS", "SPARC.NS",
-            "PFOCUS.NS", "INDIQUBE.NS", "BANARISUG.NS", "EIEL.NS", "GOPAL.NS",
-            "ITDC.NS", "VSTIND.NS", "RBA.NS", "SAMHI.NS", "VSTTILLERS.NS",
-            "IMFA.NS", "MTARTECH.NS", "KENNAMET.NS", "CUPID.NS", "NIITMTS.NS",
-            "543971.NS", "ASHAPURMIN.NS", "ORIENTELEC.NS", "ANUP.NS", "PDSL.NS",
-            "508486.NS", "CIGNITITEC.NS", "526433.NS", "SKYGOLD.NS", "NDRINVIT.NS",
-            "DCAL.NS", "512329.NS", "AARTIDRUGS.NS", "63MOONS.NS", "SEQUENT.NS",
-            "DYNAMATECH.NS", "HERITGFOOD.NS", "GUJTHEM.NS", "SANATHAN.NS", "MARATHON.NS",
-            "MANGCHEFER.NS", "CEIGALL.NS", "SHANTIGEAR.NS", "EBGNG.NS", "505872.NS",
-            "NPST.NS", "BHARATRAS.NS", "RAYMONDREL.NS", "CAMLINFINE.NS", "SJS.NS",
-            "GUJALKALI.NS", "AWFIS.NS", "RAYMOND.NS", "GRAUWEIL.NS", "INDRAMEDCO.NS",
-            "UEL.NS", "FOSECOIND.NS", "LGBBROSLTD.NS", "CENTUM.NS", "JAMNAAUTO.NS",
-            "NORTHARC.NS", "WONDERLA.NS", "GOLDIAM.NS", "RAMKY.NS", "QUESS.NS",
-            "JUBLCPL.NS", "DHANI.NS", "ORCHPHARMA.NS", "BOROLTD.NS", "AVANTEL.NS",
-            "KIRLOSIND.NS", "501421.NS", "KOLTEPATIL.NS", "MEDIASSIST.NS", "GREENPLY.NS",
-            "LUXIND.NS", "UFLEX.NS", "HEMIPROP.NS", "RPGLIFE.NS", "DCBBANK.NS",
-            "ROLEXRINGS.NS", "SINDHUTRAD.NS", "544005.NS", "BALMLAWRIE.NS", "GUFICBIO.NS",
-            "NEOGEN.NS", "MBAPL.NS", "HARSHA.NS", "GOCOLORS.NS", "GOODLUCK.NS",
-            "PRINCEPIPE.NS", "BOMDYEING.NS", "KITEX.NS", "MPSLTD.NS", "EPACK.NS",
-            "GANECOS.NS", "ZOTA.NS", "JTEKTINDIA.NS", "KSL.NS", "HLEGLAS.NS",
-            "SAMBHV.NS", "SUNCLAY.NS", "504882.NS", "SGLTL.NS", "IRBINVIT.NS",
-            "DPABHUSHAN.NS", "INDOSTAR.NS", "WSTCSTPAPR.NS", "JINDWORLD.NS", "BHAGCHEM.NS",
-            "KRISHANA.NS", "VAIBHAVGBL.NS", "UNICHEMLAB.NS", "AJMERA.NS", "GLOBUSSPR.NS",
-            "VADILALIND.NS", "PITTIENG.NS", "LUMAXIND.NS", "JISLJALEQS.NS", "CYIENTDLM.NS",
-            "SEITINVIT.NS", "DEEPINDS.NS", "PRABHA.NS", "ROSSARI.NS", "ADVENZYMES.NS",
-            "VISHNU.NS", "NSIL.NS", "INTERARCH.NS", "PENIND.NS", "NAVNETEDUL.NS",
-            "GATEWAY.NS", "538734.NS", "JASH.NS", "SAGCEM.NS", "ARKADE.NS",
-            "POCL.NS", "IMAGICAA.NS", "SHAREINDIA.NS", "PROTEAN.NS", "SSWL.NS",
-            "EFCIL.NS", "SENORES.NS", "526125.NS", "PARKHOTELS.NS", "FLAIR.NS",
-            "DDEVPLSTIK.NS", "BCG.NS", "MOSCHIP.NS", "ROADSTAR.NS", "BBL.NS",
-            "BAJAJCON.NS", "ALLCARGO.NS", "GREENPANEL.NS", "PATELENG.NS", "MAHLOG.NS",
-            "ARTEMISMED.NS", "EVEREADY.NS", "POLYPLEX.NS", "BRIGHOTEL.NS", "RAMRAT.NS",
-            "517467.NS", "SUNDROP.NS", "HIKAL.NS", "PRECWIRE.NS", "KKCL.NS",
-            "MAITHANALL.NS", "ASHIANA.NS", "SHK.NS", "MSTCLTD.NS", "BFUTILITIE.NS",
-            "EASEMYTRIP.NS", "TCPLPACK.NS", "HPL.NS", "DIGITIDE.NS", "TEAMLEASE.NS",
-            "KDDL.NS", "EMSLIMITED.NS", "DALMIASUG.NS", "NOCIL.NS", "SBCL.NS",
-            "ALPEXSOLAR.NS", "RPSGVENT.NS", "542727.NS", "POKARNA.NS", "DCXINDIA.NS",
-            "KPEL.NS", "SAKSOFT.NS", "KIRIINDUS.NS", "SANGHVIMOV.NS", "FMGOETZE.NS",
-            "ORISSAMINE.NS", "PRAKASH.NS", "HONDAPOWER.NS", "TIRUMALCHM.NS", "SERVOTECH.NS",
-            "FCL.NS", "AGIIL.NS", "JTLIND.NS", "VIMTALABS.NS", "SIYSIL.NS",
-            "GIPCL.NS", "MTNL.NS", "STYLAMIND.NS", "544291.NS", "NRBBEARING.NS",
-            "ARVSMART.NS", "544150.NS", "500414.NS", "KALAMANDIR.NS", "VEEDOL.NS",
-            "NITCO.NS", "WINDMACHIN.NS", "TFCILTD.NS", "PREMEXPLN.NS", "SOTL.NS",
-            "NUCLEUS.NS", "522101.NS", "IOLCP.NS", "SOLARA.NS", "LAOPALA.NS",
-            "HIRECT.NS", "PARAGMILK.NS", "PSPPROJECT.NS", "SDBL.NS", "PAISALO.NS",
-            "RPEL.NS", "TAJGVK.NS", "COSMOFIRST.NS", "BAJAJHIND.NS", "ALEMBICLTD.NS",
-            "RAMCOIND.NS", "SANDHAR.NS", "MBEL.NS", "503681.NS", "539895.NS",
-            "MUTHOOTMF.NS", "AUTOAXLES.NS", "BEPL.NS", "MOLDTKPAC.NS", "TCIEXP.NS",
-            "MANINDS.NS", "514446.NS", "VENUSPIPES.NS", "MOREPENLAB.NS", "SABTNL.NS",
-            "534535.NS", "HINDWAREAP.NS", "KCP.NS", "INDOCO.NS", "MONARCH.NS",
-            "HATHWAY.NS", "IPL.NS", "KRSNAA.NS", "UNIVCABLES.NS", "CAPACITE.NS",
-            "ADFFOODS.NS", "ROSSTECH.NS", "TATVA.NS", "PFS.NS", "SIRCA.NS",
-            "GEPIL.NS", "526783.NS", "RELTD.NS", "HGS.NS", "XPROINDIA.NS",
-            "GENESYS.NS", "TASTYBITE.NS", "PANACEABIO.NS", "ORIENTHOT.NS", "CARRARO.NS",
-            "523606.NS", "VSSL.NS", "SHANKARA.NS", "CARYSIL.NS", "INSECTICID.NS",
-            "RML.NS", "EIHAHOTELS.NS", "STYLEBAAZA.NS", "NDRAUTO.NS", "MARINE.NS",
-            "MAYURUNIQ.NS", "FILATEX.NS", "SUMMITSEC.NS", "NILKAMAL.NS", "SIMPLEXINF.NS",
-            "SEAMECLTD.NS", "LANDMARK.NS", "UTKARSHBNK.NS", "AEROFLEX.NS", "SCILAL.NS",
-            "NOVARTIND.NS", "BAJEL.NS", "FUSION.NS", "REPCOHOME.NS", "JINDALPOLY.NS",
-            "YATRA.NS", "544224.NS", "DELTACORP.NS", "SPECTRUM.NS", "GRMOVER.NS",
-            "500147.NS", "JAICORPLTD.NS", "SPIC.NS", "GOODYEAR.NS", "ANZEN.NS",
-            "DCW.NS", "STOVEKRAFT.NS", "STEELCAS.NS", "FINOPB.NS", "HINDOILEXP.NS",
-            "DIAMONDYD.NS", "TVSSRICHAK.NS", "505504.NS", "VERANDA.NS", "SASKEN.NS",
-            "SULA.NS", "MOL.NS", "RANEHOLDIN.NS", "CANTABIL.NS", "526570.NS",
-            "ALLTIME.NS", "ACCELYA.NS", "SGFIN.NS", "DYCL.NS", "IDEAFORGE.NS",
-            "CAPINVIT.NS", "VENKEYS.NS", "SHALBY.NS", "DOLLAR.NS", "WINDLAS.NS",
-            "SMSPHARMA.NS", "YASHO.NS", "KICL.NS", "THEJO.NS", "SEPC.NS",
-            "GEOJITFSL.NS", "KMEW.NS", "DIVGIITTS.NS", "500365.NS", "543230.NS",
-            "AMRUTANJAN.NS", "HMT.NS", "UDAICEMENT.NS", "PANAMAPET.NS", "EXICOM.NS",
-            "532485.NS", "505725.NS", "APCOTEXIND.NS", "SOMANYCERA.NS", "500068.NS",
-            "WENDT.NS", "ASALCBR.NS", "SPANDANA.NS", "UGROCAP.NS", "512068.NS",
-            "VINCOFE.NS", "GARUDA.NS", "INDOTHAI.NS", "MOTISONS.NS", "MANGLMCEM.NS",
-            "SPMLINFRA.NS", "SWANDEF.NS", "INDIANHUME.NS", "IFGLEXPOR.NS", "LAXMIDENTL.NS",
-            "INDOTECH.NS", "BETA.NS", "GTLINFRA.NS", "ASTEC.NS", "MUKANDLTD.NS",
-            "522195.NS", "NITINSPIN.NS", "DEEDEV.NS", "NELCO.NS", "RPTECH.NS",
-            "UNITECH.NS", "GOCLCORP.NS", "JYOTISTRUC.NS", "PIXTRANS.NS", "PNBGILTS.NS",
-            "JGCHEM.NS", "APOLLOPIPE.NS", "500306.NS", "RAJOOENG.NS", "VIDHIING.NS",
-            "UNIPARTS.NS", "DANISH.NS", "VPRPL.NS", "532742.NS", "WHEELS.NS",
-            "TIL.NS", "NAVKARCORP.NS", "MSPL.NS", "HESTERBIO.NS", "SPAL.NS",
-            "INDNIPPON.NS", "RMDRIP.NS", "JINDRILL.NS", "539921.NS", "SANGAMIND.NS",
-            "519477.NS", "VINDHYATEL.NS", "MOBIKWIK.NS", "BFINVEST.NS", "MASTERTR.NS",
-            "SESHAPAPER.NS", "KERNEX.NS", "544037.NS", "UDS.NS", "HITECH.NS",
-            "DOLPHIN.NS", "ECOSMOBLTY.NS", "WEL.NS", "WAAREEINDO.NS", "DEN.NS",
-            "STANLEY.NS", "540717.NS", "512038.NS", "NIBE.NS", "DREDGECORP.NS",
-            "PRECAM.NS", "IKIO.NS", "TARSONS.NS", "523105.NS", "517035.NS",
-            "SANGHIIND.NS", "JNKINDIA.NS", "ARIHANTSUP.NS", "526506.NS", "INFOBEAN.NS",
-            "GREENPOWER.NS", "BLISSGVS.NS", "DLINKINDIA.NS", "AWHCL.NS", "543542.NS",
-            "QUICKHEAL.NS", "539682.NS", "SHANTIGOLD.NS", "EXPLEOSOL.NS", "HUHTAMAKI.NS",
-            "BLKASHYAP.NS", "OMAXE.NS", "TALBROAUTO.NS", "RAJRATAN.NS", "CONFIPET.NS",
-            "ANDHRAPAP.NS", "TTKHLTCARE.NS", "SURAKSHA.NS", "RAMCOSYS.NS", "RISHABH.NS",
-            "QUADFUTURE.NS", "ZUARI.NS", "ASIANENE.NS", "SYNCOMF.NS", "BLSE.NS",
-            "RAMASTEEL.NS", "EKC.NS", "JAGSNPHARM.NS", "CENTRUM.NS", "EXCELINDUS.NS",
-            "RUPA.NS", "JAGRAN.NS", "ADOR.NS", "HMAAGRO.NS", "HIMATSEIDE.NS",
-            "ROTO.NS", "512267.NS", "542866.NS", "IGARASHI.NS", "VINYAS.NS",
-            "DAMCAPITAL.NS", "SURAJEST.NS", "GMBREW.NS", "512020.NS", "SHREDIGCEM.NS",
-            "523475.NS", "MMFL.NS", "NIITLTD.NS", "SATIN.NS", "SIGNPOST.NS",
-            "514448.NS", "HARIOMPIPE.NS", "PLATIND.NS", "SANSTAR.NS", "508954.NS",
-            "ESAFSFB.NS", "SHRIRAMPPS.NS", "DECCANCE.NS", "HERANBA.NS", "BSHSL.NS",
-            "LGHL.NS", "GPTINFRA.NS", "SALZERELEC.NS", "TINNARUBR.NS", "540718.NS",
-            "GANDHAR.NS", "ARMANFIN.NS", "MADRASFERT.NS", "ALLDIGI.NS", "504000.NS",
-            "543953.NS", "CLSEL.NS", "543597.NS", "MANAKCOAT.NS", "PUNJABCHEM.NS",
-            "543766.NS", "530927.NS", "506685.NS", "PARACABLES.NS", "SOLEX.NS",
-            "BIRLANU.NS", "543590.NS", "523862.NS", "UNIECOM.NS", "NELCAST.NS",
-            "DOLATALGO.NS", "RAJRILTD.NS", "SPORTKING.NS", "ASIANTILES.NS", "SMCGLOBAL.NS",
-            "MUFIN.NS", "DCMSRIND.NS", "IGPL.NS", "BAJAJHCARE.NS", "ALICON.NS",
-            "543920.NS", "ROHLTD.NS", "INDORAMA.NS", "507753.NS", "AIMTRON.NS",
-            "ANDREWYU.NS", "HEUBACHIND.NS", "PDMJEPAPER.NS", "WCIL.NS", "CIFL.NS",
-            "CAPITALSFB.NS", "GODAVARIB.NS", "DIFFNKG.NS", "RIIL.NS", "SAURASHCEM.NS",
-            "544310.NS", "GNA.NS", "BUTTERFLY.NS", "SALASAR.NS", "WEALTH.NS",
-            "SURYODAY.NS", "GTPL.NS", "KROSS.NS", "C2C.NS", "BGRENERGY.NS",
-            "YUKEN.NS", "ORIENTTECH.NS", "IMPAL.NS", "543619.NS", "539607.NS",
-            "DSSL.NS", "EIMCOELECO.NS", "505036.NS", "VILAS.NS", "TBZ.NS",
-            "GPTHEALTH.NS", "RICOAUTO.NS", "AMNPLST.NS", "KELLTONTEC.NS", "530245.NS",
-            "CONTROLPR.NS", "BHARATWIRE.NS", "BOROSCI.NS", "WALCHANNAG.NS", "RGL.NS",
-            "DHARMAJ.NS", "543928.NS", "AURUM.NS", "TEXINFRA.NS", "ABINFRA.NS",
-            "GRPLTD.NS", "REGAAL.NS", "539469.NS", "VHL.NS", "BCLIND.NS",
-            "ATULAUTO.NS", "538668.NS", "FLYSBS.NS", "SIGACHI.NS", "509438.NS",
-            "532067.NS", "PROSTARM.NS", "BLUSPRING.NS", "DVL.NS", "MONTECARLO.NS",
-            "ARISINFRA.NS", "DPSCLTD.NS", "AGARIND.NS", "SUMEETINDS.NS", "540980.NS",
-            "ONEPOINT.NS", "PENINLAND.NS", "BAJAJINDEF.NS", "CEWATER.NS", "HITECHGEAR.NS",
-            "MICEL.NS", "VMARCIND.NS", "TNPL.NS", "STALLION.NS", "SWELECTES.NS",
-            "VASCONEQ.NS", "KOKUYOCMLN.NS", "SSEGL.NS", "ICEMAKE.NS", "STERTOOLS.NS",
-            "530643.NS", "501298.NS", "524520.NS", "RADHIKAJWE.NS", "ARIHANTCAP.NS",
-            "MATRIMONY.NS", "531381.NS", "IRMENERGY.NS", "FAZE3Q.NS", "531847.NS",
-            "MAXIND.NS", "MANALIPETC.NS", "STEELXIND.NS", "INDOAMIN.NS", "KARNIKA.NS",
-            "OAL.NS", "521238.NS", "5PAISA.NS", "AVTNPL.NS", "506597.NS",
-            "AFSL.NS", "BIL.NS", "INDOFARM.NS", "BALAJITELE.NS", "REMUS.NS",
-            "AYMSYNTEX.NS", "CENTENKA.NS", "GGBL.NS", "531859.NS", "OSWALAGRO.NS",
-            "TAC.NS", "GANESHIN.NS", "LINCOLN.NS", "500264.NS", "542669.NS",
-            "531637.NS", "KRISHNADEF.NS", "SRM.NS", "UNIENTER.NS", "RACLGEAR.NS",
-            "OSWALGREEN.NS", "PASHUPATI.NS", "515043.NS", "GALAPREC.NS", "SHREEPUSHK.NS",
-            "ETL.NS", "504092.NS", "ANDHRSUGAR.NS", "SAHANA.NS", "FAIRCHEMOR.NS",
-            "DHANBANK.NS", "SCODATUBES.NS", "DENTA.NS", "ESTER.NS", "522229.NS",
-            "524632.NS", "539997.NS", "BARBEQUE.NS", "CREST.NS", "GANDHITUBE.NS",
-            "INNOVANA.NS", "GKWLIMITED.NS", "ELECTHERM.NS", "GULPOLY.NS", "KUANTUM.NS",
-            "508807.NS", "KHAICHEM.NS", "BASILIC.NS", "SRHHYPOLTD.NS", "MEGASOFT.NS",
-            "BIRLAMONEY.NS", "OMINFRAL.NS", "AEROENTER.NS", "UTTAMSUGAR.NS", "TECHLABS.NS",
-            "MAMATA.NS", "538451.NS", "KOTHARIPET.NS", "512229.NS", "ZUARIIND.NS",
-            "DENTALKART.NS", "HEXATRADEX.NS", "538992.NS", "LIKHITHA.NS", "539956.NS",
-            "CHEMFAB.NS", "505163.NS", "531357.NS", "APS.NS", "EVERESTIND.NS",
-            "MVGJL.NS", "NCLIND.NS", "523160.NS", "507944.NS", "XCHANGING.NS",
-            "ESFL.NS", "SARVESHWAR.NS", "VALIANTORG.NS", "509960.NS", "512233.NS",
-            "506808.NS", "IZMO.NS", "KRISHIVAL.NS", "VAKRANGEE.NS", "TNPETRO.NS",
-            "DISHTV.NS", "CREATIVE.NS", "506414.NS", "532467.NS", "WANBURY.NS",
-            "OSELDEVICE.NS", "539018.NS", "SUYOG.NS", "541096.NS", "532323.NS",
-            "SARTELE.NS", "GICHSGFIN.NS", "JPASSOCIAT.NS", "KABRAEXTRU.NS", "SAFEENTP.NS",
-            "KRYSTAL.NS", "SANDESH.NS", "THEMISMED.NS", "NDTV.NS", "507836.NS",
-            "ACLGATI.NS", "SKMEGGPROD.NS", "504132.NS", "JAYBARMARU.NS", "TEMBO.NS",
-            "ELIN.NS", "ARROWGREEN.NS", "SBC.NS", "COFFEEDAY.NS", "511628.NS",
-            "KODYTECH.NS", "ABCOTS.NS", "ADSL.NS", "BLAL.NS", "540358.NS",
-            "MONOLITH.NS", "543931.NS", "TVTODAY.NS", "SNOWMAN.NS", "SILVERTUC.NS",
-            "COOLCAPS.NS", "NGLFINE.NS", "CCCL.NS", "PRIMESECU.NS", "JINDALPHOT.NS",
-            "544186.NS", "ANUHPHR.NS", "519152.NS", "DHUNINV.NS", "MUNJALAU.NS",
-            "KAMATHOTEL.NS", "531035.NS", "BESTAGRO.NS", "SATIA.NS", "SARLAPOLY.NS",
-            "507155.NS", "SVLL.NS", "SGIL.NS", "LEMERITE.NS", "AVADHSUGAR.NS",
-            "522122.NS", "543709.NS", "SASTASUNDR.NS", "BIGBLOC.NS", "544296.NS",
-            "538772.NS", "512453.NS", "533477.NS", "BHARATSE.NS", "505358.NS",
-            "DHAMPURSUG.NS", "SELAN.NS", "532016.NS", "OWAIS.NS", "538119.NS",
-            "531359.NS", "DMCC.NS", "BODALCHEM.NS", "STEL.NS", "RAJPALAYAM.NS",
-            "MUFTI.NS", "NINSYS.NS", "THEINVEST.NS", "INDOBORAX.NS", "20MICRONS.NS",
-            "AMBIKCO.NS", "543828.NS", "506687.NS", "ORICONENT.NS", "PVSL.NS",
-            "CHEMCON.NS", "MACPOWER.NS", "544354.NS", "511702.NS", "OBSCP.NS",
-            "VLSFINANCE.NS", "LINC.NS", "TREL.NS", "BHAGERIA.NS", "MUKKA.NS",
-            "RATNAVEER.NS", "VHLTD.NS", "513536.NS", "FOCE.NS", "GIRIRAJ.NS",
-            "ENIL.NS", "532011.NS", "MAGADSUGAR.NS", "HLVLTD.NS", "DREAMFOLKS.NS",
-            "RITCO.NS", "ASAL.NS", "KECL.NS", "PPL.NS", "RKSWAMY.NS",
-            "NAHARSPING.NS", "VISHAL.NS", "KAMDHENU.NS", "UNITEDPOLY.NS", "507912.NS",
-            "TVSELECT.NS", "SHIVALIK.NS", "ZEEMEDIA.NS", "KSOLVES.NS", "512014.NS",
-            "519421.NS", "VIVIANA.NS", "RUBYMILLS.NS", "RNFI.NS", "KOPRAN.NS",
-            "GHCLTEXTIL.NS", "506532.NS", "JPOLYINVST.NS", "542012.NS", "544458.NS",
-            "540737.NS", "MALLCOM.NS", "523850.NS", "IFBAGRO.NS", "VISAKAIND.NS",
-            "JITFINFRA.NS", "GEECEE.NS", "538716.NS", "ZTECH.NS", "500240.NS",
-            "MIRCELECTR.NS", "DWARKESH.NS", "522650.NS", "ACL.NS", "APTECHT.NS",
-            "543831.NS", "TEJASCARGO.NS", "GLOSTERLTD.NS", "ONWARDTEC.NS", "SUBEXLTD.NS",
-            "STCINDIA.NS", "PAKKA.NS", "539195.NS", "SAKAR.NS", "NBIFIN.NS",
-            "CHEVIOT.NS", "523411.NS", "543895.NS", "JAYAGROGN.NS", "MMP.NS",
-            "530499.NS", "CELLECOR.NS", "LAXMIINDIA.NS", "APEX.NS", "IGCL.NS",
-            "RSWM.NS", "530845.NS", "KRITI.NS", "ACCENTMIC.NS", "ELDEHSG.NS",
-            "526775.NS", "INDSWFTLAB.NS", "IRIS.NS", "URJA.NS", "NAHARPOLY.NS",
-            "EMAMIPAP.NS", "GPECO.NS", "MENONBE.NS", "533285.NS", "543378.NS",
-            "532893.NS", "CSLFINANCE.NS", "MANBA.NS", "SCHAND.NS", "HINDCOMPOS.NS",
-            "ATL.NS", "543363.NS", "VERTOZ.NS", "544406.NS", "OCCLLTD.NS",
-            "HILINFRA.NS", "REPRO.NS", "SBGLP.NS", "GFLLIMITED.NS", "GANESHBE.NS",
-            "KILITCH.NS", "SHREERAMA.NS", "542670.NS", "544451.NS", "543787.NS",
-            "SAHASRA.NS", "VENUSREM.NS", "HARDWYN.NS", "PARSVNATH.NS", "RUSHIL.NS",
-            "NRAIL.NS", "FOODSIN.NS", "512025.NS", "544272.NS", "509525.NS",
-            "PRIMO.NS", "MBLINFRA.NS", "ASIANHOTNR.NS", "FOCUS.NS", "543324.NS",
-            "539594.NS", "SICALLOG.NS", "HMVL.NS", "531771.NS", "RADIANTCMS.NS",
-            "MINDTECK.NS", "KRONOX.NS", "542721.NS", "CLEDUCATE.NS", "502958.NS",
-            "ALLETEC.NS", "ORIENTPPR.NS", "PROZONER.NS", "522134.NS", "519003.NS",
-            "TOLINS.NS", "DBEIL.NS", "TPLPLASTEH.NS", "DIGISPICE.NS", "504605.NS",
-            "PAVNAIND.NS", "SURAJLTD.NS", "SUTLEJTEX.NS", "PRECOT.NS", "SJLOGISTIC.NS",
-            "RPPINFRA.NS", "530129.NS", "SILINV.NS", "SHALPAINTS.NS", "BAHETI.NS",
-            "ZODIAC.NS", "CONSOFINVT.NS", "IRISDOREME.NS", "544347.NS", "517166.NS",
-            "SPECIALITY.NS", "539730.NS", "PYRAMID.NS", "HTMEDIA.NS", "539300.NS",
-            "ADVANIHOTR.NS", "540652.NS", "ATMASTCO.NS", "523558.NS", "AVONMORE.NS",
-            "EIFFL.NS", "KNAGRI.NS", "504176.NS", "526586.NS", "514238.NS",
-            "515008.NS", "MEGATHERM.NS", "537750.NS", "526530.NS", "530163.NS",
-            "EUROBOND.NS", "BORANA.NS", "515147.NS", "TRANSWORLD.NS", "GUJAPOLLO.NS",
-            "MAZDA.NS", "505232.NS", "ARFIN.NS", "MAHASTEEL.NS", "MUNJALSHOW.NS",
-            "SEJALLTD.NS", "542770.NS", "KAYA.NS", "SAHAJSOLAR.NS", "EMAMIREAL.NS",
-            "526407.NS", "ARIES.NS", "GCHOTELS.NS", "DBOL.NS", "MWL.NS",
-            "CHANDAN.NS", "504240.NS", "508929.NS", "TARACHAND.NS", "VINSYS.NS",
-            "MOS.NS", "543539.NS", "ONMOBILE.NS", "COMSYN.NS", "ANNAPURNA.NS",
-            "540730.NS", "INTLCONV.NS", "MAANALU.NS", "502865.NS", "531537.NS",
-            "DICIND.NS", "RBZJEWEL.NS", "EMKAY.NS", "CHEMBONDCH.NS", "TRACXN.NS",
-            "NILASPACES.NS", "LIBERTSHOE.NS", "BELLACASA.NS", "504731.NS", "500298.NS",
-            "CGRAPHICS.NS", "MODISONLTD.NS", "SPENCERS.NS", "URAVIDEF.NS", "THOMASCOTT.NS",
-            "531694.NS", "SUKHJITS.NS", "SREEL.NS", "531910.NS", "544434.NS",
-            "PTL.NS", "SHRIAHIMSA.NS", "543373.NS", "SOFTTECH.NS", "PVP.NS",
-            "MGEL.NS", "HIGREEN.NS", "RAMAPHO.NS", "PREMIERPOL.NS", "513511.NS",
-            "EFFWA.NS", "523710.NS", "544332.NS", "522004.NS", "514330.NS",
-            "GVKPIL.NS", "HERCULES.NS", "530477.NS", "RHL.NS", "514183.NS",
-            "MANORG.NS", "513361.NS", "541358.NS", "ORBTEXP.NS", "HCL-INSYS.NS",
-            "544435.NS", "VRAJ.NS", "NAHARCAP.NS", "524731.NS", "512361.NS",
-            "SUPREMEPWR.NS", "KRITINUT.NS", "531652.NS", "DYNPRO.NS", "DONEAR.NS",
-            "SRD.NS", "VINYLINDIA.NS", "ABSMARINE.NS", "TIRUPATI.NS", "AARON.NS",
-            "SINCLAIR.NS", "MVKAGRO.NS", "526721.NS", "SRGHFL.NS", "KAPSTON.NS",
-            "CYBERTECH.NS", "517449.NS", "PLASTIBLEN.NS", "GENUSPAPER.NS", "ESSARSHPNG.NS",
-            "S&SPOWER.NS", "504959.NS", "NRL.NS", "FRESHARA.NS", "PATILAUTOM.NS",
-            "NOVAAGRI.NS", "514316.NS", "532829.NS", "NDL.NS", "ASHIMASYN.NS",
-            "LORDSCHLO.NS", "BIRLACABLE.NS", "GSLSU.NS", "541741.NS", "PARIN.NS",
-            "RAMANEWS.NS", "KANPRPLA.NS", "JAYBEE.NS", "DAVANGERE.NS", "GLOBECIVIL.NS",
-            "NAHARINDUS.NS", "539528.NS", "UTSSAV.NS", "TIRUPATIFL.NS", "KOTHARIPRO.NS",
-            "522017.NS", "HINDMOTORS.NS", "504786.NS", "MAHEPC.NS", "MEDICAMEQ.NS",
-            "532329.NS", "WSI.NS", "536264.NS", "VALIANTLAB.NS", "519397.NS",
-            "544001.NS", "RCOM.NS", "UGARSUGAR.NS", "RBMINFRA.NS", "543782.NS",
-            "PANSARI.NS", "ALBERTDAVD.NS", "539834.NS", "MANAKSIA.NS", "ORIENTCER.NS",
-            "MUTHOOTCAP.NS", "535667.NS", "MIRZAINT.NS", "526159.NS", "DENORA.NS",
-            "RUCHIRA.NS", "MOLDTECH.NS", "541701.NS", "BEDMUTHA.NS", "505729.NS",
-            "526179.NS", "AVPINFRA.NS", "544346.NS", "543497.NS", "500012.NS",
-            "514010.NS", "531889.NS", "530145.NS", "538446.NS", "544219.NS",
-            "SUMIT.NS", "FILATFASH.NS", "KHADIM.NS", "PCCL.NS", "BANSWRAS.NS",
-            "512393.NS", "NILAINFRA.NS", "HPAL.NS", "AARVEEDEN.NS", "INFOLLION.NS",
-            "XTGLOBAL.NS", "PHANTOMFX.NS", "500166.NS", "FCSSOFT.NS", "506528.NS",
-            "BBTCL.NS", "VGINFOTECH.NS", "SIGMA.NS", "GINNIFILA.NS", "OILCOUNTUB.NS",
-            "524444.NS", "REMSONSIND.NS", "VIKASLIFE.NS", "SHIVAUM.NS", "PELATRO.NS",
-            "VARDMNPOLY.NS", "GOACARBON.NS", "538715.NS", "526961.NS", "VIESL.NS",
-            "VISHNUINFR.NS", "513532.NS", "INFINIUM.NS", "RUBFILA.NS", "504084.NS",
-            "SACHEEROME.NS", "APCL.NS", "ORIENTBELL.NS", "BALAJEE.NS", "UNIDT.NS",
-            "IL&FSENGG.NS", "SAKUMA.NS", "BROOKS.NS", "VLEGOV.NS", "NDGL.NS",
-            "536974.NS", "LOKESHMACH.NS", "543543.NS", "KCEIL.NS", "531281.NS",
-            "BALAJIPHOS.NS", "524790.NS", "523373.NS", "509470.NS", "3IINFOLTD.NS",
-            "RACE.NS", "SOUTHWEST.NS", "GOKUL.NS", "BPL.NS", "524480.NS",
-            "531364.NS", "544453.NS", "WTICAB.NS", "500213.NS", "AARTISURF.NS",
-            "IITL.NS", "AFFORDABLE.NS", "539927.NS", "TICL.NS", "530215.NS",
-            "MCLEODRUSS.NS", "HARRMALAYA.NS", "INFLUX.NS", "MANAKSTEEL.NS", "539518.NS",
-            "SWARAJ.NS", "532344.NS", "INSPIRISYS.NS", "SKP.NS", "PARTH.NS",
-            "534733.NS", "PASUPTAC.NS", "524717.NS", "539479.NS", "ALANKIT.NS",
-            "543364.NS", "540956.NS", "SHIVAMAUTO.NS", "504028.NS", "NAMOEWASTE.NS",
-            "PANACHE.NS", "KANORICHEM.NS", "530627.NS", "GOLDKART.NS", "VIKASECO.NS",
-            "SSDL.NS", "544335.NS", "543746.NS", "544023.NS", "505750.NS",
-            "MASON.NS", "ZIMLAB.NS", "FROG.NS", "CONNPLEX.NS", "KCPSUGIND.NS",
-            "544205.NS", "SHREEKARNI.NS", "ASMS.NS", "TERASOFT.NS", "APOLSINHOT.NS",
-            "INM.NS", "VARDHACRLC.NS", "NIPPOBATRY.NS", "541353.NS", "ALMONDZ.NS",
-            "IEL.NS", "BYKE.NS", "512149.NS", "511754.NS", "GOLDTECH.NS",
-            "SPUNWEB.NS", "HITECHCORP.NS", "CMNL.NS", "GEEKAYWIRE.NS", "542679.NS",
-            "MANCREDIT.NS", "DIAMINESQ.NS", "538970.NS", "DPWIRES.NS", "LYKALABS.NS",
-            "PURPLEUTED.NS", "544080.NS", "ASAHISONG.NS", "TRF.NS", "EXXARO.NS",
-            "POLYSIL.NS", "VISASTEEL.NS", "BCONCEPTS.NS", "524634.NS", "SYSTANGO.NS",
-            "PUSHPA.NS", "500069.NS", "540726.NS", "DCI.NS", "NECLIFE.NS",
-            "MAWANASUG.NS", "500267.NS", "AVG.NS", "DPEL.NS", "NAGAFERT.NS",
-            "530521.NS", "511557.NS", "KOTYARK.NS", "507265.NS", "512595.NS",
-            "DJML.NS", "SINTERCOM.NS", "539984.NS", "544213.NS", "SAAKSHI.NS",
-            "539277.NS", "532039.NS", "500270.NS", "SHERA.NS", "543515.NS",
-            "GRETEX.NS", "544295.NS", "PILITA.NS", "539854.NS", "GICL.NS",
-            "SMSLIFE.NS", "508875.NS", "531727.NS", "NATHBIOGEN.NS", "UNIVASTU.NS",
-            "WELINV.NS", "KRISHCA.NS", "A2ZINFRA.NS", "TECHERA.NS", "OMAXAUTO.NS",
-            "GLOBAL.NS", "509162.NS", "543982.NS", "531161.NS", "VIPCLOTHNG.NS",
-            "PPAP.NS", "KAMOPAINTS.NS", "530805.NS", "531525.NS", "543616.NS",
-            "SHREYANIND.NS", "PROV.NS", "544091.NS", "JAINAM.NS", "AIRAN.NS",
-            "DUGLOBAL.NS", "LANCER.NS", "505978.NS", "540360.NS", "APRAMEYA.NS",
-            "MEDICO.NS", "539894.NS", "543284.NS", "STARTECK.NS", "NEPTUNE.NS",
-            "AUTOIND.NS", "KDL.NS", "524174.NS", "539337.NS", "523100.NS",
-            "SHRADHA.NS", "SAHYADRI.NS", "542628.NS", "526169.NS", "SUNDRMBRAK.NS",
-            "CINELINE.NS", "538942.NS", "SHEMAROO.NS", "532320.NS", "DCMNVL.NS",
-            "NIKITA.NS", "NDLVENTURE.NS", "PRITIKAUTO.NS", "CCHHL.NS", "526723.NS",
-            "ZEELEARN.NS", "AFIL.NS", "539226.NS", "AXITA.NS", "543737.NS",
-            "TREJHARA.NS", "531569.NS", "543391.NS", "MANOMAY.NS", "REPL.NS",
-            "PRIZOR.NS", "543806.NS", "CHAVDA.NS", "506180.NS", "IPSL.NS",
-            "UCAL.NS", "531673.NS", "505690.NS", "VIRINCHI.NS", "538890.NS",
-            "INDOUS.NS", "544267.NS", "524636.NS", "518075.NS", "531658.NS",
-            "509546.NS", "TTL.NS", "543916.NS", "GLOBALVECT.NS", "537839.NS",
-            "RADIOCITY.NS", "511066.NS", "533014.NS", "VSTL.NS", "UFO.NS",
-            "RBS.NS", "526873.NS", "SUPREME.NS", "ANYA.NS", "533608.NS",
-            "544343.NS", "SOMATEX.NS", "ELGNZ.NS", "JAYSREETEA.NS", "BHAGYANGR.NS",
-            "526415.NS", "526073.NS", "MODIRUBBER.NS", "ABAN.NS", "EFACTOR.NS",
-            "MADHAVBAUG.NS", "COMMITTED.NS", "523586.NS", "538987.NS", "SPCENET.NS",
-            "522105.NS", "544441.NS", "NEPHROCARE.NS", "SUPREMEINF.NS", "PODDARMENT.NS",
-            "STARPAPER.NS", "YASHOPTICS.NS", "KCK.NS", "531216.NS", "538882.NS",
-            "GOYALSALT.NS", "SAVY.NS", "540404.NS", "540693.NS", "SADBHAV.NS",
-            "531260.NS", "533315.NS", "502015.NS", "531412.NS", "544340.NS",
-            "543531.NS", "531739.NS", "TRANSTEEL.NS", "NIRAJ.NS", "533108.NS",
-            "ETML.NS", "GSMFOILS.NS", "544141.NS", "543939.NS", "544444.NS",
-            "544248.NS", "531399.NS", "544090.NS", "513472.NS", "UYFINCORP.NS",
-            "535916.NS", "RVHL.NS", "CUDML.NS", "UNIVPHOTO.NS", "ATLANTAA.NS",
-            "ENVIRO.NS", "ANLON.NS", "MEGASTAR.NS", "GILLANDERS.NS", "539219.NS",
-            "AHLEAST.NS", "544369.NS", "PIGL.NS", "513252.NS", "MURUDCERA.NS",
-            "AGARWALTUF.NS", "ELGIRUBCO.NS", "SCPL.NS", "SPCL.NS", "DENEERS.NS",
-            "535693.NS", "531279.NS", "SATKARTAR.NS", "CPCAP.NS", "SAKHTISUG.NS",
-            "530977.NS", "503816.NS", "IVC.NS", "AERONEU.NS", "KMSUGAR.NS",
-            "531173.NS", "ZODIACLOTH.NS", "SURANAT&P.NS", "539227.NS", "530495.NS",
-            "EEPL.NS", "RVTH.NS", "BALAXI.NS", "511018.NS", "SDREAMS.NS",
-            "ANIKINDS.NS", "521113.NS", "PRATHAM.NS", "PRAXIS.NS", "NAVKARURB.NS",
-            "ACTIVEINFR.NS", "500009.NS", "505299.NS", "KALYANIFRG.NS", "540570.NS",
-            "543976.NS", "505216.NS", "SPECTSTM.NS", "504093.NS", "531069.NS",
-            "TCL.NS", "541228.NS", "535621.NS", "ROSSELLIND.NS", "506166.NS",
-            "531253.NS", "530457.NS", "UNIHEALTH.NS", "544047.NS", "RHFL.NS",
-            "FIDEL.NS", "CHEMBOND.NS", "KOTARISUG.NS", "540954.NS", "OSIAHYPER.NS",
-            "505681.NS", "544151.NS", "MAXVOLT.NS", "524592.NS", "PONNIERODE.NS",
-            "PLAZACABLE.NS", "531041.NS", "MKPL.NS", "504076.NS", "542694.NS",
-            "543943.NS", "544112.NS", "TEAMGTY.NS", "540175.NS", "544442.NS",
-            "512493.NS", "544482.NS", "544460.NS", "540796.NS", "539112.NS",
-            "ESCONET.NS", "DEVIT.NS", "WORTH.NS", "UNITEDTEA.NS", "512527.NS",
-            "FELIX.NS", "508941.NS", "543997.NS", "EMAPARTNER.NS", "NURECA.NS",
-            "543926.NS", "CORDSCABLE.NS", "HVAX.NS", "MARALOVER.NS", "538875.NS",
-            "526747.NS", "POSITRON.NS", "512165.NS", "PRITIKA.NS", "BASML.NS",
-            "MHLXMIRU.NS", "500449.NS", "530585.NS", "VOLERCAR.NS", "SADHNANIQ.NS",
-            "DUCOL.NS", "526519.NS", "AMJLAND.NS", "519216.NS", "TRIGYN.NS",
-            "KRITIKA.NS", "DRCSYSTEMS.NS", "SHIVATEX.NS", "533167.NS", "513353.NS",
-            "504258.NS", "512399.NS", "512103.NS", "SAWALIYA.NS", "INDOWIND.NS",
-            "ARIHANTACA.NS", "533007.NS", "511714.NS", "517258.NS", "508670.NS",
-            "KAVDEFENCE.NS", "WINSOL.NS", "539113.NS", "RAJTV.NS", "AKSHARCHEM.NS",
-            "DRONE.NS", "LAWSIKHO.NS", "BAFNAPH.NS", "SHUBHSHREE.NS", "PKTEA.NS",
-            "511571.NS", "538817.NS", "531550.NS", "504903.NS", "544383.NS",
-            "GRCL.NS", "541144.NS", "543993.NS", "517063.NS", "PRAMARA.NS",
-            "539515.NS", "537669.NS", "KATARIA.NS", "COASTCORP.NS", "511260.NS",
-            "DGCONTENT.NS", "524572.NS", "ENFUSE.NS", "RANASUG.NS", "531307.NS",
-            "USASEEDS.NS", "ESPRIT.NS", "VETO.NS", "GULFPETRO.NS", "501848.NS",
-            "539546.NS", "526739.NS", "540728.NS", "LLOYDS.NS", "EMMIL.NS",
-            "GENCON.NS", "INNOMET.NS", "GOLDSTAR.NS", "543241.NS", "DELPHIFX.NS",
-            "LOTUSEYE.NS", "538795.NS", "HPTL.NS", "517246.NS", "542579.NS",
-            "ASPINWALL.NS", "522091.NS", "TAINWALCHM.NS", "ATALREAL.NS", "526731.NS",
-            "505285.NS", "544191.NS", "532275.NS", "531390.NS", "AESTHETIK.NS",
-            "526821.NS", "NECCLTD.NS", "WATERBASE.NS", "MADHUSUDAN.NS", "519295.NS",
-            "BEWLTD.NS", "AVROIND.NS", "PROPEQUITY.NS", "SETCO.NS", "523638.NS",
-            "ESSENTIA.NS", "NATCAPSUQ.NS", "536493.NS", "DTIL.NS", "JMA.NS",
-            "MODTHREAD.NS", "540097.NS", "ALPA.NS", "538926.NS", "538476.NS",
-            "517417.NS", "TIPSFILMS.NS", "511672.NS", "531306.NS", "ALUWIND.NS",
-            "500028.NS", "MANAKALUCO.NS", "DHARAN.NS", "531726.NS", "DESTINY.NS",
-            "JEYYAM.NS", "INTENTECH.NS", "USHAFIN.NS", "523874.NS", "540151.NS",
-            "544387.NS", "NITIRAJ.NS", "SONAMLTD.NS", "526614.NS", "ARCHIDPLY.NS",
-            "543346.NS", "522273.NS", "EMKAYTOOLS.NS", "AMCL.NS", "509026.NS",
-            "ENSER.NS", "SMARTEN.NS", "516003.NS", "542013.NS", "539017.NS",
-            "PRLIND.NS", "512634.NS", "AERON.NS", "533407.NS", "EMMBI.NS",
-            "SHRITECH.NS", "532806.NS", "532992.NS", "BHADORA.NS", "LANCORHOL.NS",
-            "537326.NS", "JAINIK.NS", "538923.NS", "509051.NS", "VISHWARAJ.NS",
-            "532090.NS", "532102.NS", "531862.NS", "539275.NS", "DYNAMIC.NS",
-            "526935.NS", "512437.NS", "SHAH.NS", "AARTECH.NS", "526717.NS",
-            "EQUIPPP.NS", "526703.NS", "506134.NS", "544409.NS", "BARFLEX.NS",
-            "EXCEL.NS", "505712.NS", "535566.NS", "DCM.NS", "509486.NS",
-            "538896.NS", "539620.NS", "512026.NS", "USK.NS", "530253.NS",
-            "537800.NS", "INCREDIBLE.NS", "RSSOFTWARE.NS", "PROFX.NS", "INDTERRAIN.NS",
-            "506579.NS", "544105.NS", "539196.NS", "UMAEXPORTS.NS", "505893.NS",
-            "FORCAS.NS", "KEYFINSERV.NS", "DUCON.NS", "530313.NS", "514470.NS",
-            "ARVEE.NS", "IEML.NS", "514324.NS", "RAJINDLTD.NS", "AARVI.NS",
-            "KAYTEX.NS", "500389.NS", "507621.NS", "504908.NS", "544166.NS",
-            "512099.NS", "526981.NS", "SHREEOSFM.NS", "LAL.NS", "RAPPID.NS",
-            "531254.NS", "544431.NS", "MAITREYA.NS", "501391.NS", "513043.NS",
-            "530621.NS", "CANARYS.NS", "AAREYDRUGS.NS", "SADHAV.NS", "IBLFL.NS",
-            "543713.NS", "CROWN.NS", "RUCHINFRA.NS", "RAJPUTANA.NS", "539175.NS",
-            "516032.NS", "543615.NS", "HECPROJECT.NS", "539562.NS", "507998.NS",
-            "MAHESHWARI.NS", "IVP.NS", "ROYALARC.NS", "505737.NS", "CORALFINAC.NS",
-            "524582.NS", "540395.NS", "540062.NS", "TUNWAL.NS", "SUNLITE.NS",
-            "SEMAC.NS", "531997.NS", "AKANKSHA.NS", "TANKUP.NS", "539255.NS",
-            "KHFM.NS", "WEIZMANIND.NS", "SOMICONVEY.NS", "CENTEXT.NS", "531310.NS",
-            "BRNL.NS", "VEEKAYEM.NS", "532334.NS", "509945.NS", "TEXMOPIPES.NS",
-            "VR.NS", "WOMANCART.NS", "532070.NS", "526971.NS", "531663.NS",
-            "KESORAMIND.NS", "543805.NS", "524506.NS", "BSL.NS", "512345.NS",
-            "MAGNUM.NS", "SAIFL.NS", "STUDIOLSD.NS", "SILGO.NS", "HINDCON.NS",
-            "ISFT.NS", "YAARI.NS", "BLUEWATER.NS", "538714.NS", "AKIKO.NS",
-            "523248.NS", "SUPERHOUSE.NS", "TBI.NS", "KREBSBIO.NS", "524828.NS",
-            "VASWANI.NS", "531205.NS", "DOLLEX.NS", "AIROLAM.NS", "514428.NS",
-            "AARADHYA.NS", "539991.NS", "RKEC.NS", "540492.NS", "RPPL.NS",
-            "538546.NS", "544257.NS", "CEDAAR.NS", "ZEAL.NS", "GANGESSECU.NS",
-            "CHETANA.NS", "544468.NS", "MACOBSTECH.NS", "SIGIND.NS", "503804.NS",
-            "GVPTECH.NS", "QUESTLAB.NS", "TAKE.NS", "MUKTAARTS.NS", "OSWALSUG.NS",
-            "STEELCITY.NS", "GAYAPROJ.NS", "CPS.NS", "PURVFLEXI.NS", "544143.NS",
-            "533170.NS", "OSWALSEEDS.NS", "INDIANCARD.NS", "505302.NS", "500159.NS",
-            "540401.NS", "SELLOWRAP.NS", "511700.NS", "517477.NS", "531289.NS",
-            "526443.NS", "516108.NS", "INVENTURE.NS", "526853.NS", "506530.NS",
-            "517514.NS", "526546.NS", "GTL.NS", "512379.NS", "540874.NS",
-            "540192.NS", "COMPUSOFT.NS", "526654.NS", "511200.NS", "522292.NS",
-            "530617.NS", "SADBHIN.NS", "PRAENG.NS", "542862.NS", "SLONE.NS",
-            "GLOBALPET.NS", "MDL.NS", "502587.NS", "SIKKO.NS", "ALPHAGEO.NS",
-            "544440.NS", "522251.NS", "MASTER.NS", "SURANASOL.NS", "531119.NS",
-            "530233.NS", "504351.NS", "SHIGAN.NS", "530589.NS", "SALSTEEL.NS",
-            "SOTAC.NS", "530745.NS", "LOYALTEX.NS", "LAGNAM.NS", "541083.NS",
-            "UMIYA-MRO.NS", "523309.NS", "AURDIS.NS", "544036.NS", "SHYAMCENT.NS",
-            "504840.NS", "GREENCHEF.NS", "530315.NS", "517393.NS", "513369.NS",
-            "534060.NS", "504080.NS", "543546.NS", "530331.NS", "DHARIWAL.NS",
-            "540078.NS", "MAL.NS", "519455.NS", "BTML.NS", "HPIL.NS",
-            "538943.NS", "514360.NS", "APEXECO.NS", "523054.NS", "TRUST.NS",
-            "530197.NS", "QMSMEDI.NS", "504273.NS", "532435.NS", "SMARTLINK.NS",
-            "523449.NS", "KORE.NS", "SHEETAL.NS", "519471.NS", "544073.NS",
-            "IWARE.NS", "MAHAPEXLTD.NS", "543937.NS", "513548.NS", "506128.NS",
-            "SMLT.NS", "544108.NS", "540198.NS", "507645.NS", "543229.NS",
-            "ARHAM.NS", "BHARATGEAR.NS", "512600.NS", "GENSOL.NS", "544199.NS",
-            "HDIL.NS", "ROML.NS", "543464.NS", "AVIANSH.NS", "513496.NS",
-            "531215.NS", "VIPULLTD.NS", "513502.NS", "RAPIDFLEET.NS", "526638.NS",
-            "JOCIL.NS", "531287.NS", "544329.NS", "513709.NS", "539761.NS",
-            "522165.NS", "SURANI.NS", "INDBANK.NS", "543285.NS", "505827.NS",
-            "530185.NS", "AUSOMENT.NS", "KLL.NS", "503663.NS", "543351.NS",
-            "517236.NS", "506640.NS", "REXPIPES.NS", "526025.NS", "508136.NS",
-            "531842.NS", "526211.NS", "532384.NS", "FIBERWEB.NS", "538713.NS",
-            "524202.NS", "LOVABLE.NS", "519238.NS", "SECMARK.NS", "517372.NS",
-            "539875.NS", "513337.NS", "BALPHARMA.NS", "544399.NS", "539598.NS",
-            "MRIL.NS", "LAKSHYA.NS", "IPHL.NS", "532160.NS", "532362.NS",
-            "517170.NS", "542057.NS", "530741.NS", "MMEL.NS", "531609.NS",
-            "543208.NS", "SSFL.NS", "SUNTECH.NS", "524687.NS", "539963.NS",
-            "UHTL.NS", "540686.NS", "ISHANCH.NS", "544082.NS", "VITAL.NS",
-            "531234.NS", "ZENITHEXPO.NS", "URBAN.NS", "523116.NS", "MCL.NS",
-            "BAIDFIN.NS", "WIPL.NS", "PRUDMOULI.NS", "MAYASHEEL.NS", "513456.NS",
-            "538564.NS", "SALONA.NS", "531273.NS", "531888.NS", "MAXPOSURE.NS",
-            "SYLVANPLY.NS", "541601.NS", "514138.NS", "531994.NS", "506186.NS",
-            "537536.NS", "XELPMOC.NS", "OMFURN.NS", "526137.NS", "SAMPANN.NS",
-            "LAMBODHARA.NS", "FORGEAUTO.NS", "526861.NS", "TGL.NS", "ITTL.NS",
-            "524136.NS", "544189.NS", "VAISHALI.NS", "526409.NS", "DCG.NS",
-            "REGENCERAM.NS", "523483.NS", "MANGALAM.NS", "520075.NS", "TRU.NS",
-            "517429.NS", "ATCENERGY.NS", "ROCKINGDCE.NS", "TARMAT.NS", "KOHINOOR.NS",
-            "AAKAAR.NS", "543799.NS", "531489.NS", "524661.NS", "SAMBHAAV.NS",
-            "543376.NS", "READYMIX.NS", "500058.NS", "541778.NS", "523696.NS",
-            "RAJSREESUG.NS", "531395.NS", "HILTON.NS", "BAGFILMS.NS", "531540.NS",
-            "RELCHEMQ.NS", "519287.NS", "DIGIDRIVE.NS", "KEN.NS", "AKSHOPTFBR.NS",
-            "544059.NS", "ARTNIRMAN.NS", "542724.NS", "RAJMET.NS", "REFRACTORY.NS",
-            "531328.NS", "523752.NS", "530449.NS", "513693.NS", "DHRUV.NS",
-            "TOKYOPLAST.NS", "SURYALAXMI.NS", "HOLMARC.NS", "543622.NS", "543902.NS",
-            "MITCON.NS", "530175.NS", "532262.NS", "542910.NS", "543499.NS",
-            "DTL.NS", "507968.NS", "TOUCHWOOD.NS", "544341.NS", "543244.NS",
-            "532230.NS", "BHANDARI.NS", "526488.NS", "538706.NS", "OBCL.NS",
-            "507852.NS", "526492.NS", "KAKATCEM.NS", "SIDDHIKA.NS", "ZENITHDRUG.NS",
-            "BLUECOAST.NS", "540455.NS", "TOTAL.NS", "SIL.NS", "512018.NS",
-            "GROBTEA.NS", "500220.NS", "544163.NS", "532879.NS", "531743.NS",
-            "LATTEYS.NS", "DELAPLEX.NS", "517096.NS", "523676.NS", "539115.NS",
-            "526544.NS", "SPLIL.NS", "543991.NS", "539401.NS", "509472.NS",
-            "NIRMAN.NS", "532053.NS", "DIVINEHIRA.NS", "PALASHSECU.NS", "530723.NS",
-            "539561.NS", "RELIABLE.NS", "531080.NS", "PIONEEREMB.NS", "SHAHALLOYS.NS",
-            "500322.NS", "JYOTIGLOBL.NS", "PAR.NS", "514272.NS", "NAMAN.NS",
-            "524218.NS", "544353.NS", "SONUINFRA.NS", "VISAMAN.NS", "544177.NS",
-            "MOKSH.NS", "MAHICKRA.NS", "PARAGON.NS", "526899.NS", "511144.NS",
-            "539353.NS", "SHKSIL.NS", "539574.NS", "PSRAJ.NS", "507598.NS",
-            "507498.NS", "544381.NS", "530219.NS", "544106.NS", "BEARDSELL.NS",
-            "542459.NS", "544464.NS", "543753.NS", "522183.NS", "539222.NS",
-            "540332.NS", "539218.NS", "ZENITHSTL.NS", "531592.NS", "540829.NS",
-            "543874.NS", "504380.NS", "533896.NS", "CUBEXTUB.NS", "CRAYONS.NS",
-            "533289.NS", "GOYALALUM.NS", "519299.NS", "ROXHITECH.NS", "524502.NS",
-            "543262.NS", "523186.NS", "NEWJAISA.NS", "AAKASH.NS", "544327.NS",
-            "CAPTRUST.NS", "531959.NS", "543239.NS", "503127.NS", "IL&FSTRANS.NS",
-            "DIGJAMLMTD.NS", "LPDC.NS", "541347.NS", "514165.NS", "539552.NS",
-            "506605.NS", "ATAM.NS", "DELTIC.NS", "530525.NS", "531688.NS",
-            "544330.NS", "PATINTLOG.NS", "504646.NS", "ACCURACY.NS", "531977.NS",
-            "507960.NS", "539132.NS", "AMBANIORGO.NS", "531918.NS", "521097.NS",
-            "MAGSON.NS", "ASCOM.NS", "530881.NS", "526117.NS", "526709.NS",
-            "NRVANDANA.NS", "514318.NS", "AAATECH.NS", "544483.NS", "505703.NS",
-            "SONAMAC.NS", "543172.NS", "BEACON.NS", "530077.NS", "505693.NS",
-            "514302.NS", "536565.NS", "543860.NS", "PATTECH.NS", "BAWEJA.NS",
-            "HINDNATGLS.NS", "KANDARP.NS", "SELMC.NS", "MOTOGENFIN.NS", "ARSSINFRA.NS",
-            "KKJEWELS.NS", "540168.NS", "538964.NS", "514030.NS", "MHHL.NS",
-            "505650.NS", "531813.NS", "PRITI.NS", "KEL.NS", "PRAKASHSTL.NS",
-            "543678.NS", "HISARMETAL.NS", "530615.NS", "IDEALTECHO.NS", "AMBEY.NS",
-            "543578.NS", "BANKA.NS", "VDEAL.NS", "538092.NS", "532855.NS",
-            "513507.NS", "544171.NS", "532057.NS", "539391.NS", "CINEVISTA.NS",
-            "544165.NS", "539814.NS", "TSC.NS", "CLSL.NS", "ONDOOR.NS",
-            "530125.NS", "SFML.NS", "AKI.NS", "539659.NS", "524663.NS",
-            "538732.NS", "SAJHOTELS.NS", "AMDIND.NS", "530545.NS", "EFORCE.NS",
-            "GLOBE.NS", "ENERGYDEV.NS", "530601.NS", "542753.NS", "507180.NS",
-            "DIGIKORE.NS", "532373.NS", "PARTYCRUS.NS", "WHITEFORCE.NS", "524640.NS",
-            "PARAMATRIX.NS", "KONSTELEC.NS", "SUNDARAM.NS", "523120.NS", "532820.NS",
-            "530341.NS", "AUSL.NS", "BVCL.NS", "523842.NS", "512479.NS",
-            "ODIGMA.NS", "522294.NS", "539041.NS", "517494.NS", "542668.NS",
-            "530043.NS", "SANGANI.NS", "524564.NS", "544265.NS", "511626.NS",
-            "SILKFLEX.NS", "CEREBRAINT.NS", "540850.NS", "ORCHASP.NS", "JHS.NS",
-            "ANMOL.NS", "523019.NS", "HOVS.NS", "AGROPHOS.NS", "PULZ.NS",
-            "544304.NS", "515085.NS", "540613.NS", "506979.NS", "519457.NS",
-            "511012.NS", "ABHAPOWER.NS", "532183.NS", "544412.NS", "543544.NS",
-            "544445.NS", "ARVINDPORT.NS", "531671.NS", "531398.NS", "TROM.NS",
-            "533056.NS", "OLIL.NS", "ASHALOG.NS", "DELTAMAGNT.NS", "523650.NS",
-            "FCONSUMER.NS", "520155.NS", "REXPRO.NS", "544349.NS", "TFL.NS",
-            "ALKALI.NS", "HOMESFY.NS", "ORIENTLTD.NS", "531126.NS", "507864.NS",
-            "511391.NS", "WOL3D.NS", "AISL.NS", "517238.NS", "539773.NS",
-            "526640.NS", "538921.NS", "DECCANTRAN.NS", "DBSTOCKBRO.NS", "534732.NS",
-            "540143.NS", "SILKY.NS", "539167.NS", "540405.NS", "530825.NS",
-            "541445.NS", "512048.NS", "RTL.NS", "AJOONI.NS", "SUVIDHAA.NS",
-            "514402.NS", "532933.NS", "540377.NS", "540614.NS", "544251.NS",
-            "GODHA.NS", "ONYX.NS", "HOACFOODS.NS", "531529.NS", "DAMODARIND.NS",
-            "539314.NS", "544463.NS", "SCML.NS", "544074.NS", "506919.NS",
-            "VIAZ.NS", "3PLAND.NS", "SRIVASAVI.NS", "539398.NS", "532455.NS",
-            "544035.NS", "INDSWFTLTD.NS", "505336.NS", "BRACEPORT.NS", "530139.NS",
-            "532333.NS", "AGRITECH.NS", "FONEBOX.NS", "531952.NS", "PRANIK.NS",
-            "544472.NS", "519331.NS", "523007.NS", "526193.NS", "533427.NS",
-            "544351.NS", "543312.NS", "NAGREEKEXP.NS", "540738.NS", "540590.NS",
-            "SYNOPTICS.NS", "509053.NS", "538401.NS", "FMNL.NS", "501833.NS",
-            "526241.NS", "NARMADA.NS", "PARASPETRO.NS", "531169.NS", "511411.NS",
-            "531127.NS", "543453.NS", "ARABIAN.NS", "523289.NS", "526705.NS",
-            "544334.NS", "543443.NS", "CTE.NS", "538862.NS", "544214.NS",
-            "ATLASCYCLE.NS", "502294.NS", "524594.NS", "524288.NS", "SECURKLOUD.NS",
-            "BLBLIMITED.NS", "531802.NS", "531752.NS", "ANSALAPI.NS", "538833.NS",
-            "544185.NS", "531163.NS", "543848.NS", "523888.NS", "K2INFRA.NS",
-            "542911.NS", "544287.NS", "526237.NS", "501430.NS", "523844.NS",
-            "508905.NS", "SWASTIK.NS", "506734.NS", "531931.NS", "ARISTO.NS",
-            "507474.NS", "500458.NS", "526471.NS", "538786.NS", "512047.NS",
-            "543921.NS", "539122.NS", "511147.NS", "544121.NS", "514358.NS",
-            "540080.NS", "537253.NS", "543435.NS", "MYMUDRA.NS", "500421.NS",
-            "530533.NS", "531923.NS", "AGSTRA.NS", "PSFL.NS", "MARCO.NS",
-            "AMEYA.NS", "CELEBRITY.NS", "526479.NS", "513119.NS", "TPHQ.NS",
-            "540082.NS", "540190.NS", "539527.NS", "511509.NS", "535267.NS",
-            "517431.NS", "522235.NS", "523537.NS", "532410.NS", "517437.NS",
-            "SATECH.NS", "538565.NS", "GSS.NS", "531996.NS", "AHLADA.NS",
-            "532159.NS", "540135.NS", "JAIPURKURT.NS", "530045.NS", "540146.NS",
-            "BLUEPEBBLE.NS", "SHEKHAWATI.NS", "MALUPAPER.NS", "507872.NS", "SERVICE.NS",
-            "505807.NS", "512485.NS", "517288.NS", "VELS.NS", "518053.NS",
-            "531971.NS", "530951.NS", "ORIENTALTL.NS", "502901.NS", "513005.NS",
-            "540519.NS", "MITTAL.NS", "539040.NS", "534064.NS", "FLEXITUFF.NS",
-            "531176.NS", "511696.NS", "540204.NS", "539098.NS", "DIVYADHAN.NS",
-            "544471.NS", "526435.NS", "507948.NS", "BALKRISHNA.NS", "532056.NS",
-            "532005.NS", "511764.NS", "544259.NS", "539939.NS", "538610.NS",
-            "NOIDATOLL.NS", "521005.NS", "LRRPL.NS", "BANARBEADS.NS", "531168.NS",
-            "MEGAFLEX.NS", "524204.NS", "514280.NS", "531677.NS", "AVSL.NS",
-            "540006.NS", "504988.NS", "MANUGRAPH.NS", "507828.NS", "BIOFILCHEM.NS",
-            "530997.NS", "543410.NS", "DHANLAXMI.NS", "519234.NS", "GATECH.NS",
-            "BIRDYS.NS", "PRESSTONIC.NS", "526931.NS", "508494.NS", "TNTELE.NS",
-            "511153.NS", "544388.NS", "526727.NS", "531153.NS", "522231.NS",
-            "526365.NS", "GRAPHISAD.NS", "544365.NS", "BANG.NS", "526481.NS",
-            "526965.NS", "539760.NS", "526315.NS", "503641.NS", "511692.NS",
-            "517554.NS", "516078.NS", "VERTEXPLUS.NS", "RICHA.NS", "522005.NS",
-            "507817.NS", "524408.NS", "RILINFRA.NS", "DURLAX.NS", "523550.NS",
-            "521216.NS", "511609.NS", "531861.NS", "PREMIUM.NS", "511447.NS",
-            "ACCPL.NS", "514171.NS", "535620.NS", "ICDSLTD.NS", "531591.NS",
-            "DANGEE.NS", "506003.NS", "523277.NS", "CURAA.NS", "DCCL.NS",
-            "544428.NS", "543375.NS", "PALREDTEC.NS", "530265.NS", "532656.NS",
-            "503349.NS", "ARCHIES.NS", "544370.NS", "RKDL.NS", "530789.NS",
-            "530461.NS", "530557.NS", "524711.NS", "HAVISHA.NS", "531822.NS",
-            "539679.NS", "539217.NS", "GOLDENTOBC.NS", "523672.NS", "NIBL.NS",
-            "512093.NS", "511441.NS", "539545.NS", "523732.NS", "JETFREIGHT.NS",
-            "500346.NS", "540788.NS", "UNILEX.NS", "507946.NS", "530709.NS",
-            "504746.NS", "CADSYS.NS", "500422.NS", "538563.NS", "MCON.NS",
-            "BABAFP.NS", "544452.NS", "540809.NS", "530689.NS", "531278.NS",
-            "530787.NS", "512477.NS", "530317.NS", "VINNY.NS", "540252.NS",
-            "538539.NS", "508918.NS", "538837.NS", "LFIC.NS", "539985.NS",
-            "SHIVAMILLS.NS", "SECL.NS", "523232.NS", "542145.NS", "511654.NS",
-            "524614.NS", "VLINFRA.NS", "538607.NS", "ASTRON.NS", "519566.NS",
-            "RNPL.NS", "531237.NS", "542592.NS", "SIMBHALS.NS", "517546.NS",
-            "538611.NS", "SEL.NS", "544303.NS", "524548.NS", "544425.NS",
-            "542046.NS", "VISHWAS.NS", "GANGABATH.NS", "511577.NS", "526851.NS",
-            "500143.NS", "535719.NS", "502445.NS", "542146.NS", "532957.NS",
-            "KARMAENG.NS", "LEXUS.NS", "524488.NS", "531065.NS", "LCCINFOTEC.NS",
-            "514442.NS", "BMETRICS.NS", "507813.NS", "526616.NS", "514322.NS",
-            "UWCSL.NS", "NMSTEEL.NS", "532123.NS", "543598.NS", "524534.NS",
-            "531233.NS", "522152.NS", "530711.NS", "512589.NS", "21STCENMGM.NS",
-            "ARSHIYA.NS", "542123.NS", "538634.NS", "530929.NS", "530695.NS",
-            "507981.NS", "JISLDVREQS.NS", "543211.NS", "531900.NS", "511740.NS",
-            "530427.NS", "HBSL.NS", "543963.NS", "ADROITINFO.NS", "513418.NS",
-            "531635.NS", "526335.NS", "PROLIFE.NS", "531417.NS", "BULKCORP.NS",
-            "KALANA.NS", "544422.NS", "538556.NS", "UCL.NS", "543522.NS",
-            "523840.NS", "DNAMEDIA.NS", "AUROIMPEX.NS", "QUICKTOUCH.NS", "538834.NS",
-            "503229.NS", "527005.NS", "AROGRANITE.NS", "526445.NS", "544361.NS",
-            "MEDISTEP.NS", "IDENTICAL.NS", "PEARLPOLY.NS", "507962.NS", "537069.NS",
-            "NORBTEAEXP.NS", "531832.NS", "501261.NS", "513629.NS", "530577.NS",
-            "521137.NS", "RULKA.NS", "506863.NS", "538868.NS", "539522.NS",
-            "544392.NS", "RCDL.NS", "540654.NS", "531982.NS", "534623.NS",
-            "540786.NS", "539121.NS", "539198.NS", "SUPERSPIN.NS", "538965.NS",
-            "517119.NS", "533202.NS", "511359.NS", "500239.NS", "544157.NS",
-            "522001.NS", "530053.NS", "541006.NS", "524516.NS", "DKEGL.NS",
-            "517415.NS", "531454.NS", "513566.NS", "518011.NS", "521240.NS",
-            "COUNCODOS.NS", "512587.NS", "CHAMUNDA.NS", "WEWIN.NS", "539220.NS",
-            "ASLIND.NS", "522207.NS", "MIEL.NS", "531223.NS", "531869.NS",
-            "511658.NS", "531810.NS", "521151.NS", "543637.NS", "532404.NS",
-            "KHAITANLTD.NS", "530979.NS", "534796.NS", "531297.NS", "509597.NS",
-            "514312.NS", "532140.NS", "517423.NS", "531380.NS", "513059.NS",
-            "514087.NS", "514060.NS", "531600.NS", "500388.NS", "531512.NS",
-            "531111.NS", "VIJIFIN.NS", "543744.NS", "544270.NS", "DEEM.NS",
-            "540843.NS", "526231.NS", "HRHNEXT.NS", "509196.NS", "538395.NS",
-            "532911.NS", "530897.NS", "514336.NS", "532918.NS", "510245.NS",
-            "NGIL.NS", "540651.NS", "MOHITIND.NS", "MILTON.NS", "SAGARDEEP.NS",
-            "ADL.NS", "543814.NS", "540254.NS", "MADHUCON.NS", "523144.NS",
-            "MASKINVEST.NS", "507690.NS", "ITALIANE.NS", "SAMAY.NS", "AGARWALFT.NS",
-            "MODIPON.NS", "SEYAIND.NS", "521167.NS", "544169.NS", "PPSL.NS",
-            "532284.NS", "542376.NS", "512499.NS", "530959.NS", "UMA.NS",
-            "JETKNIT.NS", "MEDIORG.NS", "539762.NS", "SVPGLOB.NS", "538778.NS",
-            "544372.NS", "544437.NS", "SIGNORIA.NS", "524703.NS", "544201.NS",
-            "531199.NS", "511525.NS", "543594.NS", "539267.NS", "530361.NS",
-            "534063.NS", "503837.NS", "541112.NS", "544308.NS", "HYBRIDFIN.NS",
-            "531744.NS", "544242.NS", "524336.NS", "544400.NS", "530883.NS",
-            "JFLLIFE.NS", "539013.NS", "501370.NS", "AKSHAR.NS", "530433.NS",
-            "KONTOR.NS", "KEEPLEARN.NS", "540681.NS", "530419.NS", "TARAPUR.NS",
-            "AMBICAAGAR.NS", "540181.NS", "540079.NS", "521228.NS", "AGNI.NS",
-            "LASA.NS", "530217.NS", "531960.NS", "543897.NS", "AKASH.NS",
-            "GANGAFORGE.NS", "538537.NS", "539697.NS", "520123.NS", "513642.NS",
-            "539011.NS", "511549.NS", "NEELAM.NS", "521133.NS", "543618.NS",
-            "534612.NS", "524322.NS", "509040.NS", "542248.NS", "LAXMICOT.NS",
-            "WINPRO.NS", "INTEGRITY.NS", "500170.NS", "544475.NS", "TIMESCAN.NS",
-            "WALPAR.NS", "ARUNAYA.NS", "530169.NS", "511523.NS", "544170.NS",
-            "532380.NS", "500360.NS", "530037.NS", "526355.NS", "530249.NS",
-            "513149.NS", "530747.NS", "544426.NS", "532402.NS", "AATMAJ.NS",
-            "531841.NS", "532355.NS", "SITINET.NS", "530991.NS", "530109.NS",
-            "540147.NS", "521244.NS", "538382.NS", "517564.NS", "544348.NS",
-            "512115.NS", "RADIOWALLA.NS", "532154.NS", "543540.NS", "ABMINTLLTD.NS",
-            "540938.NS", "505343.NS", "NEXTMEDIA.NS", "PENTAGON.NS", "526071.NS",
-            "531814.NS", "MADHAV.NS", "542934.NS", "NKIND.NS", "PARAMOUNT.NS",
-            "512489.NS", "540468.NS", "526490.NS", "BOHRAIND.NS", "540361.NS",
-            "502250.NS", "539176.NS", "MONOPHARMA.NS", "PRECISION.NS", "ASHOKAMET.NS",
-            "542801.NS", "512036.NS", "530909.NS", "530235.NS", "531067.NS",
-            "526301.NS", "524622.NS", "KRIDHANINF.NS", "533212.NS", "502873.NS",
-            "GAYAHWS.NS", "542206.NS", "542019.NS", "PNC.NS", "505250.NS",
-            "PHOGLOBAL.NS", "530095.NS", "533101.NS", "544433.NS", "532975.NS",
-            "LAMOSAIC.NS", "544393.NS", "535387.NS", "TRIDHYA.NS", "AKG.NS",
-            "517370.NS", "SATIPOLY.NS", "531979.NS", "509887.NS", "530213.NS",
-            "517264.NS", "540199.NS", "KKVAPOW.NS", "541973.NS", "502933.NS",
-            "539455.NS", "521232.NS", "523465.NS", "511712.NS", "524602.NS",
-            "536073.NS", "TECILCHEM.NS", "543065.NS", "THESL.NS", "513307.NS",
-            "541503.NS", "537707.NS", "540953.NS", "539494.NS", "531930.NS",
-            "KANANIIND.NS", "511169.NS", "531268.NS", "536659.NS", "VSCL.NS",
-            "SKIL.NS", "FEL.NS", "531301.NS", "544072.NS", "526095.NS",
-            "540904.NS", "531144.NS", "544195.NS", "511539.NS", "524440.NS",
-            "519359.NS", "530973.NS", "ASPIRE.NS", "506858.NS", "TAPIFRUIT.NS",
-            "532425.NS", "539428.NS", "513498.NS", "531521.NS", "544391.NS",
-            "500370.NS", "531616.NS", "530309.NS", "521141.NS", "509046.NS",
-            "539310.NS", "WILLAMAGOR.NS", "526847.NS", "KHANDSE.NS", "540694.NS",
-            "500206.NS", "511355.NS", "523021.NS", "521178.NS", "526945.NS",
-            "SGL.NS", "543941.NS", "526269.NS", "533100.NS", "TGBHOTELS.NS",
-            "531667.NS", "CYBERMEDIA.NS", "ROLLT.NS", "MOXSH.NS", "543194.NS",
-            "531608.NS", "539938.NS", "524080.NS", "508969.NS", "531502.NS",
-            "539724.NS", "539354.NS", "524675.NS", "512257.NS", "532723.NS",
-            "KAUSHALYA.NS", "507300.NS", "539273.NS", "BILVYAPAR.NS", "530407.NS",
-            "541005.NS", "544313.NS", "531129.NS", "539117.NS", "523566.NS",
-            "513295.NS", "ROLTA.NS", "544083.NS", "541735.NS", "502133.NS",
-            "543460.NS", "539012.NS", "VILINBIO.NS", "544417.NS", "531533.NS",
-            "533602.NS", "531647.NS", "530255.NS", "500246.NS", "542802.NS",
-            "526628.NS", "NAGREEKCAP.NS", "531980.NS", "539798.NS", "530291.NS",
-            "SHRENIK.NS", "CELLPOINT.NS", "526043.NS", "503092.NS", "526827.NS",
-            "531190.NS", "514326.NS", "531212.NS", "544474.NS", "530705.NS",
-            "544436.NS", "539378.NS", "531340.NS", "519612.NS", "543938.NS",
-            "524314.NS", "531319.NS", "530133.NS", "519475.NS", "511131.NS",
-            "LIBAS.NS", "544178.NS", "524818.NS", "QVCEL.NS", "544371.NS",
-            "540545.NS", "538647.NS", "540914.NS", "526139.NS", "MFML.NS",
-            "513544.NS", "531178.NS", "544013.NS", "RETAIL.NS", "509895.NS",
-            "531503.NS", "539519.NS", "GFSTEELS.NS", "534691.NS", "544000.NS",
-            "MICROPRO.NS", "531651.NS", "531968.NS", "543518.NS", "543754.NS",
-            "VINEETLAB.NS", "531437.NS", "YUDIZ.NS", "524238.NS", "TREEHOUSE.NS",
-            "531227.NS", "543538.NS", "INFOMEDIA.NS", "512247.NS", "539216.NS",
-            "538646.NS", "540550.NS", "530179.NS", "DIL.NS", "526773.NS",
-            "539470.NS", "511016.NS", "MORARJEE.NS", "501700.NS", "543914.NS",
-            "524013.NS", "544331.NS", "530925.NS", "535730.NS", "MEP.NS",
-            "541702.NS", "531870.NS", "521149.NS", "UNIVAFOODS.NS", "530853.NS",
-            "531840.NS", "500016.NS", "501314.NS", "526871.NS", "526901.NS",
-            "532701.NS", "504180.NS", "500014.NS", "512175.NS", "543924.NS",
-            "AGUL.NS", "530357.NS", "526345.NS", "504810.NS", "504648.NS",
-            "SHANTHALA.NS", "520127.NS", "511716.NS", "511176.NS", "530401.NS",
-            "540727.NS", "538540.NS", "531950.NS", "522267.NS", "539097.NS",
-            "FLFL.NS", "540150.NS", "MANDEEP.NS", "512425.NS", "526161.NS",
-            "511756.NS", "GOENKA.NS", "MINDPOOL.NS", "531324.NS", "543970.NS",
-            "543769.NS", "502589.NS", "519574.NS", "519532.NS", "543765.NS",
-            "531025.NS", "531472.NS", "530953.NS", "524156.NS", "543621.NS",
-            "539435.NS", "SUPREMEENG.NS", "517077.NS", "540597.NS", "KSHITIJPOL.NS",
-            "541865.NS", "505212.NS", "506105.NS", "511593.NS", "514412.NS",
-            "539246.NS", "531416.NS", "524210.NS", "543309.NS", "FAALCON.NS",
-            "INSPIRE.NS", "505523.NS", "531780.NS", "513422.NS", "500450.NS",
-            "540023.NS", "531821.NS", "511116.NS", "540615.NS", "532124.NS",
-            "512441.NS", "508571.NS", "531262.NS", "532092.NS", "521131.NS",
-            "524038.NS", "VIKASWSP.NS", "530405.NS", "530289.NS", "506981.NS",
-            "514266.NS", "516096.NS", "511533.NS", "ANKITMETAL.NS", "537840.NS",
-            "541178.NS", "508664.NS", "544011.NS", "542906.NS", "521222.NS",
-            "501151.NS", "538897.NS", "503685.NS", "514028.NS", "524522.NS",
-            "542850.NS", "SPRL.NS", "541444.NS", "531402.NS", "523489.NS",
-            "532304.NS", "CALSOFT.NS", "532167.NS", "TVVISION.NS", "544245.NS",
-            "511758.NS", "SANGINITA.NS", "517360.NS", "539521.NS", "531574.NS",
-            "519230.NS", "NIDAN.NS", "514221.NS", "519415.NS", "531778.NS",
-            "SPPPOLY.NS", "538935.NS", "531552.NS", "532042.NS", "544237.NS",
-            "538597.NS", "AILIMITED.NS", "514177.NS", "526711.NS", "526373.NS",
-            "NIRAJISPAT.NS", "513303.NS", "519242.NS", "SRPL.NS", "532007.NS",
-            "522209.NS", "530231.NS", "532131.NS", "BLUECHIP.NS", "540696.NS",
-            "ACEINTEG.NS", "531784.NS", "543537.NS", "543934.NS", "539120.NS",
-            "CONTI.NS", "531557.NS", "503657.NS", "GTECJAINX.NS", "CMRSL.NS",
-            "511535.NS", "513528.NS", "537985.NS", "530267.NS", "531893.NS",
-            "543520.NS", "530263.NS", "531156.NS", "538609.NS", "519097.NS",
-            "531737.NS", "GAJANAND.NS", "516110.NS", "522036.NS", "530779.NS",
-            "531626.NS", "YCCL.NS", "544160.NS", "511246.NS", "531255.NS",
-            "539661.NS", "515059.NS", "538521.NS", "531613.NS", "530821.NS",
-            "542446.NS", "531259.NS", "526761.NS", "532001.NS", "519463.NS",
-            "543341.NS", "526508.NS", "VIVIDHA.NS", "530369.NS", "544312.NS",
-            "513173.NS", "531797.NS", "523467.NS", "539526.NS", "CLOUD.NS",
-            "540144.NS", "541771.NS", "543656.NS", "541634.NS", "532217.NS",
-            "544175.NS", "506520.NS", "530829.NS", "538794.NS", "539143.NS",
-            "538975.NS", "521105.NS", "511000.NS", "HEADSUP.NS", "UNIINFO.NS",
-            "532105.NS", "531436.NS", "540821.NS", "COMPINFO.NS", "BIKEWO.NS",
-            "538452.NS", "544269.NS", "543256.NS", "543595.NS", "526687.NS",
-            "524400.NS", "SUNREST.NS", "EXCELLENT.NS", "MPTODAY.NS", "542667.NS",
-            "521210.NS", "540703.NS", "517397.NS", "538743.NS", "540259.NS",
-            "BOSS.NS", "544378.NS", "543606.NS", "530665.NS", "531003.NS",
-            "508980.NS", "539599.NS", "TIJARIA.NS", "519483.NS", "519506.NS",
-            "514128.NS", "GUJRAFFIA.NS", "534741.NS", "544101.NS", "VERITAAS.NS",
-            "JIWANRAM.NS", "531286.NS", "536846.NS", "539409.NS", "507486.NS",
-            "530201.NS", "SAROJA.NS", "512064.NS", "540072.NS", "509024.NS",
-            "539291.NS", "523620.NS", "505840.NS", "542034.NS", "514454.NS",
-            "512565.NS", "539189.NS", "530697.NS", "539110.NS", "517356.NS",
-            "543372.NS", "511636.NS", "530459.NS", "526532.NS", "MARINETRAN.NS",
-            "539174.NS", "508961.NS", "512591.NS", "LYPSAGEMS.NS", "543516.NS",
-            "539584.NS", "541983.NS", "516098.NS", "524434.NS", "544052.NS",
-            "517336.NS", "544373.NS", "534338.NS", "VIKASPROP.NS", "MANAV.NS",
-            "543207.NS", "513063.NS", "501622.NS", "526554.NS", "532676.NS",
-            "514332.NS", "531539.NS", "EDUCOMP.NS", "544015.NS", "504392.NS",
-            "531246.NS", "523832.NS", "538273.NS", "539091.NS", "531583.NS",
-            "538838.NS", "GSTL.NS", "544324.NS", "521068.NS", "538742.NS",
-            "530259.NS", "526622.NS", "ISHAN.NS", "543830.NS", "532145.NS",
-            "513575.NS", "531962.NS", "QFIL.NS", "542682.NS", "542865.NS",
-            "507970.NS", "544002.NS", "531758.NS", "530025.NS", "542654.NS",
-            "544366.NS", "512624.NS", "543352.NS", "544168.NS", "544368.NS",
-            "511501.NS", "RADAAN.NS", "539770.NS", "542771.NS", "538895.NS",
-            "531099.NS", "531210.NS", "521226.NS", "536709.NS", "507984.NS",
-            "530675.NS", "522289.NS", "508956.NS", "509563.NS", "506365.NS",
-            "521206.NS", "513713.NS", "531411.NS", "523826.NS", "540955.NS",
-            "531644.NS", "530171.NS", "530055.NS", "530907.NS", "MAKS.NS",
-            "519500.NS", "VCL.NS", "524723.NS", "538928.NS", "502281.NS",
-            "540936.NS", "513699.NS", "526473.NS", "531015.NS", "SANWARIA.NS",
-            "542803.NS", "531909.NS", "538922.NS", "540266.NS", "511543.NS",
-            "539839.NS", "511601.NS", "509845.NS", "IMPEXFERRO.NS", "539124.NS",
-            "540063.NS", "505685.NS", "530809.NS", "530127.NS", "505515.NS",
-            "511092.NS", "530899.NS", "543745.NS", "531346.NS", "531406.NS",
-            "ANTGRAPHIC.NS", "520141.NS", "508922.NS", "540811.NS", "514197.NS",
-            "WINNY.NS", "503863.NS", "506935.NS", "TCIFINANCE.NS", "521242.NS",
-            "516106.NS", "ONELIFECAP.NS", "517201.NS", "544094.NS", "DRL.NS",
-            "513401.NS", "544236.NS", "531640.NS", "541338.NS", "522245.NS",
-            "505320.NS", "544398.NS", "539190.NS", "538788.NS", "531471.NS",
-            "501477.NS", "538496.NS", "SILLYMONKS.NS", "523722.NS", "509084.NS",
-            "DRSCARGO.NS", "501351.NS", "511738.NS", "PLADAINFO.NS", "530167.NS",
-            "542332.NS", "526604.NS", "530565.NS", "519606.NS", "530469.NS",
-            "MARSHALL.NS", "530669.NS", "506122.NS", "526755.NS", "502893.NS",
-            "535910.NS", "539016.NS", "540729.NS", "530141.NS", "EASTSILK.NS",
-            "540243.NS", "539900.NS", "521048.NS", "507966.NS", "524414.NS",
-            "524748.NS", "500192.NS", "543927.NS", "543979.NS", "523594.NS",
-            "535431.NS", "542728.NS", "531509.NS", "520131.NS", "530151.NS",
-            "SHYAMTEL.NS", "531628.NS", "511710.NS", "RAJASPETRO.NS", "544231.NS",
-            "GLFL.NS", "531091.NS", "543519.NS", "536710.NS", "532072.NS",
-            "539228.NS", "522027.NS", "530445.NS", "506947.NS", "532164.NS",
-            "539149.NS", "540782.NS", "INDIALEASE.NS", "539946.NS", "QUADPRO.NS",
-            "544025.NS", "538708.NS", "511377.NS", "519191.NS", "530119.NS",
-            "524576.NS", "531582.NS", "523712.NS", "538212.NS", "507833.NS",
-            "526891.NS", "508963.NS", "544139.NS", "532315.NS", "514113.NS",
-            "542918.NS", "514264.NS", "533018.NS", "UMESLTD.NS", "GLOBALE.NS",
-            "531228.NS", "531137.NS", "530177.NS", "530065.NS", "511664.NS",
-            "536738.NS", "526500.NS", "540310.NS", "519285.NS", "526477.NS",
-            "543905.NS", "543310.NS", "531553.NS", "531911.NS", "SUULD.NS",
-            "CREATIVEYE.NS", "WINSOME.NS", "523652.NS", "538422.NS", "542938.NS",
-            "531157.NS", "MTEDUCARE.NS", "544190.NS", "521234.NS", "539492.NS",
-            "511730.NS", "OMKARCHEM.NS", "533149.NS", "AHIMSA.NS", "540026.NS",
-            "EUROTEXIND.NS", "524768.NS", "539662.NS", "543286.NS", "521062.NS",
-            "507938.NS", "500142.NS", "514378.NS", "BCP.NS", "539559.NS",
-            "500277.NS", "511122.NS", "543545.NS", "540269.NS", "531506.NS",
-            "513117.NS", "VIVO.NS", "512301.NS", "531505.NS", "509423.NS",
-            "532825.NS", "540359.NS", "521161.NS", "531676.NS", "539692.NS",
-            "DHTL.NS", "509073.NS", "514240.NS", "511110.NS", "538918.NS",
-            "511493.NS", "539947.NS", "542666.NS", "538568.NS", "514248.NS",
-            "544221.NS", "FELDVR.NS", "531360.NS", "503624.NS", "532745.NS",
-            "530799.NS", "531203.NS", "526431.NS", "543617.NS", "539206.NS",
-            "543798.NS", "500357.NS", "514386.NS", "ARENTERP.NS", "538707.NS",
-            "DCMFINSERV.NS", "539119.NS", "BALCO.NS", "500358.NS", "509760.NS",
-            "523242.NS", "523782.NS", "511401.NS", "523151.NS", "502271.NS",
-            "539090.NS", "514460.NS", "539506.NS", "530429.NS", "531158.NS",
-            "526251.NS", "539224.NS", "526113.NS", "540174.NS", "538770.NS",
-            "539884.NS", "530035.NS", "531672.NS", "540756.NS", "531887.NS",
-            "524808.NS", "SHUBHLAXMI.NS", "514140.NS", "523387.NS", "512217.NS",
-            "526977.NS", "544337.NS", "AMIABLE.NS", "501148.NS", "531338.NS",
-            "524727.NS", "524546.NS", "544220.NS", "530111.NS", "512443.NS",
-            "541799.NS", "539123.NS", "511734.NS", "531397.NS", "524458.NS",
-            "531017.NS", "538787.NS", "521080.NS", "532744.NS", "531413.NS",
-            "SAHAJ.NS", "526143.NS", "ORTINGLOBE.NS", "524606.NS", "542627.NS",
-            "532100.NS", "530595.NS", "539449.NS", "526869.NS", "530063.NS",
-            "513430.NS", "511507.NS", "509015.NS", "544183.NS", "531257.NS",
-            "512405.NS", "544188.NS", "540467.NS", "543521.NS", "543623.NS",
-            "530295.NS", "SHANTI.NS", "530251.NS", "531409.NS", "RITEZONE.NS",
-            "537254.NS", "INDIFRA.NS", "PERFECT.NS", "540132.NS", "504378.NS",
-            "543171.NS", "543209.NS", "523790.NS", "531991.NS", "531762.NS",
-            "531441.NS", "524752.NS", "522237.NS", "539014.NS", "507808.NS",
-            "531878.NS", "501945.NS", "538520.NS", "544173.NS", "542477.NS",
-            "524514.NS", "519262.NS", "511463.NS", "531341.NS", "524604.NS",
-            "KTL.NS", "PREMIER.NS", "521054.NS", "531334.NS", "539111.NS",
-            "507759.NS", "507917.NS", "543651.NS", "541337.NS", "543247.NS",
-            "520081.NS", "531027.NS", "523222.NS", "530797.NS", "526588.NS",
-            "530421.NS", "511187.NS", "531779.NS", "523519.NS", "540481.NS",
-            "541299.NS", "516038.NS", "514400.NS", "526859.NS", "531578.NS",
-            "512297.NS", "519479.NS", "540267.NS", "523351.NS", "531029.NS",
-            "535647.NS", "534708.NS", "538596.NS", "530839.NS", "CBAZAAR.NS",
-            "535657.NS", "GATECHDVR.NS", "523062.NS", "504340.NS", "538569.NS",
-            "FALCONTECH.NS", "524624.NS", "TRANSWIND.NS", "512415.NS", "538919.NS",
-            "SABAR.NS", "513488.NS", "511563.NS", "526468.NS", "509835.NS",
-            "516062.NS", "538894.NS", "531456.NS", "536672.NS", "513540.NS",
-            "509449.NS", "JALAN.NS", "512618.NS", "537709.NS", "531661.NS",
-            "526081.NS", "504397.NS", "544056.NS", "532397.NS", "531280.NS",
-            "540416.NS", "534639.NS", "537573.NS", "538881.NS", "531240.NS",
-            "539278.NS", "540221.NS", "531465.NS", "SETUINFRA.NS", "531928.NS",
-            "538081.NS", "531902.NS", "FSC.NS", "531043.NS", "532379.NS",
-            "531846.NS", "538579.NS", "505797.NS", "531387.NS", "RAMGOPOLY.NS",
-            "526133.NS", "511728.NS", "526439.NS", "531486.NS", "512279.NS",
-            "531265.NS", "543289.NS", "531274.NS", "531323.NS", "538874.NS",
-            "538319.NS", "531585.NS", "539384.NS", "507515.NS", "532041.NS",
-            "539406.NS", "542176.NS", "530057.NS", "SMVD.NS", "503659.NS",
-            "535514.NS", "ACCORD.NS", "539669.NS", "544156.NS", "526841.NS",
-            "PADMALAYAT.NS", "539621.NS", "531444.NS", "538464.NS", "517044.NS",
-            "531235.NS", "542678.NS", "543500.NS", "531680.NS", "AMJUMBO.NS",
-            "511688.NS", "530735.NS", "531300.NS", "531304.NS", "530765.NS",
-            "524055.NS", "507609.NS", "526574.NS", "526441.NS", "530271.NS",
-            "505502.NS", "519031.NS", "538860.NS", "526813.NS", "523425.NS",
-            "535205.NS", "535204.NS", "538351.NS", "512169.NS", "531352.NS",
-            "519604.NS", "531221.NS", "526568.NS", "506313.NS", "531272.NS",
-            "539767.NS", "542025.NS", "539596.NS", "526187.NS", "516020.NS",
-            "526225.NS", "ALPSINDUS.NS", "531769.NS", "541890.NS", "531049.NS",
-            "512097.NS", "526877.NS", "523896.NS", "512109.NS", "540108.NS",
-            "542923.NS", "531433.NS", "531370.NS", "536128.NS", "524628.NS",
-            "543579.NS", "512604.NS", "539032.NS", "519214.NS", "511644.NS",
-            "532340.NS", "530795.NS", "541703.NS", "530931.NS", "538667.NS",
-            "543536.NS", "538952.NS", "530027.NS", "530187.NS", "LAKPRE.NS",
-            "543377.NS", "519064.NS", "533110.NS", "534422.NS", "531314.NS",
-            "530993.NS", "513721.NS", "530571.NS", "531396.NS", "543541.NS",
-            "500426.NS", "539402.NS", "512344.NS", "523113.NS", "543475.NS",
-            "524580.NS", "SABEVENTS.NS", "511760.NS", "540386.NS", "526799.NS",
-            "504369.NS", "532113.NS", "531051.NS", "515127.NS", "530439.NS",
-            "503772.NS", "542765.NS", "533268.NS", "530207.NS", "543613.NS",
-            "532015.NS", "513403.NS", "526494.NS", "530663.NS", "531668.NS",
-            "506543.NS", "538857.NS", "539800.NS", "526675.NS", "531432.NS",
-            "530281.NS", "531541.NS", "539408.NS", "530755.NS", "526525.NS",
-            "531458.NS", "539288.NS", "512481.NS", "526865.NS", "543804.NS",
-            "531989.NS", "511451.NS", "530921.NS", "531925.NS", "513309.NS",
-            "539096.NS", "543444.NS", "526795.NS", "540134.NS", "511585.NS",
-            "526751.NS", "513579.NS", "508860.NS", "531944.NS", "531219.NS",
-            "530683.NS", "538993.NS", "531283.NS", "531812.NS", "524031.NS",
-            "503675.NS", "543274.NS", "512359.NS", "KRISNAFILA.NS", "517399.NS",
-            "539099.NS", "513397.NS", "531155.NS", "539982.NS", "CMICABLES.NS",
-            "BGLOBAL.NS", "ORTEL.NS", "540695.NS", "532359.NS", "531460.NS",
-            "531083.NS", "530161.NS", "504356.NS", "526839.NS", "501311.NS",
-            "532354.NS", "531594.NS", "513513.NS", "532378.NS", "526115.NS",
-            "530771.NS", "519174.NS", "509038.NS", "539383.NS", "521188.NS",
-            "519014.NS", "533019.NS", "531039.NS", "531681.NS", "514260.NS",
-            "530855.NS", "531288.NS", "531867.NS", "521036.NS", "537582.NS",
-            "539593.NS", "534190.NS", "543400.NS", "526967.NS", "524642.NS",
-            "526905.NS", "531775.NS", "534755.NS", "539335.NS", "526983.NS",
-            "539495.NS", "532645.NS", "QUINTEGRA.NS", "530173.NS", "530547.NS",
-            "536965.NS", "539835.NS", "538674.NS", "532444.NS", "511660.NS",
-            "539405.NS", "540515.NS", "531929.NS", "530581.NS", "531686.NS",
-            "519367.NS", "531568.NS", "513460.NS", "RAJVIR.NS", "532766.NS",
-            "511634.NS", "538465.NS", "501144.NS", "539911.NS", "513452.NS",
-            "530733.NS", "531496.NS", "531716.NS", "531913.NS", "538765.NS",
-            "530985.NS", "526941.NS", "526001.NS", "530093.NS", "538542.NS",
-            "531834.NS", "532139.NS", "531515.NS", "530611.NS", "542377.NS",
-            "521003.NS", "526504.NS", "541627.NS", "531692.NS", "SANCO.NS",
-            "535917.NS", "530443.NS", "539544.NS", "517320.NS", "524590.NS",
-            "540159.NS", "526195.NS", "520121.NS", "531191.NS", "532303.NS",
-            "543366.NS", "513687.NS", "532403.NS", "519279.NS", "502850.NS",
-            "509099.NS", "VASA.NS", "500178.NS", "539673.NS", "504375.NS",
-            "539434.NS", "542155.NS", "505520.NS", "524504.NS", "526887.NS",
-            "526823.NS", "531327.NS", "GANGOTRI.NS", "512197.NS", "506945.NS",
-            "539026.NS", "526883.NS", "531499.NS", "531207.NS", "539486.NS",
-            "532336.NS", "512091.NS", "505100.NS"
-]
-        
-        # To get complete list, you can scrape from NSE or use this approach:
+        return list(load_universe(universe or self.universe))
+    
+    @property
+    def master_df(self):
         """
-        # Option 1: Read from NSE official equity list
-        # Download from: https://www.nseindia.com/market-data/live-equity-market
-        
-        # Option 2: Use nsetools library
-        # from nsetools import Nse
-        # nse = Nse()
-        # all_stocks = nse.get_stock_codes()
-        # nse_symbols = [f"{symbol}.NS" for symbol in all_stocks.keys() if symbol != 'SYMBOL']
+        Combined master DataFrame, sorted by symbol and date
         """
-        
-        return nse_symbols
+        return self.store.frame()
+    
+    @master_df.setter
+    def master_df(self, df):
+        self.store.clear()
+        self.store.put(df)
     
     def load_existing_data(self):
         """
-        Load existing master CSV if it exists
+        Load existing partitions (or the master CSV) if they exist
         """
-        if os.path.exists(self.master_file):
+        if os.path.isdir(self.store.partition_dir) or os.path.exists(self.master_file):
             try:
-                self.master_df = pd.read_csv(self.master_file)
-                print(f"Loaded existing data: {len(self.master_df)} rows")
-                
-                # Get list of already fetched companies
-                if 'symbol' in self.master_df.columns:
-                    fetched_symbols = self.master_df['symbol'].unique().tolist()
-                    print(f"Already have data for {len(fetched_symbols)} companies")
-                    return fetched_symbols
+                fetched_symbols = self.store.load(self.master_file)
+                self.derived.load(fetched_symbols)
+                self.ttm.load()
+                self.quality.load()
+                self.ranks.load()
+                print(f"Loaded existing data: {len(self.store)} rows")
+                print(f"Already have data for {len(fetched_symbols)} companies")
+                return list(fetched_symbols)
             except Exception as e:
                 print(f"Error loading existing file: {e}")
-                self.master_df = pd.DataFrame()
+                self.store.clear()
         else:
-            self.master_df = pd.DataFrame()
             print("Starting fresh - no existing data file")
         
         return []
@@ -1073,7 +126,7 @@ class NSEFinancialScraper:
         """
         Fetch financial data for a single company
         """
-        url = f"https://www.perplexity.ai/rest/finance/financials/{symbol}"
+        url = f"{self.base_url}/rest/finance/financials/{symbol}"
         
         headers = {
             'Accept': 'application/json, text/plain, */*',
@@ -1096,29 +149,84 @@ class NSEFinancialScraper:
             'source': 'default'
         }
         
+        entry = {'symbol': symbol, 'started': datetime.now(), 'method': self.fetch_method,
+                 'profile': None, 'status': None, 'retries': 0, 'bytes': 0}
+        clock = time.perf_counter()
         try:
             # Try with browser impersonation
-            for browser in ['chrome120', 'chrome110', 'firefox120']:
-                response = requests.get(
-                    url,
-                    headers=headers,
-                    params=params,
-                    impersonate=browser,
-                    timeout=10
-                )
+            for attempt, browser in enumerate(['chrome120', 'chrome110', 'firefox120']):
+                entry.update(profile=browser, retries=attempt, status=None)
+                if attempt:
+                    self.metrics.retries.inc(profile=browser)
+                started = time.perf_counter()
+                with self.profiler.stage('fetch'):
+                    # A fresh session per request, as requests.get uses, that also keeps curl's timers
+                    with requests.Session(curl_infos=list(TIMING_INFOS.values())) as session:
+                        response = session.get(
+                            url,
+                            headers=headers,
+                            params=params,
+                            impersonate=browser,
+                            timeout=10
+                        )
+                self.metrics.request_seconds.observe(time.perf_counter() - started, profile=browser)
+                self.metrics.requests.inc(status=response.status_code, profile=browser)
+                self.metrics.bytes.inc(len(response.content), profile=browser)
+                self._record_timings(browser, response)
+                entry['status'] = response.status_code
+                entry['bytes'] += len(response.content)
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    return self._process_company_data(data, symbol)
+                    started = time.perf_counter()
+                    with self.profiler.stage('decode'):
+                        data = response.json()
+                    self.missing.discard(symbol)
+                    self.aliases.observe(symbol, self._payload_symbol(data))
+                    canonical = self.aliases.resolve(symbol)
+                    with self.profiler.stage('normalize'):
+                        self.ttm.put(canonical, quarterly_frame(data, canonical))
+                        company_data = self._process_company_data(data, canonical)
+                    self.metrics.parse_seconds.observe(time.perf_counter() - started)
+                    self._finish_attempt(entry, clock, 'ok' if company_data is not None else 'empty',
+                                         rows=0 if company_data is None else len(company_data))
+                    return company_data
                 elif response.status_code == 404:
                     print(f"  {symbol}: Not found on Perplexity")
+                    self.missing.add(symbol)
+                    self._finish_attempt(entry, clock, 'not_found')
                     return None
                 elif response.status_code == 403:
                     continue
                     
         except Exception as e:
             print(f"  {symbol}: Error - {str(e)[:50]}")
+            self.metrics.errors.inc(type=type(e).__name__)
+            self._finish_attempt(entry, clock, 'error', error=type(e).__name__)
+            return None
         
+        self._finish_attempt(entry, clock, 'failed')
+        return None
+    
+    def _finish_attempt(self, entry, clock, outcome, rows=0, error=None):
+        self.metrics.symbols.inc(outcome=outcome)
+        self.ledger.record(**entry, finished=datetime.now(), outcome=outcome, rows=rows, error=error,
+                           latency_ms=round((time.perf_counter() - clock) * 1000.0, 2))
+    
+    def _record_timings(self, profile, response):
+        timings = request_timings(response)
+        self.timings.record(profile, response.status_code, timings)
+        for phase, seconds in timings.items():
+            if phase != 'bytes' and seconds == seconds:
+                self.metrics.phase_seconds.observe(seconds, phase=phase, profile=profile)
+
+    def _payload_symbol(self, data):
+        """
+        Symbol the payload itself reports, if any
+        """
+        if isinstance(data, dict):
+            for statement in data.get('annual') or []:
+                if isinstance(statement, dict) and statement.get('data'):
+                    return statement['data'][0].get('symbol')
         return None
     
     def _process_company_data(self, data, symbol):
@@ -1133,6 +241,9 @@ class NSEFinancialScraper:
             annual_data = data['annual']
         
         if annual_data:
+            if self.long_store is not None:
+                self.long_store.catalog.observe_payload(annual_data)
+            
             for statement in annual_data:
                 if isinstance(statement, dict) and 'data' in statement:
                     statement_type = statement.get('type', '')
@@ -1170,56 +281,201 @@ class NSEFinancialScraper:
         
         return None
     
-    def update_master_data(self, new_data):
+    def update_master_data(self, new_data, fetched_at=None):
         """
         Update master DataFrame with new company data
         """
         if new_data is None or new_data.empty:
             return
+        started = time.perf_counter()
         
-        if self.master_df is None or self.master_df.empty:
-            self.master_df = new_data
-        else:
-            # Remove existing data for this symbol if updating
-            symbol = new_data['symbol'].iloc[0]
-            self.master_df = self.master_df[self.master_df['symbol'] != symbol]
-            
-            # Append new data
-            self.master_df = pd.concat([self.master_df, new_data], ignore_index=True)
+        if fetched_at is None:
+            fetched_at = datetime.now().isoformat(timespec='seconds')
+        
+        new_data = self._merge_aliases(new_data)
+        previous = self.store.get(new_data['symbol'].iloc[0])
+        
+        # Record changed values before the master row is replaced
+        self.history.record(new_data, fetched_at, previous)
+        
+        self.last_changes = compute_changes(previous, new_data, fetched_at)
+        self.changes.append(self.last_changes)
+        self.derived.invalidate(new_data['symbol'].iloc[0], self.last_changes)
+        self.unvalidated.add(new_data['symbol'].iloc[0])
+        self.unranked.add(new_data['symbol'].iloc[0])
+        
+        # Replaces this symbol's partition; other symbols are untouched
+        self.store.put(new_data)
+        
+        if self.long_store is not None:
+            self.long_store.put(new_data)
+        
+        self.metrics.merge_seconds.observe(time.perf_counter() - started)
+    
+    def _merge_aliases(self, new_data):
+        """
+        Store rows under the current symbol and fold in rows kept under old ones
+        """
+        symbol = self.aliases.resolve(new_data['symbol'].iloc[0])
+        if symbol != new_data['symbol'].iloc[0]:
+            new_data = new_data.assign(symbol=symbol)
+        
+        for old in self.aliases.old_symbols(symbol):
+            old_rows = self.store.get(old)
+            if old_rows is None:
+                continue
+            # Years only present under the old ticker become part of this history
+            old_rows = old_rows.assign(symbol=symbol,
+                                       date=pd.to_datetime(old_rows['date']).dt.strftime('%Y-%m-%d'))
+            old_rows = old_rows[~old_rows['date'].isin(new_data['date'].astype(str))]
+            new_data = pd.concat([old_rows, new_data], ignore_index=True)
+            self.store.remove(old)
+            self.derived.drop(old)
+            self.ttm.drop(old)
+            self.quality.drop(old)
+            self.unranked.add(old)
+            print(f"  Merged {len(old_rows)} rows from {old} into {symbol}")
+        
+        return new_data
     
-    def save_master_data(self):
+    def save_master_data(self, export=False):
         """
-        Save master DataFrame to CSV
+        Checkpoint changed partitions; optionally export the combined CSV
         """
-        if self.master_df is not None and not self.master_df.empty:
-            # Sort by symbol and date
-            if 'date' in self.master_df.columns:
-                self.master_df['date'] = pd.to_datetime(self.master_df['date'])
-                self.master_df = self.master_df.sort_values(['symbol', 'date'])
-                self.master_df['date'] = self.master_df['date'].dt.strftime('%Y-%m-%d')
+        started = time.perf_counter()
+        self.missing.save()
+        self.aliases.save()
+        self.planner.save()
+        
+        if self.store.symbols:
+            written = self.store.checkpoint()
+            print(f"\n✓ Saved {written} changed companies to {self.store.partition_dir}/")
+            
+            if self.long_store is not None:
+                self.long_store.save()
+                print(f"✓ Saved long format to {self.long_store.directory}/")
+            
+            if self.unvalidated:
+                self.validate_pending()
+            self.quality.save()
+            if export:
+                self.quality.export()
             
-            # Save to CSV
-            self.master_df.to_csv(self.master_file, index=False)
-            print(f"\n✓ Saved {len(self.master_df)} rows to {self.master_file}")
+            if self.ttm.dirty:
+                updated = self.ttm.refresh()
+                print(f"✓ Updated TTM rollups for {updated} companies -> {self.ttm.ttm_dir}/")
+            self.ttm.save()
+            if export and len(self.ttm):
+                self.ttm.export()
+                print(f"✓ Exported TTM rollups for {len(self.ttm)} companies -> {self.ttm.ttm_file}")
+            
+            if export and self.out_of_core:
+                # Bounded-memory k-way merge of the sorted per-symbol runs; the
+                # other sinks then read the merged CSV back a chunk at a time
+                self.store.export(self.master_file)
+                print(f"✓ Merged {len(self.store)} rows into {self.master_file}")
+                extra = MultiSinkWriter(self.writer.sinks[1:])
+                self._report_sinks(extra.write_chunks(read_csv_chunks(self.master_file)))
+            elif export:
+                self._report_sinks(self.writer.write(self.store.frame()))
+            
+            if export:
+                # Ratios and growth series next to the raw metrics
+                recomputed = self.derived.refresh(self.store)
+                self.derived.save()
+                print(f"✓ Recomputed derived metrics for {recomputed} companies "
+                      f"-> {self.derived_file}")
+                
+                if self.unranked:
+                    self.update_ranks()
             
             # Show summary
-            unique_symbols = self.master_df['symbol'].nunique()
-            print(f"  Total companies: {unique_symbols}")
-            print(f"  Total rows: {len(self.master_df)}")
-            print(f"  Columns: {len(self.master_df.columns)}")
+            print(f"  Total companies: {len(self.store.symbols)}")
+            print(f"  Total rows: {len(self.store)}")
+            print(f"  Columns: {len(self.store.columns)}")
+        
+        self.metrics.write_seconds.observe(time.perf_counter() - started,
+                                           kind='export' if export else 'checkpoint')
+        self.metrics.registry.write(self.metrics_file)
+        self.ledger.flush()
+    
+    def _report_sinks(self, results):
+        for result in results:
+            if result.error:
+                print(f"✗ {result.name}: {result.error}")
+            else:
+                print(f"✓ Exported {len(self.store)} rows to {result.path} "
+                      f"({result.bytes / 1e6:.1f} MB in {result.seconds:.2f}s)")
+    
+    def validate_pending(self):
+        """
+        Validate companies updated since the last checkpoint in one batch
+        """
+        symbols = sorted(s for s in self.unvalidated if s in self.store)
+        self.unvalidated = set()
+        if not symbols:
+            return
+        found = self.quality.record(pd.concat([self.store.get(s) for s in symbols], ignore_index=True))
+        if len(found):
+            errors = found[found['severity'] == 'error']
+            print(f"⚠ Data quality: {len(found)} flags for {found['symbol'].nunique()} of "
+                  f"{len(symbols)} companies ({len(errors)} errors) -> {self.quality.flag_dir}/")
+    
+    def update_ranks(self):
+        """
+        Re-rank companies updated since the last export against the universe
+        """
+        if not len(self.ranks) and self.out_of_core:
+            # Needs the exported master file; never holds the whole table
+            self.ranks.build_chunks(with_derived(chunk, self.derived.frame(chunk['symbol'].unique()))
+                                    for chunk in read_csv_chunks(self.master_file))
+            ranked = len(self.ranks)
+        elif not len(self.ranks):
+            self.ranks.build(with_derived(self.store.frame(), self.derived.frame()))
+            ranked = len(self.ranks)
+        else:
+            symbols = sorted(self.unranked)
+            present = [s for s in symbols if s in self.store]
+            rows = pd.concat([self.store.get(s) for s in present], ignore_index=True) if present \
+                else pd.DataFrame(columns=self.store.columns)
+            ranked = self.ranks.update(with_derived(rows, self.derived.frame(present)), symbols)
+        self.unranked = set()
+        self.ranks.save()
+        print(f"✓ Updated percentiles for {ranked} companies -> {self.ranks.rank_file}")
     
-    def fetch_all_companies(self, limit=None, skip_existing=True):
+    def plan_refresh(self, all_symbols=None):
         """
-        Fetch data for all NSE companies
+        Companies likely to have new filings, most overdue first
         """
-        # Load existing data
-        existing_symbols = self.load_existing_data() if skip_existing else []
+        if all_symbols is None:
+            all_symbols = self.aliases.canonical(self.get_nse_symbols())
+        return self.planner.plan(self.store.latest_dates(), all_symbols)
+    
+    def fetch_all_companies(self, limit=None, skip_existing=True, refresh=False):
+        """
+        Fetch data for all NSE companies.
+        With refresh=True only companies that are due for new filings are fetched.
+        """
+        # Load existing data; always, since new rows are diffed against the stored ones
+        existing_symbols = set(self.load_existing_data())
+        if self.long_store is not None:
+            self.long_store.load()
         
         # Get list of all NSE symbols
-        all_symbols = self.get_nse_symbols()
+        all_symbols = self.aliases.canonical(self.get_nse_symbols())
         
-        # Filter out already fetched symbols
-        symbols_to_fetch = [s for s in all_symbols if s not in existing_symbols]
+        if refresh:
+            plan = self.plan_refresh(all_symbols)
+            symbols_to_fetch = plan['symbol'].tolist()
+            print(f"Refresh plan: {len(symbols_to_fetch)} of {len(all_symbols)} companies due")
+        else:
+            # Filter out already fetched symbols
+            symbols_to_fetch = [s for s in all_symbols if not skip_existing or s not in existing_symbols]
+        
+        # Skip symbols known to 404 (expired entries are rechecked)
+        symbols_to_fetch, known_missing = self.missing.filter(symbols_to_fetch)
+        if known_missing:
+            print(f"Skipping {len(known_missing)} symbols known to be missing on Perplexity")
         
         if limit:
             symbols_to_fetch = symbols_to_fetch[:limit]
@@ -1229,39 +485,61 @@ class NSEFinancialScraper:
         
         successful = 0
         failed = 0
+        self.timings = TimingSummary()
+        self.ledger = RunLedger(self.ledger.directory)
+        self.fetch_method = 'refresh' if refresh else 'crawl'
         
         for i, symbol in enumerate(symbols_to_fetch, 1):
+            self.metrics.queue_depth.set(len(symbols_to_fetch) - i + 1, queue='crawl')
+            # Rate limiting
+            self.limiter.wait()
+            
             print(f"\n[{i}/{len(symbols_to_fetch)}] Fetching {symbol}...", end=" ")
             
             # Fetch data
             company_data = self.fetch_company_data(symbol)
+            self.planner.mark_checked(symbol)
             
             if company_data is not None:
-                self.update_master_data(company_data)
+                with self.profiler.stage('merge'):
+                    self.update_master_data(company_data)
                 successful += 1
                 print(f"✓ ({len(company_data)} years)")
                 
                 # Save periodically (every 10 companies)
                 if successful % 10 == 0:
-                    self.save_master_data()
+                    with self.profiler.stage('save'):
+                        self.save_master_data()
                     print(f"  [Checkpoint: Saved after {successful} companies]")
             else:
                 failed += 1
                 print("✗")
-            
-            # Rate limiting
-            if i < len(symbols_to_fetch):
-                delay = random.uniform(2, 4)
-                time.sleep(delay)
         
         # Final save
-        self.save_master_data()
+        self.metrics.queue_depth.set(0, queue='crawl')
+        with self.profiler.stage('save'):
+            self.save_master_data(export=True)
         
         print("\n" + "="*60)
         print(f"COMPLETED: {successful} successful, {failed} failed")
         print(f"Master file: {self.master_file}")
+        summary = self.timings.report()
+        if not summary.empty:
+            summary.to_csv(self.timings_file)
+            print(f"Request timings: {self.timings_file}")
+        print(f"Attempt ledger: {self.ledger.directory}/ (run {self.ledger.run_id})")
         
-        return self.master_df
+        return None if self.out_of_core else self.master_df
+    
+    def load_as_of(self, when):
+        """
+        Rebuild the master dataset as it was known at a past point in time,
+        with the stored column set
+        """
+        columns = self.store.columns
+        if not columns and os.path.exists(self.master_file):
+            columns = pd.read_csv(self.master_file, nrows=0).columns.tolist()
+        return self.history.as_of(when, columns=columns or None)
 
 # Utility function to get complete NSE list
 def get_complete_nse_list():
@@ -1296,12 +574,13 @@ if __name__ == "__main__":
     print("and save to a single CSV file")
     print("-"*60)
     
-    scraper = NSEFinancialScraper()
-    
     # Options
+    UNIVERSE = 'all'  # 'nifty50', 'all' or 'bse'; see universe.py for the NSE lists
     LIMIT = None  # Set to a number to limit companies (None = all)
     SKIP_EXISTING = True  # Skip companies already in the CSV
     
+    scraper = NSEFinancialScraper(universe=UNIVERSE)
+    
     # Fetch all companies
     df = scraper.fetch_all_companies(limit=LIMIT, skip_existing=SKIP_EXISTING)
     
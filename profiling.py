@@ -0,0 +1,212 @@
+import contextlib
+import cProfile
+import csv
+import io
+import os
+import pstats
+import threading
+import time
+import tracemalloc
+
+# Pipeline stages the scraper and the rebuild command mark
+STAGES = ['fetch', 'decode', 'normalize', 'merge', 'save']
+
+_NULL_STAGE = contextlib.nullcontext()
+
+
+class NullProfiler:
+    """
+    Stand-in used when profiling is off: stage() hands back one shared
+    no-op context manager, so a marked stage costs a method call
+    """
+    enabled = False
+
+    def stage(self, name):
+        return _NULL_STAGE
+
+    def report(self):
+        return None
+
+
+NULL_PROFILER = NullProfiler()
+
+
+def sampler_available():
+    try:
+        import pyinstrument  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class _Stage:
+    def __init__(self, name, engine):
+        self.name = name
+        self.calls = 0
+        self.seconds = 0.0
+        self.allocated = 0
+        self.peak = 0
+        self.sites = {}
+        if engine == 'pyinstrument':
+            from pyinstrument import Profiler
+            self.profiler = Profiler(interval=0.001)
+        else:
+            self.profiler = cProfile.Profile()
+
+    def resume(self, engine):
+        if engine == 'pyinstrument':
+            self.profiler.start()
+        else:
+            self.profiler.enable()
+
+    def pause(self, engine):
+        if engine == 'pyinstrument':
+            self.profiler.stop()
+        else:
+            self.profiler.disable()
+
+
+class StageProfiler:
+    """
+    Per-stage CPU profiles and memory figures for marked pipeline stages.
+
+    Each stage gets its own cProfile.Profile, or a pyinstrument sampling
+    profiler when engine is 'pyinstrument' (or 'auto' and it is installed),
+    switched on only while the stage runs; a nested stage pauses the outer
+    one. tracemalloc records each stage's net allocation and peak, and
+    every `snapshot_every`-th call of a stage is diffed by allocation site.
+    Only the thread that created the profiler is profiled.
+    """
+    enabled = True
+
+    def __init__(self, directory="NSE_PROFILE", engine='auto', memory=True, snapshot_every=25):
+        if engine == 'auto':
+            engine = 'pyinstrument' if sampler_available() else 'cprofile'
+        if engine not in ('cprofile', 'pyinstrument'):
+            raise ValueError(f"Unknown profiler '{engine}' (choose auto, cprofile or pyinstrument)")
+        self.directory = directory
+        self.engine = engine
+        self.memory = memory
+        self.snapshot_every = snapshot_every
+        self.stages = {}
+        self.stack = []
+        self.thread = threading.get_ident()
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        if threading.get_ident() != self.thread:
+            yield
+            return
+        stage = self.stages.get(name)
+        if stage is None:
+            stage = self.stages[name] = _Stage(name, self.engine)
+        stage.calls += 1
+        outer = self.stack[-1] if self.stack else None
+        if outer is not None:
+            outer[0].pause(self.engine)
+
+        snapshot = None
+        if self.memory:
+            if self.snapshot_every and (stage.calls - 1) % self.snapshot_every == 0:
+                snapshot = tracemalloc.take_snapshot()
+            before, peak = tracemalloc.get_traced_memory()
+            if outer is not None:
+                # reset_peak() below would lose the outer stage's peak so far
+                outer[1] = max(outer[1], peak)
+            tracemalloc.reset_peak()
+        # [stage, highest traced memory seen by nested stages]
+        frame = [stage, 0]
+        self.stack.append(frame)
+        started = time.perf_counter()
+        stage.resume(self.engine)
+        try:
+            yield
+        finally:
+            stage.pause(self.engine)
+            stage.seconds += time.perf_counter() - started
+            self.stack.pop()
+            if self.memory:
+                current, peak = tracemalloc.get_traced_memory()
+                peak = max(peak, frame[1])
+                stage.allocated += current - before
+                stage.peak = max(stage.peak, peak - before)
+                if outer is not None:
+                    outer[1] = max(outer[1], peak)
+                if snapshot is not None:
+                    self._add_sites(stage, snapshot)
+            if outer is not None:
+                outer[0].resume(self.engine)
+
+    def _add_sites(self, stage, before):
+        after = tracemalloc.take_snapshot().filter_traces(
+            [tracemalloc.Filter(False, tracemalloc.__file__)])
+        for diff in after.compare_to(before, 'lineno'):
+            if diff.size_diff <= 0:
+                continue
+            frame = diff.traceback[0]
+            key = f"{frame.filename}:{frame.lineno}"
+            size, count = stage.sites.get(key, (0, 0))
+            stage.sites[key] = (size + diff.size_diff, count + diff.count_diff)
+
+    def summary(self):
+        rows = []
+        for name in sorted(self.stages, key=lambda s: (STAGES.index(s) if s in STAGES else len(STAGES), s)):
+            stage = self.stages[name]
+            rows.append({
+                'stage': name,
+                'calls': stage.calls,
+                'seconds': round(stage.seconds, 4),
+                'ms_per_call': round(stage.seconds * 1000.0 / stage.calls, 3),
+                'allocated_mb': round(stage.allocated / 1e6, 3) if self.memory else None,
+                'peak_mb': round(stage.peak / 1e6, 3) if self.memory else None,
+            })
+        return rows
+
+    def _cpu_report(self, stage, top):
+        if self.engine == 'pyinstrument':
+            return stage.profiler.output_text(unicode=False, color=False)
+        out = io.StringIO()
+        stats = pstats.Stats(stage.profiler, stream=out)
+        stats.sort_stats('cumulative').print_stats(top)
+        stats.sort_stats('tottime').print_stats(top)
+        return out.getvalue()
+
+    def report(self, top=30):
+        """
+        Write <stage>.txt (CPU profile and top allocation sites), <stage>.prof
+        for cProfile (pstats/snakeviz) and summary.csv; returns the summary rows
+        """
+        if not self.stages:
+            return []
+        os.makedirs(self.directory, exist_ok=True)
+        rows = self.summary()
+        for row in rows:
+            stage = self.stages[row['stage']]
+            with open(os.path.join(self.directory, f"{stage.name}.txt"), 'w', encoding='utf-8') as f:
+                f.write(f"Stage {stage.name}: {stage.calls} calls, {stage.seconds:.3f}s ({self.engine})\n")
+                if self.memory:
+                    f.write(f"Net allocated {stage.allocated / 1e6:.2f} MB, peak {stage.peak / 1e6:.2f} MB "
+                            f"above the stage's starting point\n")
+                f.write("\n" + self._cpu_report(stage, top))
+                if stage.sites:
+                    f.write(f"\nTop allocation sites (every {self.snapshot_every}th call):\n")
+                    ranked = sorted(stage.sites.items(), key=lambda item: item[1][0], reverse=True)
+                    for key, (size, count) in ranked[:top]:
+                        f.write(f"  {size / 1e3:>10.1f} KB {count:>8} blocks  {key}\n")
+            if self.engine == 'cprofile':
+                stage.profiler.dump_stats(os.path.join(self.directory, f"{stage.name}.prof"))
+
+        with open(os.path.join(self.directory, 'summary.csv'), 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+            writer.writeheader()
+            writer.writerows(rows)
+
+        print(f"\nProfile ({self.engine}) -> {self.directory}/")
+        print(f"  {'stage':<10} {'calls':>6} {'seconds':>9} {'ms/call':>9} {'alloc MB':>9} {'peak MB':>8}")
+        for row in rows:
+            memory = (f"{row['allocated_mb']:>9.2f} {row['peak_mb']:>8.2f}" if self.memory else "")
+            print(f"  {row['stage']:<10} {row['calls']:>6} {row['seconds']:>9.3f} "
+                  f"{row['ms_per_call']:>9.2f} {memory}")
+        return rows
@@ -0,0 +1,231 @@
+import pandas as pd
+import numpy as np
+import os
+
+# Columns that are labels, not metrics to rank
+NON_METRIC_COLUMNS = {'symbol', 'date', 'reportedCurrency', 'cik', 'fillingDate', 'acceptedDate',
+                      'calendarYear', 'period'}
+
+# Above this share of changed companies a full re-rank is cheaper
+REBUILD_FRACTION = 0.05
+
+
+def _tie_counts(values):
+    """
+    For every cell of a (metrics, years, companies) array, how many
+    companies in the same metric and year have a smaller value and how many
+    share its value. Computed with one sort along the company axis.
+    """
+    size = values.shape[-1]
+    order = np.argsort(values, axis=-1, kind='stable')
+    ordered = np.take_along_axis(values, order, axis=-1)
+    position = np.broadcast_to(np.arange(size), values.shape)
+
+    starts = np.ones(values.shape, dtype=bool)
+    starts[..., 1:] = ordered[..., 1:] != ordered[..., :-1]
+    first = np.maximum.accumulate(np.where(starts, position, 0), axis=-1)
+    ends = np.ones(values.shape, dtype=bool)
+    ends[..., :-1] = starts[..., 1:]
+    last = np.minimum.accumulate(np.where(ends, position, size)[..., ::-1], axis=-1)[..., ::-1]
+
+    less = np.empty(values.shape, dtype=np.int32)
+    equal = np.empty(values.shape, dtype=np.int32)
+    np.put_along_axis(less, order, first.astype(np.int32), axis=-1)
+    np.put_along_axis(equal, order, (last - first + 1).astype(np.int32), axis=-1)
+    missing = np.isnan(values)
+    less[missing] = -1
+    equal[missing] = 0
+    return less, equal
+
+
+class RankEngine:
+    """
+    Percentile of every company on every metric within each fiscal year.
+
+    Ranks are kept as integer counts per (metric, year, company): how many
+    companies are below and how many tie, plus the number with a value.
+    The percentile is (below + (ties + 1) / 2) / count, the same as pandas'
+    rank(pct=True), so a lookup is a few array reads. When a few companies
+    change, each one's old and new values are compared against the column
+    to shift everyone else's counts, with no re-sort.
+    """
+    def __init__(self, rank_file="NSE_PERCENTILES.npz"):
+        self.rank_file = rank_file
+        self.metrics = []
+        self.years = []
+        self.symbols = []
+        self._index()
+        self.values = np.empty((0, 0, 0))
+        self.less = np.empty((0, 0, 0), dtype=np.int32)
+        self.equal = np.empty((0, 0, 0), dtype=np.int32)
+        self.counts = np.empty((0, 0), dtype=np.int32)
+
+    def _index(self):
+        self.metric_pos = {m: i for i, m in enumerate(self.metrics)}
+        self.year_pos = {y: i for i, y in enumerate(self.years)}
+        self.symbol_pos = {s: i for i, s in enumerate(self.symbols)}
+
+    def __len__(self):
+        return len(self.symbols)
+
+    def _layout(self, df):
+        """
+        Company and year positions of df's rows, growing the axes for new ones
+        """
+        years = pd.to_datetime(df['date']).dt.year.to_numpy()
+        new_years = sorted(set(years.tolist()) - set(self.years))
+        new_symbols = sorted(set(df['symbol']) - set(self.symbols))
+        if new_years or new_symbols:
+            self.years = sorted(self.years + new_years)
+            self.symbols = self.symbols + new_symbols
+            shape = (len(self.metrics), len(self.years), len(self.symbols))
+            old_shape = self.values.shape
+            old_years = [self.years.index(y) for y in self.year_pos]
+            # New cells start out missing: no value, no rank
+            for name, fill in (('values', np.nan), ('less', -1), ('equal', 0)):
+                current = getattr(self, name)
+                grown = np.full(shape, fill, dtype=current.dtype)
+                if current.shape == old_shape:
+                    grown[:, old_years, :old_shape[2]] = current
+                setattr(self, name, grown)
+            counts = np.zeros(shape[:2], dtype=np.int32)
+            if self.counts.shape == old_shape[:2]:
+                counts[:, old_years] = self.counts
+            self.counts = counts
+            self._index()
+        return (np.array([self.year_pos[y] for y in years], dtype=np.intp),
+                df['symbol'].map(self.symbol_pos).to_numpy(dtype=np.intp))
+
+    def build(self, df, metrics=None):
+        """
+        Rank all companies from scratch; df has one row per (symbol, fiscal year)
+        """
+        if metrics is None:
+            metrics = [c for c in df.columns if c not in NON_METRIC_COLUMNS
+                       and pd.api.types.is_numeric_dtype(df[c])]
+        self.metrics = list(metrics)
+        self.years = []
+        self.symbols = []
+        self.values = np.empty((len(self.metrics), 0, 0))
+        self._index()
+        year_idx, symbol_idx = self._layout(df)
+        block = df[self.metrics].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        self.values[:, year_idx, symbol_idx] = block.T
+        self._rank_all()
+
+    def build_chunks(self, chunks):
+        """
+        Rank all companies from frames read one at a time, e.g. chunks of the
+        exported CSV; values are filled in as they arrive and ranked once
+        """
+        self.metrics = []
+        self.years = []
+        self.symbols = []
+        self.values = np.empty((0, 0, 0))
+        self._index()
+        for df in chunks:
+            new = [c for c in df.columns if c not in NON_METRIC_COLUMNS and c not in self.metric_pos
+                   and pd.api.types.is_numeric_dtype(df[c])]
+            if new:
+                grown = np.full((len(new),) + self.values.shape[1:], np.nan)
+                self.values = np.concatenate([self.values, grown])
+                self.metrics += new
+                self._index()
+            year_idx, symbol_idx = self._layout(df)
+            block = df.reindex(columns=self.metrics).apply(pd.to_numeric, errors='coerce')
+            self.values[:, year_idx, symbol_idx] = block.to_numpy(dtype=np.float64).T
+        self._rank_all()
+
+    def _rank_all(self):
+        self.less, self.equal = _tie_counts(self.values)
+        self.counts = (~np.isnan(self.values)).sum(axis=-1).astype(np.int32)
+
+    def update(self, df, symbols=None):
+        """
+        Replace the rows of the companies in df (and of `symbols`, which may
+        include companies that no longer have rows) and adjust everyone's ranks
+        """
+        if not self.metrics:
+            self.build(df)
+            return len(df['symbol'].unique())
+        symbols = sorted(set(df['symbol']) | set(symbols or []))
+        year_idx, symbol_idx = self._layout(df)
+        new = np.full((len(self.metrics), len(self.years), len(self.symbols)), np.nan)
+        block = df.reindex(columns=self.metrics).apply(pd.to_numeric, errors='coerce')
+        new[:, year_idx, symbol_idx] = block.to_numpy(dtype=np.float64).T
+        changed = [self.symbol_pos[s] for s in symbols if s in self.symbol_pos]
+
+        if len(changed) > REBUILD_FRACTION * len(self.symbols):
+            self.values[:, :, changed] = new[:, :, changed]
+            self._rank_all()
+            return len(changed)
+
+        for s in changed:
+            old_value = self.values[:, :, s:s + 1]
+            new_value = new[:, :, s:s + 1]
+            others = self.values
+            # NaN compares False, so a value appearing or vanishing just adds or removes
+            self.less += ((new_value < others).astype(np.int32) - (old_value < others))
+            self.equal += ((new_value == others).astype(np.int32) - (old_value == others))
+            self.counts += (~np.isnan(new_value[..., 0])).astype(np.int32) - ~np.isnan(old_value[..., 0])
+            self.values[:, :, s] = new_value[..., 0]
+            own = new_value
+            self.less[:, :, s] = (self.values < own).sum(axis=-1)
+            self.equal[:, :, s] = (self.values == own).sum(axis=-1)
+            missing = np.isnan(own[..., 0])
+            self.less[:, :, s][missing] = -1
+            self.equal[:, :, s][missing] = 0
+        return len(changed)
+
+    def percentile(self, symbol, metric, year=None):
+        """
+        Percentile (0-100] of a company on a metric; latest year with a
+        value if year is None. NaN when the company has no value.
+        """
+        m = self.metric_pos.get(metric)
+        s = self.symbol_pos.get(symbol)
+        if m is None or s is None:
+            return np.nan
+        if year is None:
+            present = np.flatnonzero(self.less[m, :, s] >= 0)
+            if not len(present):
+                return np.nan
+            y = present[-1]
+        elif year in self.year_pos:
+            y = self.year_pos[year]
+        else:
+            return np.nan
+        below = self.less[m, y, s]
+        if below < 0:
+            return np.nan
+        return 100.0 * (below + (self.equal[m, y, s] + 1) / 2) / self.counts[m, y]
+
+    def table(self, metric):
+        """
+        Percentiles of every company (rows) by fiscal year (columns)
+        """
+        m = self.metric_pos[metric]
+        less = self.less[m].astype(np.float64)
+        less[less < 0] = np.nan
+        with np.errstate(divide='ignore', invalid='ignore'):
+            pct = 100.0 * (less + (self.equal[m] + 1) / 2) / self.counts[m][:, None]
+        return pd.DataFrame(pct.T, index=pd.Index(self.symbols, name='symbol'), columns=self.years)
+
+    def load(self):
+        if not os.path.exists(self.rank_file):
+            return False
+        with np.load(self.rank_file, allow_pickle=False) as saved:
+            self.metrics = saved['metrics'].tolist()
+            self.years = saved['years'].tolist()
+            self.symbols = saved['symbols'].tolist()
+            self.values = saved['values']
+            self.less = saved['less']
+            self.equal = saved['equal']
+            self.counts = saved['counts']
+        self._index()
+        return True
+
+    def save(self):
+        np.savez_compressed(self.rank_file, metrics=np.array(self.metrics), years=np.array(self.years),
+                            symbols=np.array(self.symbols), values=self.values, less=self.less,
+                            equal=self.equal, counts=self.counts)
@@ -0,0 +1,32 @@
+import random
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Spaces requests by a random delay between min_delay and max_delay seconds,
+    measured from the previous request rather than added after it. Waits can
+    be cut short through a threading.Event, so shutdown never sits out a delay.
+    """
+    def __init__(self, min_delay=2, max_delay=4):
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.next_allowed = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self, stop_event=None):
+        """
+        Block until the next request may go out; False if stop_event was set
+        """
+        with self.lock:
+            now = time.monotonic()
+            start = max(now, self.next_allowed)
+            self.next_allowed = start + random.uniform(self.min_delay, self.max_delay)
+            delay = start - now
+
+        if delay > 0:
+            if stop_event is not None:
+                return not stop_event.wait(delay)
+            time.sleep(delay)
+        return stop_event is None or not stop_event.is_set()
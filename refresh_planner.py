@@ -0,0 +1,84 @@
+import pandas as pd
+import numpy as np
+import json
+import os
+from datetime import datetime
+
+
+class RefreshPlanner:
+    """
+    Decide which companies are likely to have new annual filings.
+
+    A company's next fiscal year ends one year after its latest stored `date`
+    (31 March for most Indian companies), and audited results are due within
+    `filing_lag_days` of that. Companies past that point are scheduled, most
+    overdue first; companies never fetched come before all of them. A company
+    that was checked after its filing became due is not rechecked for
+    `recheck_days`, so late filers don't use the budget on every run.
+    """
+    def __init__(self, state_file="NSE_REFRESH_STATE.json", filing_lag_days=60, recheck_days=7):
+        self.state_file = state_file
+        self.filing_lag = pd.Timedelta(days=filing_lag_days)
+        self.recheck = pd.Timedelta(days=recheck_days)
+        self.last_checked = {}
+        self.dirty = False
+        if os.path.exists(state_file):
+            try:
+                with open(state_file, encoding='utf-8') as f:
+                    self.last_checked = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable refresh state {state_file}: {e}")
+
+    def mark_checked(self, symbol, when=None):
+        self.last_checked[symbol] = (when or datetime.now()).isoformat(timespec='seconds')
+        self.dirty = True
+
+    def save(self):
+        if self.dirty:
+            with open(self.state_file, 'w', encoding='utf-8') as f:
+                json.dump(self.last_checked, f, indent=1, sort_keys=True)
+            self.dirty = False
+
+    def plan(self, latest, universe=None, today=None):
+        """
+        Companies due for a refresh, most overdue first.
+
+        `latest` has one row per stored company with its latest `date`;
+        `universe` adds symbols that have never been fetched.
+        """
+        today = pd.Timestamp(today or datetime.now()).normalize()
+
+        latest = latest[['symbol', 'date']].copy()
+        latest['date'] = pd.to_datetime(latest['date'])
+        if universe is not None:
+            universe = pd.Index(universe)
+            latest = latest[latest['symbol'].isin(universe)]
+
+        # Same month/day as the latest fiscal year end, one year later
+        expected_fy_end = latest['date'] + pd.DateOffset(years=1)
+        due = expected_fy_end + self.filing_lag
+
+        checked = pd.to_datetime(latest['symbol'].map(self.last_checked))
+        recently_checked = checked.notna() & (checked >= due) & (today - checked < self.recheck)
+
+        plan = pd.DataFrame({
+            'symbol': latest['symbol'].to_numpy(),
+            'latest_date': latest['date'].to_numpy(),
+            'expected_fy_end': expected_fy_end.to_numpy(),
+            'overdue_days': (today - due).dt.days.to_numpy().astype(np.float64),
+        })
+        plan = plan[(plan['overdue_days'] >= 0) & ~recently_checked.to_numpy()]
+
+        if universe is not None:
+            missing = universe[~universe.isin(latest['symbol'])]
+            checked = pd.to_datetime(missing.map(lambda s: self.last_checked.get(s)))
+            missing = missing[~(today - checked < self.recheck)]
+            new = pd.DataFrame({
+                'symbol': missing,
+                'latest_date': pd.NaT,
+                'expected_fy_end': pd.NaT,
+                'overdue_days': np.inf,
+            })
+            plan = pd.concat([new, plan], ignore_index=True) if len(new) else plan
+
+        return plan.sort_values('overdue_days', ascending=False, kind='stable', ignore_index=True)
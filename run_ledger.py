@@ -0,0 +1,115 @@
+import pandas as pd
+import numpy as np
+import os
+import threading
+from datetime import datetime
+
+from long_format import parquet_available
+
+LEDGER_COLUMNS = ['run_id', 'symbol', 'started', 'finished', 'method', 'profile', 'status',
+                  'outcome', 'retries', 'latency_ms', 'bytes', 'rows', 'error']
+
+# Outcomes that say nothing about the symbol itself being hard to fetch
+SETTLED_OUTCOMES = {'ok', 'empty', 'not_found'}
+
+
+class RunLedger:
+    """
+    One row per symbol fetch attempt, appended to a directory of part files.
+
+    Rows are buffered in memory and each flush() (the scraper calls it at
+    every checkpoint) writes them as a new Parquet part, or gzipped CSV
+    without pyarrow, so an interrupted run keeps everything up to its last
+    checkpoint and nothing already written is ever rewritten.
+    """
+    def __init__(self, directory="NSE_RUN_LEDGER", run_id=None):
+        self.directory = directory
+        self.run_id = run_id or datetime.now().strftime('%Y%m%dT%H%M%S')
+        self.suffix = '.parquet' if parquet_available() else '.csv.gz'
+        self.lock = threading.Lock()
+        self.pending = []
+        self.parts = 0
+
+    def record(self, **row):
+        row['run_id'] = self.run_id
+        with self.lock:
+            self.pending.append(row)
+
+    def flush(self):
+        """
+        Write buffered rows as the next part file; returns the number written
+        """
+        with self.lock:
+            rows, self.pending = self.pending, []
+            if not rows:
+                return 0
+            self.parts += 1
+            path = os.path.join(self.directory, f"{self.run_id}-{self.parts:05d}{self.suffix}")
+        df = pd.DataFrame(rows).reindex(columns=LEDGER_COLUMNS)
+        for column in ('retries', 'bytes', 'rows'):
+            df[column] = df[column].fillna(0).astype(np.int64)
+        df['status'] = df['status'].astype('Int64')
+        os.makedirs(self.directory, exist_ok=True)
+        if self.suffix == '.parquet':
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
+        return len(df)
+
+    def read(self, run_id=None):
+        """
+        All attempts written so far, optionally of one run only
+        """
+        if not os.path.isdir(self.directory):
+            return pd.DataFrame(columns=LEDGER_COLUMNS)
+        names = sorted(n for n in os.listdir(self.directory)
+                       if n.endswith(('.parquet', '.csv.gz'))
+                       and (run_id is None or n.startswith(f"{run_id}-")))
+        frames = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            if name.endswith('.parquet'):
+                frames.append(pd.read_parquet(path))
+            else:
+                frames.append(pd.read_csv(path, parse_dates=['started', 'finished'],
+                                          dtype={'run_id': str, 'status': 'Int64'}))
+        if not frames:
+            return pd.DataFrame(columns=LEDGER_COLUMNS)
+        return pd.concat(frames, ignore_index=True)
+
+    def symbol_stats(self, df=None):
+        """
+        Per-symbol attempts, failures and latency over the ledger
+        """
+        df = self.read() if df is None else df
+        if df.empty:
+            return pd.DataFrame()
+        df = df.sort_values('started', kind='stable')
+        df = df.assign(failed=~df['outcome'].isin(SETTLED_OUTCOMES))
+        grouped = df.groupby('symbol')
+        last = df.drop_duplicates('symbol', keep='last').set_index('symbol')
+        stats = pd.DataFrame({
+            'attempts': grouped.size(),
+            'failures': grouped['failed'].sum(),
+            'retries': grouped['retries'].sum(),
+            'latency_p50_ms': grouped['latency_ms'].median(),
+            'latency_max_ms': grouped['latency_ms'].max(),
+            'bytes': grouped['bytes'].sum(),
+        })
+        stats['failure_rate'] = stats['failures'] / stats['attempts']
+        stats['retry_rate'] = stats['retries'] / stats['attempts']
+        stats['last_outcome'] = last['outcome']
+        stats['last_error'] = last['error']
+        return stats
+
+    def slowest(self, n=20, df=None):
+        stats = self.symbol_stats(df)
+        return stats.nlargest(n, 'latency_p50_ms') if not stats.empty else stats
+
+    def flakiest(self, n=20, min_attempts=1, df=None):
+        stats = self.symbol_stats(df)
+        if stats.empty:
+            return stats
+        stats = stats[(stats['attempts'] >= min_attempts)
+                      & ((stats['failures'] > 0) | (stats['retries'] > 0))]
+        return stats.sort_values(['failure_rate', 'retry_rate', 'attempts'], ascending=False).head(n)
@@ -0,0 +1,162 @@
+import re
+import pandas as pd
+import numpy as np
+from derived_metrics import with_derived
+
+# "revenueGrowth > 0.2", "netMargin>=0.1", "debtToEquity < 1"
+CONDITION_PATTERN = re.compile(r'^\s*([A-Za-z_][\w]*)\s*(>=|<=|==|>|<)\s*(-?[\d.]+(?:e-?\d+)?)\s*$')
+
+
+def parse_condition(text):
+    """
+    Turn "metric op value" into a (metric, op, value) tuple
+    """
+    match = CONDITION_PATTERN.match(text)
+    if not match:
+        raise ValueError(f"Can't parse condition '{text}' (expected e.g. 'netMargin > 0.1')")
+    metric, op, value = match.groups()
+    return metric, op, float(value)
+
+
+class _PeriodTable:
+    """
+    One row per company for a single period, with a sorted index per metric.
+
+    Each index holds the metric's non-missing values in ascending order and
+    the row positions they came from, so a range condition is two binary
+    searches and a slice. Indexes are built the first time a metric is used.
+    """
+    def __init__(self, rows):
+        rows = rows.reset_index(drop=True)
+        self.rows = rows
+        self.symbols = rows['symbol'].to_numpy()
+        self.positions = {symbol: i for i, symbol in enumerate(self.symbols)}
+        self.indexes = {}
+
+    def index(self, metric):
+        if metric not in self.indexes:
+            if metric not in self.rows.columns:
+                raise KeyError(f"Unknown metric '{metric}'")
+            values = pd.to_numeric(self.rows[metric], errors='coerce').to_numpy(dtype=np.float64)
+            present = np.flatnonzero(~np.isnan(values))
+            order = present[np.argsort(values[present], kind='stable')]
+            self.indexes[metric] = (values[order], order)
+        return self.indexes[metric]
+
+    def match(self, metric, op, value):
+        """
+        Row positions satisfying one condition, sorted ascending
+        """
+        values, order = self.index(metric)
+        if op == '>':
+            hits = order[np.searchsorted(values, value, side='right'):]
+        elif op == '>=':
+            hits = order[np.searchsorted(values, value, side='left'):]
+        elif op == '<':
+            hits = order[:np.searchsorted(values, value, side='left')]
+        elif op == '<=':
+            hits = order[:np.searchsorted(values, value, side='right')]
+        elif op == '==':
+            hits = order[np.searchsorted(values, value, side='left'):
+                         np.searchsorted(values, value, side='right')]
+        else:
+            raise ValueError(f"Unknown operator '{op}'")
+        return np.sort(hits)
+
+
+class Screener:
+    """
+    Cross-sectional screens over the latest period of every company.
+
+        screener = Screener.from_store(store, derived)
+        screener.screen(['revenueGrowth > 0.2', 'netMargin > 0.1'],
+                        fields=['revenue', 'netIncome'], top=20, by='revenue')
+
+    Conditions are answered from per-metric sorted indexes and combined by
+    intersecting row positions, smallest match first; top-N walks the sort
+    key's index from the end. Pass fiscal_years=True to also index every
+    fiscal year (the calendar year the period ends in) for screen(year=...).
+
+    Each company's latest period is its own, so companies that have not
+    filed yet are compared on an older year; results carry a fiscalYear
+    column, and screen(year=...) compares one common year.
+    """
+    def __init__(self, frame, fiscal_years=False):
+        frame = frame.sort_values(['symbol', 'date'], kind='stable')
+        frame = frame.assign(fiscalYear=pd.to_datetime(frame['date']).dt.year)
+        self.latest = _PeriodTable(frame.groupby('symbol', sort=False).tail(1))
+        self.years = {}
+        if fiscal_years:
+            for fy, rows in frame.groupby('fiscalYear', sort=True):
+                # A company can restate into two rows of the same year; keep the last
+                self.years[int(fy)] = _PeriodTable(rows.groupby('symbol', sort=False).tail(1))
+
+    @classmethod
+    def from_store(cls, store, derived=None, fiscal_years=False):
+        """
+        Build from a SortedMasterStore, joining derived metrics when given
+        (a DerivedMetricCache or a frame from compute_derived)
+        """
+        frame = store.frame()
+        if derived is not None:
+            if hasattr(derived, 'frame'):
+                derived = derived.frame()
+            frame = with_derived(frame, derived)
+        return cls(frame, fiscal_years=fiscal_years)
+
+    def _table(self, year):
+        if year is None:
+            return self.latest
+        if year not in self.years:
+            raise KeyError(f"No index for fiscal year {year}; build with fiscal_years=True")
+        return self.years[year]
+
+    def screen(self, conditions=(), fields=None, top=None, by=None, ascending=False, year=None):
+        """
+        Companies matching all conditions, as symbol plus the requested fields
+        and the metrics screened on.
+
+        conditions are "metric op value" strings or (metric, op, value)
+        tuples. With `by`, results are ordered by that metric (missing values
+        excluded) and cut to `top` rows.
+        """
+        table = self._table(year)
+        conditions = [parse_condition(c) if isinstance(c, str) else tuple(c) for c in conditions]
+
+        matches = [table.match(*c) for c in conditions]
+        matches.sort(key=len)
+        selected = None
+        for hits in matches:
+            selected = hits if selected is None else np.intersect1d(selected, hits, assume_unique=True)
+            if len(selected) == 0:
+                break
+
+        if by is not None:
+            values, order = table.index(by)
+            ranked = order if ascending else order[::-1]
+            if selected is not None:
+                keep = np.zeros(len(table.symbols), dtype=bool)
+                keep[selected] = True
+                ranked = ranked[keep[ranked]]
+            selected = ranked[:top] if top is not None else ranked
+        else:
+            if selected is None:
+                selected = np.arange(len(table.symbols))
+            if top is not None:
+                selected = selected[:top]
+
+        columns = ['symbol', 'date', 'fiscalYear']
+        for column in list(fields or []) + [c[0] for c in conditions] + ([by] if by else []):
+            if column in table.rows.columns and column not in columns:
+                columns.append(column)
+        return table.rows[columns].iloc[selected].reset_index(drop=True)
+
+    def lookup(self, symbol, metric, year=None):
+        """
+        One company's value of a metric (NaN if missing)
+        """
+        table = self._table(year)
+        position = table.positions.get(symbol)
+        if position is None:
+            return np.nan
+        return pd.to_numeric(table.rows.at[position, metric], errors='coerce')
@@ -0,0 +1,261 @@
+import pandas as pd
+import os
+import time
+import sqlite3
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+SinkResult = namedtuple('SinkResult', ['name', 'path', 'seconds', 'bytes', 'error'])
+
+
+class Batch:
+    """
+    One normalized frame shared by every sink. The Arrow table is built at
+    most once, on first use, and reused by all Arrow-based sinks. A schema
+    keeps the chunks of one dataset to the same Arrow types.
+    """
+    def __init__(self, df, schema=None):
+        df = df.copy()
+        if 'date' in df.columns:
+            df['date'] = pd.to_datetime(df['date'])
+        self.frame = df
+        self.schema = schema
+        self._table = None
+
+    @property
+    def table(self):
+        if self._table is None:
+            import pyarrow as pa
+            self._table = pa.Table.from_pandas(self.frame, schema=self.schema, preserve_index=False)
+        return self._table
+
+
+def arrow_schema(df):
+    """
+    Arrow schema for the chunks of a dataset; a text column that happens
+    to be empty in df is typed as string rather than null
+    """
+    import pyarrow as pa
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    for i, field in enumerate(schema):
+        if pa.types.is_null(field.type):
+            schema = schema.set(i, field.with_type(pa.string()))
+    return schema
+
+
+def read_csv_chunks(path, chunksize=50000):
+    """
+    Read a large CSV in chunks that all share one dtype per column.
+
+    A first pass only collects each chunk's dtypes, so a column that is
+    integer in one chunk and has gaps in the next is read as float in
+    every chunk, and a column mixing numbers and text as text.
+    """
+    seen = {}
+    for chunk in pd.read_csv(path, chunksize=chunksize, low_memory=False):
+        for column, dtype in chunk.dtypes.items():
+            seen.setdefault(column, set()).add(dtype)
+    dtypes = {}
+    for column, kinds in seen.items():
+        if column == 'date' or len(kinds) == 1:
+            continue
+        numeric = all(pd.api.types.is_numeric_dtype(k) and not pd.api.types.is_bool_dtype(k)
+                      for k in kinds)
+        dtypes[column] = 'float64' if numeric else 'object'
+    parse_dates = ['date'] if 'date' in seen else False
+    yield from pd.read_csv(path, chunksize=chunksize, dtype=dtypes, parse_dates=parse_dates,
+                           low_memory=False)
+
+
+class CsvSink:
+    name = 'csv'
+    needs_arrow = False
+
+    def __init__(self, path):
+        self.path = path
+
+    def write(self, batch):
+        batch.frame.to_csv(self.path, index=False, date_format='%Y-%m-%d')
+
+    def append(self, batch, first):
+        batch.frame.to_csv(self.path, mode='w' if first else 'a', header=first,
+                           index=False, date_format='%Y-%m-%d')
+
+    def close(self):
+        pass
+
+
+class ParquetSink:
+    name = 'parquet'
+    needs_arrow = True
+
+    def __init__(self, path, compression='zstd'):
+        self.path = path
+        self.compression = compression
+        self._writer = None
+
+    def write(self, batch):
+        import pyarrow.parquet as pq
+        pq.write_table(batch.table, self.path, compression=self.compression)
+
+    def append(self, batch, first):
+        import pyarrow.parquet as pq
+        if first:
+            self._writer = pq.ParquetWriter(self.path, batch.table.schema, compression=self.compression)
+        self._writer.write_table(batch.table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class ArrowSink:
+    name = 'arrow'
+    needs_arrow = True
+
+    def __init__(self, path):
+        self.path = path
+        self._writer = None
+
+    def write(self, batch):
+        import pyarrow.feather as feather
+        feather.write_feather(batch.table, self.path)
+
+    def append(self, batch, first):
+        # Feather v2 is the Arrow IPC file format, so one writer can add record batches
+        import pyarrow as pa
+        if first:
+            options = pa.ipc.IpcWriteOptions(compression='lz4')
+            self._writer = pa.ipc.new_file(self.path, batch.table.schema, options=options)
+        self._writer.write_table(batch.table)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+class SqliteSink:
+    name = 'sqlite'
+    needs_arrow = False
+
+    def __init__(self, path, table='financials'):
+        self.path = path
+        self.table = table
+
+    def write(self, batch):
+        self.append(batch, first=True)
+
+    def append(self, batch, first):
+        # Each thread needs its own connection
+        conn = sqlite3.connect(self.path)
+        try:
+            batch.frame.to_sql(self.table, conn, if_exists='replace' if first else 'append',
+                               index=False, chunksize=5000)
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "{self.table}_symbol_date" '
+                         f'ON "{self.table}" (symbol, date)')
+            conn.commit()
+        finally:
+            conn.close()
+
+    def close(self):
+        pass
+
+
+def make_sink(spec, base):
+    """
+    Build a sink from a short name ('csv', 'parquet', 'sqlite', 'arrow')
+    using base (a path without extension) for the output file
+    """
+    sinks = {
+        'csv': lambda: CsvSink(base + '.csv'),
+        'parquet': lambda: ParquetSink(base + '.parquet'),
+        'arrow': lambda: ArrowSink(base + '.arrow'),
+        'sqlite': lambda: SqliteSink(base + '.sqlite'),
+    }
+    if spec not in sinks:
+        raise ValueError(f"Unknown sink '{spec}', expected one of {sorted(sinks)}")
+    return sinks[spec]()
+
+
+class MultiSinkWriter:
+    """
+    Write one batch to several sinks concurrently
+    """
+    def __init__(self, sinks):
+        self.sinks = list(sinks)
+
+    def _write_one(self, sink, batch):
+        start = time.perf_counter()
+        error = None
+        try:
+            sink.write(batch)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+        seconds = time.perf_counter() - start
+        size = os.path.getsize(sink.path) if error is None and os.path.exists(sink.path) else 0
+        return SinkResult(sink.name, sink.path, seconds, size, error)
+
+    def write(self, df):
+        if not self.sinks:
+            return []
+
+        batch = Batch(df)
+        if any(sink.needs_arrow for sink in self.sinks):
+            # Convert before fanning out so threads don't race to build it;
+            # without pyarrow the Arrow sinks report the error themselves
+            try:
+                batch.table
+            except ImportError:
+                pass
+
+        with ThreadPoolExecutor(max_workers=len(self.sinks)) as pool:
+            futures = [pool.submit(self._write_one, sink, batch) for sink in self.sinks]
+            return [f.result() for f in futures]
+
+    def _append_one(self, sink, batch, first):
+        start = time.perf_counter()
+        try:
+            sink.append(batch, first)
+        except Exception as e:
+            return time.perf_counter() - start, f"{type(e).__name__}: {e}"
+        return time.perf_counter() - start, None
+
+    def write_chunks(self, chunks):
+        """
+        Write a sequence of frames (e.g. from read_csv_chunks) as one dataset
+        per sink, holding one chunk in memory at a time. A sink that fails
+        on a chunk is skipped for the rest.
+        """
+        if not self.sinks:
+            return []
+
+        seconds = [0.0] * len(self.sinks)
+        errors = [None] * len(self.sinks)
+        schema = None
+        with ThreadPoolExecutor(max_workers=len(self.sinks)) as pool:
+            for i, df in enumerate(chunks):
+                batch = Batch(df, schema)
+                if any(sink.needs_arrow for sink in self.sinks):
+                    try:
+                        if schema is None:
+                            schema = batch.schema = arrow_schema(batch.frame)
+                        batch.table
+                    except ImportError:
+                        pass
+                live = [j for j, error in enumerate(errors) if error is None]
+                futures = {j: pool.submit(self._append_one, self.sinks[j], batch, i == 0) for j in live}
+                for j, future in futures.items():
+                    took, errors[j] = future.result()
+                    seconds[j] += took
+
+        results = []
+        for sink, took, error in zip(self.sinks, seconds, errors):
+            try:
+                sink.close()
+            except Exception as e:
+                error = error or f"{type(e).__name__}: {e}"
+            size = os.path.getsize(sink.path) if error is None and os.path.exists(sink.path) else 0
+            results.append(SinkResult(sink.name, sink.path, took, size, error))
+        return results
@@ -0,0 +1,168 @@
+import csv
+import json
+import os
+import zlib
+from datetime import datetime, timedelta
+
+
+class NegativeCache:
+    """
+    Persisted set of symbols that returned 404, each with an expiry.
+
+    Entries expire after ttl_days plus a per-symbol jitter of up to 20%,
+    so known-missing tickers are rechecked occasionally without all of them
+    coming due on the same run.
+    """
+    def __init__(self, cache_file="NSE_MISSING_SYMBOLS.json", ttl_days=30):
+        self.cache_file = cache_file
+        self.ttl = timedelta(days=ttl_days)
+        self.entries = {}
+        self.dirty = False
+        self.load()
+
+    def load(self):
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable negative cache {self.cache_file}: {e}")
+                self.entries = {}
+
+    def save(self):
+        if not self.dirty:
+            return
+        tmp = self.cache_file + '.tmp'
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=1, sort_keys=True)
+        os.replace(tmp, self.cache_file)
+        self.dirty = False
+
+    def _expires(self, symbol, entry):
+        jitter = (zlib.crc32(symbol.encode()) % 1000) / 5000
+        return datetime.fromisoformat(entry['last_checked']) + self.ttl * (1 + jitter)
+
+    def is_missing(self, symbol, now=None):
+        entry = self.entries.get(symbol)
+        if entry is None:
+            return False
+        return (now or datetime.now()) < self._expires(symbol, entry)
+
+    def add(self, symbol, now=None):
+        now = (now or datetime.now()).isoformat(timespec='seconds')
+        entry = self.entries.setdefault(symbol, {'first_seen': now, 'misses': 0})
+        entry['last_checked'] = now
+        entry['misses'] += 1
+        self.dirty = True
+
+    def discard(self, symbol):
+        if self.entries.pop(symbol, None) is not None:
+            self.dirty = True
+
+    def filter(self, symbols, now=None):
+        """
+        Split symbols into (to_fetch, skipped) using the cache
+        """
+        now = now or datetime.now()
+        to_fetch = []
+        skipped = []
+        for symbol in symbols:
+            (skipped if self.is_missing(symbol, now) else to_fetch).append(symbol)
+        return to_fetch, skipped
+
+
+class AliasResolver:
+    """
+    Maps old ticker symbols to their current ones.
+
+    Static renames come from universes/symbol_aliases.csv; redirects seen at
+    fetch time (a payload reporting a different symbol than was requested)
+    are learned and persisted. Chains such as A -> B -> C resolve to C.
+    """
+    def __init__(self, alias_file=None, redirect_file="NSE_SYMBOL_REDIRECTS.json", suffix='.NS'):
+        if alias_file is None:
+            alias_file = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                      'universes', 'symbol_aliases.csv')
+        self.alias_file = alias_file
+        self.redirect_file = redirect_file
+        self.suffix = suffix
+        self.aliases = {}
+        self.redirects = {}
+        self.resolved = {}
+        self.reverse = None
+        self.dirty = False
+        self.load()
+
+    def _qualify(self, symbol):
+        symbol = symbol.strip().upper()
+        return symbol if '.' in symbol else symbol + self.suffix
+
+    def load(self):
+        if os.path.exists(self.alias_file):
+            with open(self.alias_file, newline='', encoding='utf-8') as f:
+                for row in csv.DictReader(f):
+                    self.aliases[self._qualify(row['old_symbol'])] = self._qualify(row['new_symbol'])
+        if os.path.exists(self.redirect_file):
+            try:
+                with open(self.redirect_file, encoding='utf-8') as f:
+                    self.redirects = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"Ignoring unreadable redirect cache {self.redirect_file}: {e}")
+        self.resolved = {}
+        self.reverse = None
+
+    def save(self):
+        if not self.dirty:
+            return
+        with open(self.redirect_file, 'w', encoding='utf-8') as f:
+            json.dump(self.redirects, f, indent=1, sort_keys=True)
+        self.dirty = False
+
+    def resolve(self, symbol):
+        """
+        Current symbol for `symbol` (itself if it was never renamed)
+        """
+        current = self.resolved.get(symbol)
+        if current is not None:
+            return current
+
+        current = symbol
+        seen = {symbol}
+        while True:
+            following = self.redirects.get(current) or self.aliases.get(current)
+            if following is None or following in seen:
+                break
+            seen.add(following)
+            current = following
+
+        self.resolved[symbol] = current
+        return current
+
+    def old_symbols(self, symbol):
+        """
+        Every known symbol that resolves to `symbol`, excluding itself
+        """
+        if self.reverse is None:
+            self.reverse = {}
+            for old in set(self.aliases) | set(self.redirects):
+                current = self.resolve(old)
+                if current != old:
+                    self.reverse.setdefault(current, []).append(old)
+        return sorted(self.reverse.get(symbol, []))
+
+    def observe(self, requested, returned):
+        """
+        Remember that fetching `requested` returned data for `returned`
+        """
+        if returned and returned != requested and self.redirects.get(requested) != returned:
+            self.redirects[requested] = returned
+            self.resolved = {}
+            self.reverse = None
+            self.dirty = True
+
+    def canonical(self, symbols):
+        """
+        Qualify and resolve a list of symbols, dropping duplicates created
+        by renames; 'zomato' becomes whatever ZOMATO.NS is now listed as
+        """
+        return list(dict.fromkeys(self.resolve(self._qualify(s)) for s in symbols))
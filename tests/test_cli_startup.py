@@ -0,0 +1,16 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from nse_cli import HEAVY_MODULES, STARTUP_BUDGET_SECONDS, probe_startup
+
+
+def test_help_stays_within_startup_budget():
+    best, heavy = probe_startup(runs=3)
+    assert best <= STARTUP_BUDGET_SECONDS, f"--help took {best * 1000:.0f} ms"
+
+
+def test_help_imports_no_heavy_modules():
+    best, heavy = probe_startup(runs=1)
+    assert not heavy, f"--help imported {', '.join(heavy)} (heavy: {', '.join(HEAVY_MODULES)})"
@@ -0,0 +1,79 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from change_feed import compute_changes
+from derived_metrics import DerivedMetricCache, compute_derived
+
+
+def _company(symbol, net_income, years=(2021, 2022, 2023, 2024)):
+    return pd.DataFrame({
+        'symbol': symbol,
+        'date': pd.to_datetime([f"{y}-03-31" for y in years]),
+        'revenue': [100.0, 110.0, 125.0, 140.0][:len(years)],
+        'netIncome': net_income,
+        'totalAssets': [500.0, 520.0, 560.0, 600.0][:len(years)],
+    })
+
+
+def _store():
+    return {'ABC.NS': _company('ABC.NS', [10.0, 12.0, 15.0, 16.0]),
+            'XYZ.NS': _company('XYZ.NS', [-5.0, 2.0, 4.0, 8.0])}
+
+
+def _restate(cache, store, symbol, rows):
+    cache.invalidate(symbol, compute_changes(store[symbol], rows))
+    store[symbol] = rows
+
+
+def _assert_matches_full_recompute(cache, store):
+    expected = compute_derived(pd.concat([store[s] for s in sorted(store)], ignore_index=True))
+    got = cache.frame()
+    got['date'] = pd.to_datetime(got['date'])
+    pd.testing.assert_frame_equal(got, expected, check_dtype=False)
+
+
+def test_restatement_marks_only_dependent_metrics_stale(tmp_path):
+    store = _store()
+    cache = DerivedMetricCache(str(tmp_path / "derived.csv"))
+    cache.load(store)
+    cache.refresh(store)
+
+    _restate(cache, store, 'ABC.NS', _company('ABC.NS', [10.0, 12.0, 18.0, 16.0]))
+
+    assert set(cache.stale) == {'ABC.NS'}
+    assert 'netMargin' in cache.stale['ABC.NS'] and 'roe' in cache.stale['ABC.NS']
+    assert 'grossMargin' not in cache.stale['ABC.NS'] and 'revenueGrowth' not in cache.stale['ABC.NS']
+    assert cache.refresh(store) == 1
+    _assert_matches_full_recompute(cache, store)
+
+
+def test_added_year_recomputes_every_metric(tmp_path):
+    store = _store()
+    cache = DerivedMetricCache(str(tmp_path / "derived.csv"))
+    cache.load(store)
+    cache.refresh(store)
+
+    _restate(cache, store, 'XYZ.NS', _company('XYZ.NS', [2.0, 4.0, 8.0], years=(2022, 2023, 2024)))
+
+    assert cache.stale['XYZ.NS'] == set(cache.names)
+    cache.refresh(store)
+    _assert_matches_full_recompute(cache, store)
+
+
+def test_out_of_core_cache_survives_reload(tmp_path):
+    store = _store()
+    cache = DerivedMetricCache(str(tmp_path / "derived.csv"), in_memory=False)
+    cache.load(store)
+    cache.refresh(store)
+    cache.save()
+
+    reloaded = DerivedMetricCache(str(tmp_path / "derived.csv"), in_memory=False)
+    reloaded.load(store)
+    assert not reloaded.stale and not reloaded.partitions
+    _restate(reloaded, store, 'ABC.NS', _company('ABC.NS', [10.0, 12.0, 18.0, 16.0]))
+    reloaded.refresh(store)
+    _assert_matches_full_recompute(reloaded, store)
@@ -0,0 +1,57 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from financial_history import FinancialHistory
+
+
+def _rows(revenue, net_income):
+    return pd.DataFrame({'symbol': ['ABC.NS', 'ABC.NS'], 'date': ['2022-03-31', '2023-03-31'],
+                         'revenue': revenue, 'netIncome': net_income})
+
+
+def test_unchanged_refresh_records_nothing(tmp_path):
+    history = FinancialHistory(str(tmp_path / "history.csv"))
+    first = _rows([100.0, 120.0], [10.0, 12.0])
+    assert history.record(first, fetched_at='2024-01-01T00:00:00') == 4
+    assert history.record(first.copy(), fetched_at='2024-02-01T00:00:00', previous=first) == 0
+
+
+def test_as_of_reconstructs_each_version(tmp_path):
+    history = FinancialHistory(str(tmp_path / "history.csv"))
+    first = _rows([100.0, 120.0], [10.0, 12.0])
+    # A restatement of one cell and a cleared value
+    second = _rows([100.0, 125.0], [10.0, np.nan])
+    history.record(first, fetched_at='2024-01-01T00:00:00')
+    assert history.record(second, fetched_at='2024-02-01T00:00:00', previous=first) == 2
+
+    before = history.as_of('2024-01-15')
+    assert before['revenue'].tolist() == [100.0, 120.0]
+    assert before['netIncome'].tolist() == [10.0, 12.0]
+
+    latest = history.as_of()
+    assert latest['revenue'].tolist() == [100.0, 125.0]
+    assert latest['netIncome'].iloc[0] == 10.0 and np.isnan(latest['netIncome'].iloc[1])
+    assert history.versions('ABC.NS') == ['2024-01-01T00:00:00', '2024-02-01T00:00:00']
+
+
+def test_as_of_before_first_fetch_is_empty(tmp_path):
+    history = FinancialHistory(str(tmp_path / "history.csv"))
+    history.record(_rows([100.0, 120.0], [10.0, 12.0]), fetched_at='2024-01-01T00:00:00')
+    assert history.as_of('2023-12-31').empty
+
+
+def test_as_of_keeps_fields_that_were_never_set(tmp_path):
+    history = FinancialHistory(str(tmp_path / "history.csv"))
+    rows = _rows([100.0, 120.0], [10.0, 12.0]).assign(epsRatio=np.nan)
+    history.record(rows, fetched_at='2024-01-01T00:00:00')
+
+    stored = ['symbol', 'date', 'revenue', 'epsRatio', 'netIncome']
+    latest = history.as_of(columns=stored)
+    assert latest.columns.tolist() == ['date', 'symbol', 'period', 'revenue', 'epsRatio', 'netIncome']
+    assert latest['epsRatio'].isna().all()
+    assert history.as_of('2023-12-31', columns=stored).columns.tolist() == latest.columns.tolist()
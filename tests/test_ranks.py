@@ -0,0 +1,68 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ranks import RankEngine
+
+
+def _companies(count, seed):
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(count):
+        for year in (2022, 2023):
+            # Rounded so ties occur, and some cells missing
+            revenue = float(rng.integers(0, 20)) if rng.random() > 0.1 else np.nan
+            rows.append({'symbol': f"C{i:03d}.NS", 'date': f"{year}-03-31",
+                         'revenue': revenue, 'netIncome': float(rng.integers(-5, 5))})
+    return pd.DataFrame(rows)
+
+
+def _assert_same_ranks(engine, expected):
+    for metric in expected.metrics:
+        table = engine.table(metric).reindex(index=expected.symbols, columns=expected.years)
+        pd.testing.assert_frame_equal(table, expected.table(metric))
+
+
+def test_incremental_update_matches_full_rebuild():
+    df = _companies(100, seed=1)
+    engine = RankEngine()
+    engine.build(df)
+
+    # Below the rebuild threshold, so counts are shifted in place
+    changed = _companies(100, seed=2)
+    changed = changed[changed['symbol'].isin(['C005.NS', 'C042.NS'])]
+    engine.update(changed)
+
+    current = pd.concat([df[~df['symbol'].isin(changed['symbol'])], changed], ignore_index=True)
+    expected = RankEngine()
+    expected.build(current)
+    _assert_same_ranks(engine, expected)
+
+
+def test_update_of_removed_company_drops_its_ranks():
+    df = _companies(50, seed=3)
+    engine = RankEngine()
+    engine.build(df)
+
+    engine.update(df.iloc[:0], symbols=['C007.NS'])
+
+    expected = RankEngine()
+    expected.build(df[df['symbol'] != 'C007.NS'])
+    assert np.isnan(engine.percentile('C007.NS', 'revenue'))
+    _assert_same_ranks(engine, expected)
+
+
+def test_percentile_matches_pandas_rank():
+    df = _companies(30, seed=4)
+    engine = RankEngine()
+    engine.build(df)
+
+    latest = df[df['date'] == '2023-03-31'].set_index('symbol')['revenue']
+    expected = latest.rank(pct=True) * 100
+    for symbol, pct in expected.items():
+        got = engine.percentile(symbol, 'revenue', year=2023)
+        assert (np.isnan(pct) and np.isnan(got)) or np.isclose(got, pct)
@@ -0,0 +1,39 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from ttm import compute_ttm
+
+
+def _quarters(dates, revenue, assets):
+    income = pd.DataFrame({'symbol': 'ABC.NS', 'statement': 'INCOME_STATEMENT',
+                           'date': dates, 'revenue': revenue})
+    balance = pd.DataFrame({'symbol': 'ABC.NS', 'statement': 'BALANCE_SHEET',
+                            'date': dates, 'totalAssets': assets})
+    return pd.concat([income, balance], ignore_index=True)
+
+
+def test_ttm_sums_four_consecutive_quarters():
+    dates = ['2023-06-30', '2023-09-30', '2023-12-31', '2024-03-31', '2024-06-30']
+    ttm = compute_ttm(_quarters(dates, [1.0, 2.0, 3.0, 4.0, 5.0], [10.0, 20.0, 30.0, 40.0, 50.0]))
+
+    assert ttm['period'].eq('TTM').all()
+    assert np.isnan(ttm['revenue'].iloc[:3]).all()
+    assert ttm['revenue'].iloc[3:].tolist() == [10.0, 14.0]
+    # Balance sheet fields are the snapshot at the quarter end, not a sum
+    assert ttm['totalAssets'].tolist() == [10.0, 20.0, 30.0, 40.0, 50.0]
+
+
+def test_missing_quarter_leaves_ttm_nan():
+    # 2023-12-31 was never filed; the windows spanning it must not sum a longer period
+    dates = ['2023-03-31', '2023-06-30', '2023-09-30', '2024-03-31', '2024-06-30', '2024-09-30',
+             '2024-12-31']
+    ttm = compute_ttm(_quarters(dates, [1.0] * 7, [5.0] * 7)).set_index('date')
+
+    assert np.isnan(ttm.loc['2024-03-31', 'revenue'])
+    assert np.isnan(ttm.loc['2024-09-30', 'revenue'])
+    assert ttm.loc['2024-12-31', 'revenue'] == 4.0
@@ -0,0 +1,54 @@
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from validation import QualityFlags, validate
+
+
+def _company(**fields):
+    rows = {'symbol': ['ABC.NS', 'ABC.NS'], 'date': ['2022-03-31', '2023-03-31'],
+            'totalAssets': [100.0, 110.0], 'totalLiabilities': [60.0, 70.0], 'totalEquity': [40.0, 40.0],
+            'revenue': [50.0, 55.0], 'costOfRevenue': [30.0, 33.0], 'grossProfit': [20.0, 22.0],
+            'grossProfitRatio': [0.4, 0.4]}
+    rows.update(fields)
+    return pd.DataFrame(rows)
+
+
+def test_consistent_statements_raise_no_flags():
+    assert validate(_company()).empty
+
+
+def test_broken_identity_and_ratio_are_flagged():
+    flags = validate(_company(totalEquity=[40.0, 20.0], grossProfitRatio=[0.4, 0.9]))
+    found = set(zip(flags['rule'].astype(str), flags['date']))
+    assert found == {('balance_sheet_identity', '2023-03-31'), ('gross_profit_ratio', '2023-03-31')}
+    identity = flags[flags['rule'] == 'balance_sheet_identity'].iloc[0]
+    assert identity['value'] == 110.0 and identity['expected'] == 90.0
+
+
+def test_rounding_within_tolerance_is_not_flagged():
+    # 0.5% off, inside REL_TOLERANCE
+    assert validate(_company(totalEquity=[40.0, 40.5])).empty
+
+
+def test_rule_skipped_when_an_input_is_missing():
+    assert validate(_company(totalLiabilities=[None, None])).empty
+
+
+def test_year_over_year_jump_is_a_warning():
+    flags = validate(_company(revenue=[5e7, 9e8], costOfRevenue=[None, None], grossProfit=[None, None],
+                              grossProfitRatio=[None, None]))
+    assert flags['rule'].astype(str).tolist() == ['yoy_jump']
+    assert flags['severity'].astype(str).tolist() == ['warning']
+    assert flags['field'].tolist() == ['revenue']
+
+
+def test_refetch_that_fixes_a_company_clears_its_flags(tmp_path):
+    quality = QualityFlags(str(tmp_path / "flags.csv"))
+    quality.record(_company(totalEquity=[40.0, 20.0]))
+    assert quality.summary()[('error', 'balance_sheet_identity')] == 1
+    quality.record(_company())
+    assert quality.flags.empty
@@ -0,0 +1,317 @@
+import pandas as pd
+import numpy as np
+import os
+
+from external_merge import concat_runs, split_by_symbol
+
+# Quarterly statements as Perplexity returns them. Flow statements are summed
+# over four quarters; the balance sheet is a point-in-time snapshot, so the
+# latest one at or before each quarter end is used as is. When a field name
+# appears in more than one statement (netIncome, inventory), the first
+# statement in this order owns it.
+STATEMENT_KINDS = [
+    ('INCOME_STATEMENT', 'flow'),
+    ('BALANCE_SHEET', 'stock'),
+    ('CASH_FLOW', 'flow'),
+]
+
+# Descriptive columns that are never rolled up
+META_COLUMNS = {'symbol', 'statement', 'date', 'reportedCurrency', 'cik', 'fillingDate',
+                'acceptedDate', 'calendarYear', 'period', 'link', 'finalLink'}
+
+# Flow-statement fields that are levels, not amounts for the quarter
+LATEST_VALUE_FIELDS = {'weightedAverageShsOut', 'weightedAverageShsOutDil'}
+
+QUARTER_COLUMNS = ['symbol', 'statement', 'date']
+
+
+def quarterly_frame(data, symbol):
+    """
+    Flatten the payload's 'quarter' section to one row per (statement, date)
+    """
+    rows = []
+    if isinstance(data, dict):
+        for statement in data.get('quarter') or []:
+            if not isinstance(statement, dict):
+                continue
+            statement_type = statement.get('type', '')
+            for quarter_data in statement.get('data') or []:
+                row = {'symbol': symbol, 'statement': statement_type}
+                row.update({k: v for k, v in quarter_data.items() if k != 'symbol'})
+                rows.append(row)
+    if not rows:
+        return None
+    return pd.DataFrame(rows)
+
+
+def _quarter_number(dates):
+    """
+    Consecutive integer per calendar quarter, so gaps in a company's
+    filings show up as gaps in the numbering
+    """
+    return dates.dt.year.to_numpy() * 4 + (dates.dt.month.to_numpy() - 1) // 3
+
+
+def compute_ttm(quarters):
+    """
+    Trailing-twelve-month values for every company and quarter end at once.
+
+    A flow field's TTM at quarter q is the sum of quarters q-3..q, looked up
+    by quarter number rather than by row so a missing quarter leaves the
+    value NaN instead of silently summing a longer window. Balance-sheet
+    fields come from the latest balance sheet dated on or before q.
+    """
+    columns = ['symbol', 'date', 'period']
+    if quarters is None or quarters.empty:
+        return pd.DataFrame(columns=columns)
+
+    quarters = quarters.copy()
+    quarters['date'] = pd.to_datetime(quarters['date'], errors='coerce')
+    quarters = quarters.dropna(subset=['date'])
+    quarters['quarter'] = _quarter_number(quarters['date'])
+
+    by_statement = {}
+    claimed = set()
+    for statement, kind in STATEMENT_KINDS:
+        rows = quarters[quarters['statement'] == statement]
+        rows = rows.drop_duplicates(['symbol', 'quarter'], keep='last')
+        fields = [c for c in rows.columns
+                  if c not in META_COLUMNS and c != 'quarter' and c not in claimed
+                  and not c.lower().endswith('ratio') and rows[c].notna().any()]
+        claimed.update(fields)
+        values = rows[fields].apply(pd.to_numeric, errors='coerce')
+        by_statement[statement] = (kind, rows, values)
+
+    # One TTM row per quarter end reported in a flow statement
+    keys = pd.concat([rows[['symbol', 'date', 'quarter']]
+                      for kind, rows, _ in by_statement.values() if kind == 'flow'])
+    keys = keys.drop_duplicates(['symbol', 'quarter']).sort_values(['symbol', 'date'], ignore_index=True)
+    out = {'symbol': keys['symbol'].to_numpy(), 'date': keys['date'].to_numpy(), 'period': 'TTM'}
+
+    for statement, (kind, rows, values) in by_statement.items():
+        if values.empty or not len(values.columns):
+            continue
+        if kind == 'flow':
+            values.index = pd.MultiIndex.from_arrays([rows['symbol'], rows['quarter']])
+            summed = [c for c in values.columns if c not in LATEST_VALUE_FIELDS]
+            total = np.zeros((len(keys), len(summed)))
+            for lag in range(4):
+                target = pd.MultiIndex.from_arrays([keys['symbol'], keys['quarter'] - lag])
+                window = values.reindex(target)
+                total += window[summed].to_numpy(dtype=np.float64)
+                if lag == 0:
+                    for column in values.columns.intersection(list(LATEST_VALUE_FIELDS)):
+                        out[column] = window[column].to_numpy()
+            for i, column in enumerate(summed):
+                out[column] = total[:, i]
+        else:
+            snapshot = values.assign(symbol=rows['symbol'].to_numpy(),
+                                     balanceSheetDate=rows['date'].to_numpy())
+            snapshot = snapshot.sort_values('balanceSheetDate')
+            latest = pd.merge_asof(keys[['symbol', 'date']].reset_index().sort_values('date'),
+                                   snapshot, left_on='date', right_on='balanceSheetDate',
+                                   by='symbol', direction='backward')
+            latest = latest.sort_values('index')
+            for column in ['balanceSheetDate'] + list(values.columns):
+                out[column] = latest[column].to_numpy()
+
+    return pd.DataFrame(out)
+
+
+class TTMRollup:
+    """
+    Quarterly statements per company and their trailing-twelve-month rollup.
+
+    put() stores a company's latest quarterly payload and marks it dirty;
+    refresh() recomputes the TTM rows of all dirty companies in vectorized
+    batches. rebuild() recomputes everything.
+
+    Both are kept on disk as one CSV per symbol, like the master store's
+    partitions: save() only rewrites companies changed since the previous
+    save, and export() writes the combined files. With in_memory=False
+    (out-of-core mode) saved companies are dropped from memory and read
+    back when needed, and export() streams the per-symbol files.
+    """
+    def __init__(self, quarter_file="NSE_ALL_COMPANIES_QUARTERLY.csv",
+                 ttm_file="NSE_ALL_COMPANIES_TTM.csv", in_memory=True):
+        self.quarter_file = quarter_file
+        self.ttm_file = ttm_file
+        self.quarter_dir = os.path.splitext(quarter_file)[0]
+        self.ttm_dir = os.path.splitext(ttm_file)[0]
+        self.in_memory = in_memory
+        # Every company in memory mode; only unsaved ones out of core
+        self.quarters = {}
+        self.rollups = {}
+        # Companies with quarters / with a rollup, on disk or in memory
+        self.symbols = set()
+        self.rolled = set()
+        self.dirty = set()
+        self.unsaved = set()
+        self.removed = set()
+
+    def __len__(self):
+        return len(self.symbols)
+
+    @staticmethod
+    def _path(directory, symbol):
+        return os.path.join(directory, f"{symbol}.csv")
+
+    def get_quarters(self, symbol):
+        if symbol in self.quarters:
+            return self.quarters[symbol]
+        if symbol in self.symbols:
+            return pd.read_csv(self._path(self.quarter_dir, symbol), low_memory=False)
+        return None
+
+    def get_rollup(self, symbol):
+        if symbol in self.rollups:
+            return self.rollups[symbol]
+        if symbol in self.rolled:
+            return pd.read_csv(self._path(self.ttm_dir, symbol), low_memory=False)
+        return None
+
+    def _split_combined(self, path, directory, target, known):
+        """
+        Split a combined file from before partitioning into per-symbol files
+        """
+        os.makedirs(directory, exist_ok=True)
+        for symbol, rows in split_by_symbol(pd.read_csv(path, low_memory=False, chunksize=50000)):
+            if symbol in known:
+                # Only when the file was not sorted by symbol
+                rows = pd.concat([pd.read_csv(self._path(directory, symbol), low_memory=False), rows],
+                                 ignore_index=True)
+            rows.to_csv(self._path(directory, symbol), index=False)
+            known.add(symbol)
+            if self.in_memory:
+                target[symbol] = rows
+
+    def load(self):
+        self.unsaved = set()
+        self.removed = set()
+        for directory, path, target, known in ((self.quarter_dir, self.quarter_file, self.quarters, self.symbols),
+                                               (self.ttm_dir, self.ttm_file, self.rollups, self.rolled)):
+            target.clear()
+            known.clear()
+            if os.path.isdir(directory):
+                for name in sorted(os.listdir(directory)):
+                    if name.endswith('.csv'):
+                        symbol = name[:-len('.csv')]
+                        known.add(symbol)
+                        if self.in_memory:
+                            target[symbol] = pd.read_csv(os.path.join(directory, name), low_memory=False)
+            elif os.path.exists(path):
+                self._split_combined(path, directory, target, known)
+        # Companies with quarters but no rollup yet (e.g. an interrupted save)
+        self.dirty = self.symbols - self.rolled
+
+    def put(self, symbol, quarters):
+        if quarters is None or quarters.empty:
+            return
+        self.quarters[symbol] = quarters.assign(symbol=symbol)
+        self.symbols.add(symbol)
+        self.dirty.add(symbol)
+        self.unsaved.add(symbol)
+        self.removed.discard(symbol)
+
+    def drop(self, symbol):
+        if symbol in self.symbols or symbol in self.rolled:
+            self.removed.add(symbol)
+        self.quarters.pop(symbol, None)
+        self.rollups.pop(symbol, None)
+        self.symbols.discard(symbol)
+        self.rolled.discard(symbol)
+        self.dirty.discard(symbol)
+        self.unsaved.discard(symbol)
+
+    def refresh(self, batch_size=1000):
+        """
+        Recompute TTM rows of companies updated since the last refresh,
+        `batch_size` companies at a time
+        """
+        symbols = sorted(s for s in self.dirty if s in self.symbols)
+        for i in range(0, len(symbols), batch_size):
+            batch = symbols[i:i + batch_size]
+            ttm = compute_ttm(pd.concat([self.get_quarters(s) for s in batch], ignore_index=True))
+            for symbol in batch:
+                self.rollups.pop(symbol, None)
+                self.rolled.discard(symbol)
+            for symbol, rows in ttm.groupby('symbol', sort=False):
+                self.rollups[symbol] = rows.reset_index(drop=True)
+                self.rolled.add(symbol)
+            self.unsaved.update(batch)
+            self.dirty.difference_update(batch)
+            if not self.in_memory:
+                self.save()
+        self.dirty = set()
+        return len(symbols)
+
+    def rebuild(self):
+        self.dirty = set(self.symbols)
+        return self.refresh()
+
+    def frame(self, latest_only=False):
+        if not self.rolled:
+            return pd.DataFrame(columns=['symbol', 'date', 'period'])
+        ttm = pd.concat([self.get_rollup(s) for s in sorted(self.rolled)], ignore_index=True)
+        # Rollups read back from disk carry their dates as text
+        for column in ('date', 'balanceSheetDate'):
+            if column in ttm.columns:
+                ttm[column] = pd.to_datetime(ttm[column])
+        if latest_only:
+            ttm = ttm.groupby('symbol', sort=False).tail(1).reset_index(drop=True)
+        return ttm
+
+    def _quarter_frame(self, quarters):
+        front = [c for c in QUARTER_COLUMNS if c in quarters.columns]
+        return quarters[front + [c for c in quarters.columns if c not in front]]
+
+    def save(self):
+        """
+        Write the partitions of companies changed since the last save
+        """
+        if not self.unsaved and not self.removed:
+            return 0
+        os.makedirs(self.quarter_dir, exist_ok=True)
+        os.makedirs(self.ttm_dir, exist_ok=True)
+        for symbol in self.unsaved:
+            if symbol in self.quarters:
+                self._quarter_frame(self.quarters[symbol]).to_csv(
+                    self._path(self.quarter_dir, symbol), index=False)
+            rollup_path = self._path(self.ttm_dir, symbol)
+            if symbol in self.rollups and symbol not in self.dirty:
+                self.rollups[symbol].to_csv(rollup_path, index=False, date_format='%Y-%m-%d')
+            elif os.path.exists(rollup_path):
+                # Stale until the next refresh; load() will mark it dirty
+                os.remove(rollup_path)
+        for symbol in self.removed:
+            for directory in (self.quarter_dir, self.ttm_dir):
+                path = self._path(directory, symbol)
+                if os.path.exists(path):
+                    os.remove(path)
+        written = len(self.unsaved)
+        if not self.in_memory:
+            # Everything written is read back from disk when needed
+            for symbol in self.unsaved:
+                self.quarters.pop(symbol, None)
+                self.rollups.pop(symbol, None)
+        self.unsaved = {s for s in self.unsaved if s in self.dirty}
+        self.removed = set()
+        return written
+
+    def export(self):
+        """
+        Write every company's quarters and rollups as the two combined files
+        """
+        self.save()
+        if not self.symbols:
+            return
+        if self.in_memory:
+            quarters = pd.concat([self.quarters[s] for s in sorted(self.quarters)], ignore_index=True)
+            self._quarter_frame(quarters).to_csv(self.quarter_file, index=False)
+            self.frame().to_csv(self.ttm_file, index=False, date_format='%Y-%m-%d')
+            return
+        concat_runs([self._path(self.quarter_dir, s) for s in sorted(self.symbols)], self.quarter_file)
+        if self.rolled:
+            concat_runs([self._path(self.ttm_dir, s) for s in sorted(self.rolled)], self.ttm_file)
+        else:
+            self.frame().to_csv(self.ttm_file, index=False)
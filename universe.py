@@ -0,0 +1,163 @@
+import csv
+import json
+import os
+import re
+
+UNIVERSE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'universes')
+
+# name -> (data file, exchange suffix). CSV files are the lists published by
+# NSE (EQUITY_L.csv, ind_nifty500list.csv); drop them into universes/ to use them.
+UNIVERSES = {
+    'nifty50': ('nifty50.txt', '.NS'),
+    'nifty500': ('ind_nifty500list.csv', '.NS'),
+    'equity_list': ('EQUITY_L.csv', '.NS'),
+    'all': ('nse_all.txt', '.NS'),
+    'bse': ('bse_codes.txt', '.BO'),
+}
+
+# NSE symbols are upper-case letters, digits, '&' and '-' with at least one
+# letter (so bare BSE scrip codes are rejected); BSE codes are six digits
+SYMBOL_PATTERNS = {
+    '.NS': re.compile(r'^(?=.*[A-Z])[A-Z0-9&-]{1,20}$'),
+    '.BO': re.compile(r'^\d{6}$'),
+}
+
+# Main-board series in the NSE equity list; SME series (SM, ST) are excluded
+MAIN_BOARD_SERIES = {'EQ', 'BE', 'BZ'}
+
+
+def _read_text(path):
+    with open(path, encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.startswith('#')]
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8-sig') as f:
+        reader = csv.DictReader(f)
+        # NSE files are inconsistent about case and padding in the header
+        columns = {c.strip().upper(): c for c in reader.fieldnames or []}
+        if 'SYMBOL' not in columns:
+            raise ValueError(f"{path} has no SYMBOL column")
+        symbol_col = columns['SYMBOL']
+        series_col = columns.get('SERIES')
+
+        symbols = []
+        for row in reader:
+            if series_col and row[series_col].strip() not in MAIN_BOARD_SERIES:
+                continue
+            symbols.append(row[symbol_col])
+        return symbols
+
+
+class UniverseRegistry:
+    """
+    Named symbol universes loaded from data files, validated, deduplicated
+    and cached both in memory and on disk between runs
+    """
+    def __init__(self, data_dir=UNIVERSE_DIR, cache_dir=".universe_cache"):
+        self.data_dir = data_dir
+        self.cache_dir = cache_dir
+        self._loaded = {}
+
+    def names(self):
+        return list(UNIVERSES)
+
+    def path(self, name):
+        if name not in UNIVERSES:
+            raise ValueError(f"Unknown universe '{name}', expected one of {self.names()}")
+        return os.path.join(self.data_dir, UNIVERSES[name][0])
+
+    def _cache_file(self, name):
+        return os.path.join(self.cache_dir, f"{name}.json")
+
+    def _read_cache(self, name, stamp):
+        try:
+            with open(self._cache_file(name), encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached.get('stamp') == stamp:
+                return tuple(cached['symbols'])
+        except (OSError, ValueError, KeyError):
+            pass
+        return None
+
+    def _write_cache(self, name, stamp, symbols):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(self._cache_file(name), 'w', encoding='utf-8') as f:
+                json.dump({'stamp': stamp, 'symbols': list(symbols)}, f)
+        except OSError as e:
+            print(f"Could not cache universe '{name}': {e}")
+
+    def parse(self, path, suffix='.NS'):
+        """
+        Read a universe file and return an ordered, deduplicated tuple of
+        fully qualified symbols. Invalid entries are dropped with a warning.
+        """
+        raw = _read_csv(path) if path.lower().endswith('.csv') else _read_text(path)
+        pattern = SYMBOL_PATTERNS[suffix]
+
+        symbols = {}
+        invalid = []
+        for entry in raw:
+            code = entry.strip().upper()
+            if code.endswith(suffix):
+                code = code[:-len(suffix)]
+            if pattern.match(code):
+                symbols.setdefault(code + suffix, None)
+            else:
+                invalid.append(entry)
+
+        if invalid:
+            print(f"Skipped {len(invalid)} invalid symbols in {os.path.basename(path)}: "
+                  f"{', '.join(invalid[:5])}{' ...' if len(invalid) > 5 else ''}")
+        # dict keys keep first-seen order, so this is an ordered set
+        return tuple(symbols)
+
+    def load(self, name='all'):
+        """
+        Symbols of a named universe, as an ordered tuple
+        """
+        if name in self._loaded:
+            return self._loaded[name]
+
+        path = self.path(name)
+        if not os.path.exists(path):
+            raise FileNotFoundError(
+                f"Universe '{name}' needs {path}; download it from nseindia.com")
+
+        info = os.stat(path)
+        stamp = [os.path.abspath(path), info.st_mtime_ns, info.st_size]
+        symbols = self._read_cache(name, stamp)
+        if symbols is None:
+            symbols = self.parse(path, UNIVERSES[name][1])
+            self._write_cache(name, stamp, symbols)
+
+        self._loaded[name] = symbols
+        return symbols
+
+    def version(self, name):
+        """
+        Version string from a text universe's '# version:' header, if any
+        """
+        path = self.path(name)
+        if path.endswith('.txt') and os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                for line in f:
+                    if not line.startswith('#'):
+                        break
+                    if line[1:].strip().lower().startswith('version:'):
+                        return line.split(':', 1)[1].strip()
+        return None
+
+
+_default_registry = None
+
+
+def load_universe(name='all'):
+    """
+    Load a universe through a process-wide registry
+    """
+    global _default_registry
+    if _default_registry is None:
+        _default_registry = UniverseRegistry()
+    return _default_registry.load(name)
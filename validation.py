@@ -0,0 +1,260 @@
+import pandas as pd
+import numpy as np
+import os
+
+from external_merge import concat_runs
+
+# Rule sets, evaluated over whole batches of companies at once:
+#   sum    target == signed sum of terms ('-field' subtracts)
+#   ratio  target == numerator / denominator
+#   jump   year-over-year change beyond `factor`x either way, or a
+#          material value dropping to exactly zero
+# A row is only checked when every input of the rule is present.
+RULES = [
+    {'name': 'balance_sheet_identity', 'kind': 'sum', 'severity': 'error',
+     'target': 'totalAssets', 'terms': ['totalLiabilities', 'totalEquity']},
+    {'name': 'liabilities_and_equity', 'kind': 'sum', 'severity': 'error',
+     'target': 'totalAssets', 'terms': ['totalLiabilitiesAndTotalEquity']},
+    {'name': 'asset_split', 'kind': 'sum', 'severity': 'error',
+     'target': 'totalAssets', 'terms': ['totalCurrentAssets', 'totalNonCurrentAssets']},
+    {'name': 'gross_profit', 'kind': 'sum', 'severity': 'error',
+     'target': 'grossProfit', 'terms': ['revenue', '-costOfRevenue']},
+    {'name': 'gross_profit_ratio', 'kind': 'ratio', 'severity': 'error',
+     'target': 'grossProfitRatio', 'numerator': 'grossProfit', 'denominator': 'revenue'},
+    {'name': 'ebitda_ratio', 'kind': 'ratio', 'severity': 'error',
+     'target': 'ebitdaratio', 'numerator': 'ebitda', 'denominator': 'revenue'},
+    {'name': 'operating_income_ratio', 'kind': 'ratio', 'severity': 'error',
+     'target': 'operatingIncomeRatio', 'numerator': 'operatingIncome', 'denominator': 'revenue'},
+    {'name': 'income_before_tax_ratio', 'kind': 'ratio', 'severity': 'error',
+     'target': 'incomeBeforeTaxRatio', 'numerator': 'incomeBeforeTax', 'denominator': 'revenue'},
+    {'name': 'net_income_ratio', 'kind': 'ratio', 'severity': 'error',
+     'target': 'netIncomeRatio', 'numerator': 'netIncome', 'denominator': 'revenue'},
+    {'name': 'yoy_jump', 'kind': 'jump', 'severity': 'warning', 'factor': 10.0, 'min_abs': 1e7},
+]
+
+# Relative tolerance for sums and ratios; absolute floors absorb rounding
+REL_TOLERANCE = 0.01
+ABS_TOLERANCE = {'sum': 1.0, 'ratio': 1e-4}
+
+# Columns never checked for jumps
+NON_METRIC_COLUMNS = {'symbol', 'date', 'reportedCurrency', 'cik', 'fillingDate', 'acceptedDate',
+                      'calendarYear', 'period'}
+
+# For jumps, `expected` holds the previous year's value
+FLAG_COLUMNS = ['symbol', 'date', 'rule', 'severity', 'field', 'value', 'expected']
+
+
+def _numeric(df, column):
+    if column not in df.columns:
+        return pd.Series(np.nan, index=df.index)
+    return pd.to_numeric(df[column], errors='coerce')
+
+
+def _mismatch(actual, expected, kind):
+    tolerance = np.maximum(ABS_TOLERANCE[kind],
+                           REL_TOLERANCE * np.maximum(np.abs(actual), np.abs(expected)))
+    return np.abs(actual - expected) > tolerance
+
+
+def _flags(df, rows, rule, field, value, expected):
+    return pd.DataFrame({
+        'symbol': df['symbol'].to_numpy()[rows],
+        'date': df['date'].to_numpy()[rows],
+        'rule': rule['name'],
+        'severity': rule['severity'],
+        'field': field,
+        'value': value,
+        'expected': expected,
+    })
+
+
+def validate(df, rules=RULES):
+    """
+    Check every rule against every row; returns one flag per failing cell.
+
+    df is in master-store layout: one row per (symbol, fiscal year), sorted
+    by (symbol, date). Each rule is a handful of column operations, so the
+    cost is the same whether df holds one company or the whole universe.
+    """
+    parts = []
+    for rule in rules:
+        kind = rule['kind']
+        if kind == 'sum':
+            actual = _numeric(df, rule['target']).to_numpy(dtype=np.float64)
+            expected = np.zeros(len(df))
+            for term in rule['terms']:
+                sign = -1.0 if term.startswith('-') else 1.0
+                expected = expected + sign * _numeric(df, term.lstrip('-')).to_numpy(dtype=np.float64)
+            with np.errstate(invalid='ignore'):
+                bad = np.flatnonzero(_mismatch(actual, expected, kind))
+            if len(bad):
+                parts.append(_flags(df, bad, rule, rule['target'], actual[bad], expected[bad]))
+
+        elif kind == 'ratio':
+            actual = _numeric(df, rule['target']).to_numpy(dtype=np.float64)
+            numerator = _numeric(df, rule['numerator']).to_numpy(dtype=np.float64)
+            denominator = _numeric(df, rule['denominator']).to_numpy(dtype=np.float64)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                expected = np.where(denominator != 0, numerator / denominator, np.nan)
+                bad = np.flatnonzero(_mismatch(actual, expected, kind))
+            if len(bad):
+                parts.append(_flags(df, bad, rule, rule['target'], actual[bad], expected[bad]))
+
+        elif kind == 'jump':
+            columns = rule.get('fields') or [
+                c for c in df.columns
+                if c not in NON_METRIC_COLUMNS and not c.lower().endswith('ratio')
+                and not c.startswith(('eps', 'weightedAverage'))]
+            values = df[columns].apply(pd.to_numeric, errors='coerce')
+            previous = values.groupby(df['symbol'].to_numpy(), sort=False).shift(1).to_numpy(dtype=np.float64)
+            current = values.to_numpy(dtype=np.float64)
+            factor, min_abs = rule['factor'], rule['min_abs']
+            with np.errstate(divide='ignore', invalid='ignore'):
+                change = np.abs(current / previous)
+                material = np.maximum(np.abs(current), np.abs(previous)) >= min_abs
+                dropped = (current == 0) & (np.abs(previous) >= min_abs)
+                jumped = (previous != 0) & (current != 0) & ((change > factor) | (change < 1 / factor))
+                rows, cols = np.nonzero(dropped | (jumped & material))
+            if len(rows):
+                parts.append(_flags(df, rows, rule, np.asarray(columns, dtype=object)[cols],
+                                    current[rows, cols], previous[rows, cols]))
+        else:
+            raise ValueError(f"Unknown rule kind '{kind}' for {rule['name']}")
+
+    if not parts:
+        return pd.DataFrame(columns=FLAG_COLUMNS)
+    flags = pd.concat(parts, ignore_index=True)
+    flags['rule'] = flags['rule'].astype('category')
+    flags['severity'] = flags['severity'].astype('category')
+    return flags
+
+
+class QualityFlags:
+    """
+    Latest validation flags per company.
+
+    record() validates a batch and replaces the flags of the companies in
+    it, so a refetch that fixes a problem clears its flags. Flags are kept
+    per symbol and saved as one small CSV per flagged company, so a
+    checkpoint only rewrites the companies validated since the last one;
+    export() writes the combined file. With in_memory=False saved flags
+    are dropped from memory and export() streams the per-symbol files.
+    """
+    def __init__(self, flag_file="NSE_DATA_QUALITY_FLAGS.csv", rules=RULES, in_memory=True):
+        self.flag_file = flag_file
+        self.flag_dir = os.path.splitext(flag_file)[0]
+        self.rules = rules
+        self.in_memory = in_memory
+        # Every flagged company in memory mode; only unsaved ones out of core
+        self.by_symbol = {}
+        self.symbols = set()
+        self.unsaved = set()
+        self._flags = None
+
+    def _path(self, symbol):
+        return os.path.join(self.flag_dir, f"{symbol}.csv")
+
+    def _read(self, path):
+        return pd.read_csv(path, dtype={'rule': 'category', 'severity': 'category'})
+
+    def get(self, symbol):
+        if symbol in self.by_symbol:
+            return self.by_symbol[symbol]
+        if symbol in self.symbols:
+            return self._read(self._path(symbol))
+        return None
+
+    def load(self):
+        self.by_symbol = {}
+        self.symbols = set()
+        self.unsaved = set()
+        if os.path.isdir(self.flag_dir):
+            for name in os.listdir(self.flag_dir):
+                if name.endswith('.csv'):
+                    symbol = name[:-len('.csv')]
+                    self.symbols.add(symbol)
+                    if self.in_memory:
+                        self.by_symbol[symbol] = self._read(os.path.join(self.flag_dir, name))
+        elif os.path.exists(self.flag_file):
+            # Combined file from before partitioning; the next save splits it up
+            for symbol, rows in self._read(self.flag_file).groupby('symbol', sort=False):
+                self.by_symbol[symbol] = rows.reset_index(drop=True)
+            self.symbols = set(self.by_symbol)
+            self.unsaved = set(self.by_symbol)
+        self._flags = None
+
+    @property
+    def flags(self):
+        if self._flags is None:
+            frames = [self.get(s) for s in sorted(self.symbols)]
+            if frames:
+                flags = pd.concat(frames, ignore_index=True)
+                # Flags read back from disk carry their dates as text
+                flags['date'] = pd.to_datetime(flags['date'])
+                flags['rule'] = flags['rule'].astype('category')
+                flags['severity'] = flags['severity'].astype('category')
+            else:
+                flags = pd.DataFrame(columns=FLAG_COLUMNS)
+            self._flags = flags
+        return self._flags
+
+    def record(self, df):
+        """
+        Validate a batch of companies; returns the new flags
+        """
+        if df is None or df.empty:
+            return pd.DataFrame(columns=FLAG_COLUMNS)
+        found = validate(df, self.rules)
+        symbols = set(df['symbol'].unique())
+        for symbol in symbols:
+            self.by_symbol.pop(symbol, None)
+        self.symbols -= symbols
+        for symbol, rows in found.groupby('symbol', sort=False, observed=True):
+            self.by_symbol[symbol] = rows.reset_index(drop=True)
+            self.symbols.add(symbol)
+        self.unsaved.update(symbols)
+        self._flags = None
+        return found
+
+    def drop(self, symbol):
+        if symbol in self.symbols:
+            self.by_symbol.pop(symbol, None)
+            self.symbols.discard(symbol)
+            self.unsaved.add(symbol)
+            self._flags = None
+
+    def summary(self):
+        """
+        Flag counts per rule, most frequent first
+        """
+        return self.flags.groupby(['severity', 'rule'], observed=True).size().sort_values(ascending=False)
+
+    def save(self):
+        """
+        Write the flags of companies validated since the last save; companies
+        without flags have no file
+        """
+        if not self.unsaved:
+            return 0
+        os.makedirs(self.flag_dir, exist_ok=True)
+        for symbol in self.unsaved:
+            path = self._path(symbol)
+            if symbol in self.by_symbol:
+                self.by_symbol[symbol].to_csv(path, index=False, date_format='%Y-%m-%d')
+                if not self.in_memory:
+                    del self.by_symbol[symbol]
+            elif os.path.exists(path):
+                os.remove(path)
+        written = len(self.unsaved)
+        self.unsaved = set()
+        return written
+
+    def export(self):
+        """
+        Save, then write every company's flags as the combined CSV
+        """
+        self.save()
+        if self.in_memory or not self.symbols:
+            self.flags.to_csv(self.flag_file, index=False, date_format='%Y-%m-%d')
+        else:
+            concat_runs([self._path(s) for s in sorted(self.symbols)], self.flag_file)